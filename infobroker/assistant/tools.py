@@ -26,7 +26,14 @@ from infobroker.services.process_control import (
     mcp_stop,
     ollama_control,
 )
-from infobroker.strategies import list_strategies, run_backtest, run_strategy_backtest, scan_watchlist
+from infobroker.strategies import (
+    list_strategies,
+    run_backtest,
+    run_portfolio_backtest,
+    run_strategy_backtest,
+    run_sweep,
+    scan_watchlist,
+)
 from infobroker.watchlist import add_symbol, get_watchlist, list_symbols, remove_symbol, validate_symbol
 
 KEY_LINKS = {
@@ -174,13 +181,14 @@ def tool_get_highlights() -> dict[str, Any]:
         "volume_leaders": snap.get("volume_leaders"),
         "universe_quoted": snap.get("universe_quoted"),
         "us_open": snap.get("us_open"),
-        "note": "Lightweight cache. Call get_market_deep only if you truly need Yahoo refresh.",
+        "note": "Lightweight cache. Call get_market_deep only if you truly need Yahoo highlights.",
     }
 
 
 def tool_get_market_deep() -> dict[str, Any]:
-    """Expensive highlights refresh — use rarely."""
-    return get_market_highlights()
+    """Yahoo highlights from the shared SWR cache, with `stale` / `age_sec`."""
+    res = get_market_highlights.fetch()
+    return {**res.value, **res.meta()}
 
 
 def tool_get_tracked() -> dict[str, Any]:
@@ -589,6 +597,59 @@ def tool_backtest(symbol: str, start: str, end: str, strategy: str = "sma_crosso
     return run_strategy_backtest(strategy, validate_symbol(symbol), start, end)
 
 
+def tool_strategy_sweep(
+    strategy: str,
+    start: str,
+    end: str,
+    symbols: Any = None,
+    symbol: Any = None,
+    search: str = "grid",
+    samples: int = 200,
+    rank_by: str = "total_return_pct",
+    top: int = 10,
+) -> dict[str, Any]:
+    """Rank parameter sets for one strategy over one or more symbols (defaults to the watchlist)."""
+    syms = [validate_symbol(s) for s in _parse_symbols_arg(symbols, symbol)] or list_symbols()
+    out = run_sweep(
+        strategy,
+        syms,
+        start,
+        end,
+        search=search,
+        samples=max(1, min(int(samples), 2000)),
+        rank_by=rank_by,
+        top=max(1, min(int(top), 25)),
+    )
+    # Keep the agent context small: per-symbol rows only when sweeping one symbol
+    if out.get("by_params"):
+        out.pop("top", None)
+    return out
+
+
+def tool_portfolio_backtest(
+    start: str,
+    end: str,
+    strategy: str = "sma_crossover",
+    symbols: Any = None,
+    basket: str = "watchlist",
+    weighting: str = "equal",
+    limit: int = 30,
+) -> dict[str, Any]:
+    """Backtest one strategy across a basket with shared capital."""
+    syms = [validate_symbol(s) for s in _parse_symbols_arg(symbols, None)]
+    out = run_portfolio_backtest(
+        strategy,
+        start,
+        end,
+        symbols=syms or None,
+        basket=basket,
+        limit=limit,
+        weighting=weighting,
+    )
+    out["attribution"] = out["attribution"][:10]
+    return out
+
+
 def tool_list_strategies() -> dict[str, Any]:
     return {"strategies": list_strategies(), "engine": "yfinance (free)"}
 
@@ -802,7 +863,7 @@ TOOLS: dict[str, ToolSpec] = {
     ),
     "get_market_deep": ToolSpec(
         "get_market_deep",
-        "Expensive Yahoo highlights refresh — use only when cache looks empty.",
+        "Yahoo market highlights (cached; check stale/age_sec) — use only when the lightweight cache looks empty.",
         {"type": "object", "properties": {}},
         tool_get_market_deep,
     ),
@@ -957,6 +1018,45 @@ TOOLS: dict[str, ToolSpec] = {
         },
         tool_backtest,
     ),
+    "strategy_sweep": ToolSpec(
+        "strategy_sweep",
+        "Parameter sweep for a catalog strategy (see list_strategies params) over symbols; ranked by "
+        "return, vs_buy_hold_pct, max_drawdown_pct or return_over_drawdown. search: grid|random|refine",
+        {
+            "type": "object",
+            "properties": {
+                "strategy": {"type": "string"},
+                "symbols": {"type": "string", "description": "Comma-separated; default watchlist"},
+                "start": {"type": "string"},
+                "end": {"type": "string"},
+                "search": {"type": "string", "default": "grid"},
+                "samples": {"type": "integer", "default": 200},
+                "rank_by": {"type": "string", "default": "total_return_pct"},
+                "top": {"type": "integer", "default": 10},
+            },
+            "required": ["strategy", "start", "end"],
+        },
+        tool_strategy_sweep,
+    ),
+    "portfolio_backtest": ToolSpec(
+        "portfolio_backtest",
+        "Backtest a strategy across a basket (symbols, or basket=watchlist|liquid|board:<focus>) "
+        "with equal or ATR (volatility) weighting; returns combined equity, attribution, turnover.",
+        {
+            "type": "object",
+            "properties": {
+                "strategy": {"type": "string", "default": "sma_crossover"},
+                "start": {"type": "string"},
+                "end": {"type": "string"},
+                "symbols": {"type": "string", "description": "Comma-separated; overrides basket"},
+                "basket": {"type": "string", "default": "watchlist"},
+                "weighting": {"type": "string", "default": "equal"},
+                "limit": {"type": "integer", "default": 30},
+            },
+            "required": ["start", "end"],
+        },
+        tool_portfolio_backtest,
+    ),
     "list_strategies": ToolSpec(
         "list_strategies",
         "List free base strategies available for backtesting.",
@@ -1126,6 +1226,12 @@ def normalize_tool_args(name: str, args: Optional[dict[str, Any]] = None, raw: O
         "limit",
         "symbols",
         "refresh_missing",
+        "search",
+        "samples",
+        "rank_by",
+        "top",
+        "basket",
+        "weighting",
     ):
         if k in raw and k not in out:
             out[k] = raw[k]
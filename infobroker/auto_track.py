@@ -30,6 +30,7 @@ _DEFAULT: dict[str, Any] = {
 _lock = threading.RLock()
 _worker: Optional[threading.Thread] = None
 _stop = threading.Event()
+_worker_lock = threading.Lock()
 _status: dict[str, Any] = {
     "running": False,
     "last_cycle_at": None,
@@ -197,10 +198,25 @@ def scan_and_track(force: bool = False) -> dict[str, Any]:
         }
 
 
+def _stopped(wait: int) -> bool:
+    """Sleep up to `wait` seconds; True once this thread should exit (see start_auto_track_worker)."""
+    global _worker
+    # wake periodically; shorter sleep chunks so stop is responsive
+    for _ in range(max(1, wait // 5)):
+        if _stop.wait(5):
+            break
+    with _worker_lock:
+        if not _stop.is_set():
+            return False
+        if _worker is threading.current_thread():
+            _worker = None
+        return True
+
+
 def _worker_loop() -> None:
     _status["running"] = True
     try:
-        while not _stop.is_set():
+        while True:
             cfg = _load()
             wait = int(cfg.get("poll_sec") or 60)
             if cfg.get("enabled"):
@@ -211,21 +227,22 @@ def _worker_loop() -> None:
                         c = _load()
                         c["last_error"] = str(exc)[:200]
                         _save(c)
-            # wake periodically; shorter sleep chunks so stop is responsive
-            for _ in range(max(1, wait // 5)):
-                if _stop.wait(5):
-                    break
+            if _stopped(wait):
+                break
     finally:
         _status["running"] = False
 
 
 def start_auto_track_worker() -> None:
+    """Start the worker (idempotent). Restarting while a stopped thread is still
+    mid-scan clears the stop, so that thread keeps running instead of exiting."""
     global _worker
-    if _worker and _worker.is_alive():
-        return
-    _stop.clear()
-    _worker = threading.Thread(target=_worker_loop, name="auto-track-gainers", daemon=True)
-    _worker.start()
+    with _worker_lock:
+        _stop.clear()
+        if _worker and _worker.is_alive():
+            return
+        _worker = threading.Thread(target=_worker_loop, name="auto-track-gainers", daemon=True)
+        _worker.start()
 
 
 def stop_auto_track_worker() -> None:
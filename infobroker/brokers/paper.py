@@ -36,6 +36,22 @@ PAPER_PROFILE = BrokerProfile(
 )
 
 
+def ledger_symbols(ledger_path: Path) -> set[str]:
+    """Symbols with an open position for any user in the ledger (no quote calls)."""
+    if not ledger_path.exists():
+        return set()
+    try:
+        data = json.loads(ledger_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return set()
+    out: set[str] = set()
+    for state in data.values():
+        for symbol, pos in ((state or {}).get("positions") or {}).items():
+            if float(pos.get("qty") or 0) != 0:
+                out.add(symbol.upper())
+    return out
+
+
 class PaperBroker(BrokerAdapter):
     profile = PAPER_PROFILE
 
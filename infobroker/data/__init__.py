@@ -1,5 +1,6 @@
 from infobroker.data.market import (
     fetch_ohlcv,
+    fetch_ohlcv_many,
     get_fundamentals,
     get_historical_data,
     get_last_price,
@@ -12,10 +13,11 @@ from infobroker.data.indicators import (
     sma,
 )
 from infobroker.data.providers import build_market_data, get_provider
-from infobroker.data.yf_pipeline import analyze_symbol, download_history, download_quote
+from infobroker.data.yf_pipeline import analyze_symbol, download_history, download_history_batch, download_quote
 
 __all__ = [
     "fetch_ohlcv",
+    "fetch_ohlcv_many",
     "get_fundamentals",
     "get_historical_data",
     "get_last_price",
@@ -28,5 +30,6 @@ __all__ = [
     "get_provider",
     "analyze_symbol",
     "download_history",
+    "download_history_batch",
     "download_quote",
 ]
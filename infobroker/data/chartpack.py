@@ -3,57 +3,78 @@
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any
+from typing import Any, Optional
 
 import pandas as pd
 
-from infobroker.data.indicators import calculate_macd, enrich_ohlcv, latest_snapshot
-from infobroker.data.yf_pipeline import download_history
+from infobroker.data.indicators import SNAPSHOT_PLAN
+from infobroker.data.result_cache import cached_result
+from infobroker.data.serialize import check_shape, shaped
+from infobroker.data.yf_pipeline import download_history, download_history_batch
 
 
-def build_chart_pack(symbol: str, start: str, end: str) -> dict[str, Any]:
-    """OHLC + SMA/RSI/MACD/ATR/Bollinger via the required analysis stack."""
-    df = enrich_ohlcv(download_history(symbol, start=start, end=end))
-    bars = []
-    for ts, row in df.iterrows():
-        bars.append(
-            {
-                "t": ts.isoformat() if hasattr(ts, "isoformat") else str(ts),
-                "o": float(row["Open"]),
-                "h": float(row["High"]),
-                "l": float(row["Low"]),
-                "c": float(row["Close"]),
-                "v": float(row["Volume"]),
-                "sma20": _f(row["SMA_20"] if "SMA_20" in df.columns else None),
-                "sma50": _f(row["SMA_50"] if "SMA_50" in df.columns else None),
-                "sma200": _f(row["SMA_200"] if "SMA_200" in df.columns else None),
-                "rsi": _f(row["RSI_14"] if "RSI_14" in df.columns else None),
-                "macd": _f(row["MACD"] if "MACD" in df.columns else None),
-                "macd_signal": _f(row["MACD_signal"] if "MACD_signal" in df.columns else None),
-                "macd_hist": _f(row["MACD_hist"] if "MACD_hist" in df.columns else None),
-                "atr": _f(row["ATR_14"] if "ATR_14" in df.columns else None),
-                "bb_upper": _f(row["BB_upper"] if "BB_upper" in df.columns else None),
-                "bb_lower": _f(row["BB_lower"] if "BB_lower" in df.columns else None),
-            }
-        )
-    if not bars:
+def build_chart_pack(
+    symbol: str,
+    start: str,
+    end: str,
+    history: Optional[pd.DataFrame] = None,
+    cache: bool = True,
+    shape: str = "rows",
+    max_points: Optional[int] = None,
+) -> dict[str, Any]:
+    """OHLC + SMA/RSI/MACD/ATR/Bollinger via the required analysis stack.
+
+    `shape="columns"` returns `bars` as {"t": [...], "o": [...], ...};
+    `max_points` merges long ranges into at most that many OHLC buckets
+    (the summary still covers every bar). Without `history`, packs are served
+    from the result cache while the symbol's bars are unchanged (`cache_hit`).
+    """
+    shape = check_shape(shape)
+    max_points = int(max_points) if max_points else None
+
+    def build(df: pd.DataFrame) -> dict[str, Any]:
+        return _chart_pack(symbol, start, end, df, shape, max_points)
+
+    if history is not None:
+        return build(history)
+    if not cache:
+        return build(download_history(symbol, start=start, end=end))
+    return cached_result(
+        "chart_pack",
+        symbol,
+        start,
+        end,
+        lambda: build(download_history(symbol, start=start, end=end)),
+        shape=shape,
+        max_points=max_points,
+    )
+
+
+def _chart_pack(
+    symbol: str, start: str, end: str, history: pd.DataFrame, shape: str = "rows", max_points: Optional[int] = None
+) -> dict[str, Any]:
+    if history is None or history.empty:
         raise ValueError(f"No data for {symbol} between {start} and {end}")
-    last = bars[-1]
-    snap = latest_snapshot(df)
+    enriched = SNAPSHOT_PLAN.run(history)
+    cols = enriched.bar_columns(max_points=max_points)
+    close = enriched.ohlcv["Close"]
+    snap = enriched.snapshot()
     return {
         "symbol": symbol.upper(),
         "start": start,
         "end": end,
-        "bars": bars,
+        "shape": shape,
+        "points": len(cols["t"]),
+        "bars": shaped(cols, shape),
         "summary": {
-            "last": last["c"],
-            "high": max(b["h"] for b in bars),
-            "low": min(b["l"] for b in bars),
-            "rsi": last.get("rsi") or snap.get("rsi_14"),
-            "macd": calculate_macd(df["Close"]),
-            "atr": last.get("atr"),
-            "change_pct": round((last["c"] / bars[0]["c"] - 1) * 100, 2) if bars[0]["c"] else None,
-            "bars": len(bars),
+            "last": float(close[-1]),
+            "high": float(enriched.ohlcv["High"].max()),
+            "low": float(enriched.ohlcv["Low"].min()),
+            "rsi": enriched.last("RSI_14") or snap.get("rsi_14"),
+            "macd": enriched.macd(),
+            "atr": enriched.last("ATR_14"),
+            "change_pct": round(float(close[-1] / close[0] - 1) * 100, 2) if close[0] else None,
+            "bars": len(enriched),
             "data_source": "yfinance + pandas + TA-Lib",
             "stack": ["yfinance", "pandas", "TA-Lib"],
         },
@@ -62,24 +83,19 @@ def build_chart_pack(symbol: str, start: str, end: str) -> dict[str, Any]:
     }
 
 
-def _f(v: Any) -> float | None:
-    try:
-        if v is None or (isinstance(v, float) and pd.isna(v)):
-            return None
-        return round(float(v), 4)
-    except Exception:
-        return None
-
-
 def build_chart_pack_async_batch(
     symbols: list[str], start: str, end: str, max_workers: int = 6
 ) -> dict[str, Any]:
-    """Fetch several tickers' packs in parallel."""
+    """Fetch several tickers' packs: one batched history download, packs built in parallel."""
     out: dict[str, Any] = {}
     errors: dict[str, str] = {}
+    try:
+        frames = download_history_batch([s for s in symbols if s], start=start, end=end)
+    except Exception:  # noqa: BLE001
+        frames = {}
 
     def _one(sym: str):
-        return sym, build_chart_pack(sym, start, end)
+        return sym, build_chart_pack(sym, start, end, history=frames.get(sym))
 
     with ThreadPoolExecutor(max_workers=max_workers) as pool:
         futs = [pool.submit(_one, s.upper()) for s in symbols if s]
@@ -0,0 +1,126 @@
+"""Bounded chart payloads: LTTB for lines, OHLC buckets for candles.
+
+`lttb_indices` picks the points of a line that preserve its visual shape
+(Largest-Triangle-Three-Buckets); equity curves additionally keep the global
+high, low and the deepest drawdown's peak and trough. `bucket_starts` +
+`aggregate_ohlc` merge consecutive candles into at most `max_points` buckets
+(open of the first, max high, min low, close of the last, summed volume), so
+wicks survive however far the range is zoomed out. `max_points` is typically
+the chart's width in pixels.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+MIN_POINTS = 3
+
+
+def bucket_starts(n: int, max_points: int) -> np.ndarray:
+    """First index of each of ≤ `max_points` near-equal consecutive buckets over n bars."""
+    k = max(1, min(int(max_points), n))
+    return np.unique(np.floor(np.arange(k) * (n / k)).astype(np.int64))
+
+
+def aggregate_ohlc(
+    starts: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: Optional[np.ndarray] = None,
+) -> dict[str, np.ndarray]:
+    """Candles merged per bucket; `last` is each bucket's final bar (for overlays / timestamps)."""
+    n = close.size
+    last = np.append(starts[1:], n) - 1
+    out = {
+        "first": starts,
+        "last": last,
+        "o": open_[starts],
+        "h": np.fmax.reduceat(high, starts),
+        "l": np.fmin.reduceat(low, starts),
+        "c": close[last],
+    }
+    if volume is not None:
+        out["v"] = np.add.reduceat(np.nan_to_num(volume), starts)
+    return out
+
+
+def lttb_indices(y: Sequence[float], max_points: int, x: Optional[Sequence[float]] = None) -> np.ndarray:
+    """Indices of the Largest-Triangle-Three-Buckets selection (first and last always kept)."""
+    yv = np.asarray(y, dtype=np.float64)
+    n = yv.size
+    if max_points >= n or n <= MIN_POINTS:
+        return np.arange(n)
+    max_points = max(MIN_POINTS, int(max_points))
+    xv = np.arange(n, dtype=np.float64) if x is None else np.asarray(x, dtype=np.float64)
+    yv = np.where(np.isnan(yv), np.nanmean(yv) if np.isfinite(yv).any() else 0.0, yv)
+    every = (n - 2) / (max_points - 2)
+    edges = np.floor(np.arange(max_points - 1) * every).astype(np.int64) + 1
+    edges[-1] = n - 1
+    picked = np.empty(max_points, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, (edges[i + 2] if i + 2 < edges.size else n)
+        cx, cy = xv[nlo:nhi].mean(), yv[nlo:nhi].mean()
+        bx, by = xv[lo:hi], yv[lo:hi]
+        area = np.abs((xv[a] - cx) * (by - yv[a]) - (xv[a] - bx) * (cy - yv[a]))
+        a = lo + int(np.argmax(area))
+        picked[i + 1] = a
+    return picked
+
+
+def equity_indices(values: Sequence[float], max_points: int = 80) -> np.ndarray:
+    """LTTB over an equity curve plus its high, low and max-drawdown peak/trough."""
+    v = np.asarray(values, dtype=np.float64)
+    if v.size <= max_points:
+        return np.arange(v.size)
+    keep = [lttb_indices(v, max(MIN_POINTS, max_points - 4))]
+    if v.size:
+        dd = v / np.maximum.accumulate(v) - 1.0
+        trough = int(np.nanargmin(dd))
+        keep.append(np.array([int(np.nanargmax(v)), int(np.nanargmin(v)), trough, int(np.nanargmax(v[: trough + 1]))]))
+    return np.unique(np.concatenate(keep))
+
+
+def equity_points(index: Iterable[Any], values: Sequence[float], max_points: int = 80) -> list[dict[str, Any]]:
+    """[{"t", "v"}] for charting an equity curve in ≤ ~max_points points."""
+    stamps = list(index)
+    v = np.asarray(values, dtype=np.float64)
+    return [
+        {
+            "t": stamps[i].isoformat() if hasattr(stamps[i], "isoformat") else str(stamps[i]),
+            "v": round(float(v[i]), 2),
+        }
+        for i in equity_indices(v, max_points).tolist()
+    ]
+
+
+def downsample_rows(bars: list[dict[str, Any]], max_points: int) -> list[dict[str, Any]]:
+    """OHLC-bucket a list of {t, o, h, l, c, v, ...} bars; other keys come from each bucket's last bar."""
+    n = len(bars)
+    if not max_points or n <= max_points:
+        return bars
+    arrays = {k: np.array([b.get(k) for b in bars], dtype=np.float64) for k in ("o", "h", "l", "c")}
+    volume = np.array([b.get("v") or 0.0 for b in bars], dtype=np.float64)
+    agg = aggregate_ohlc(bucket_starts(n, max_points), arrays["o"], arrays["h"], arrays["l"], arrays["c"], volume)
+    out = []
+    for j, (first, last) in enumerate(zip(agg["first"].tolist(), agg["last"].tolist())):
+        row = {**bars[last], "t": bars[first]["t"]}
+        row.update(o=float(agg["o"][j]), h=float(agg["h"][j]), l=float(agg["l"][j]), c=float(agg["c"][j]), v=float(agg["v"][j]))
+        out.append(row)
+    return out
+
+
+__all__ = [
+    "aggregate_ohlc",
+    "bucket_starts",
+    "downsample_rows",
+    "equity_indices",
+    "equity_points",
+    "lttb_indices",
+]
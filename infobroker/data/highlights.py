@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 import pandas as pd
 import yfinance as yf
 
+from infobroker.data import http_pool
+from infobroker.data.singleflight import flight_key, single_flight_async
+from infobroker.data.swr import swr_cache
 from infobroker.watchlist import list_symbols
 
 # Liquid US names used when scanning "day/week" notables without a paid screener
@@ -59,87 +64,225 @@ def _safe_float(v: Any) -> Optional[float]:
         return None
 
 
+_QUERY_HOSTS = ("https://query1.finance.yahoo.com", "https://query2.finance.yahoo.com")
+_COOKIE_URL = "https://fc.yahoo.com"
+
+
+async def yahoo_chart_async(symbol: str, range_: str, interval: str, timeout: float = 20.0) -> Optional[dict[str, Any]]:
+    """Yahoo chart `result[0]` over the pooled client (query1, then query2).
+
+    Identical in-flight requests are coalesced — the result is shared, read-only.
+    """
+    sym = (symbol or "").strip().upper().replace(".", "-")
+
+    async def _fetch() -> Optional[dict[str, Any]]:
+        yahoo = http_pool.client("yahoo")
+        for host in _QUERY_HOSTS:
+            status, data = await yahoo.get_json(
+                f"{host}/v8/finance/chart/{sym}",
+                params={"range": range_, "interval": interval},
+                timeout=timeout,
+            )
+            if status and status < 400 and data:
+                return ((data.get("chart") or {}).get("result") or [None])[0]
+        return None
+
+    return await single_flight_async(flight_key("yahoo", "chart", sym, range=range_, interval=interval), _fetch)
+
+
+def _chart_frame(result: Optional[dict[str, Any]]) -> Optional[pd.DataFrame]:
+    if not result:
+        return None
+    ts = result.get("timestamp") or []
+    q = ((result.get("indicators") or {}).get("quote") or [{}])[0]
+    rows = []
+    for i, t in enumerate(ts):
+        c = (q.get("close") or [None])[i]
+        if c is None:
+            continue
+        rows.append(
+            {
+                "Date": pd.Timestamp(t, unit="s"),
+                "Open": float((q.get("open") or [c])[i] or c),
+                "High": float((q.get("high") or [c])[i] or c),
+                "Low": float((q.get("low") or [c])[i] or c),
+                "Close": float(c),
+                "Volume": float((q.get("volume") or [0])[i] or 0),
+            }
+        )
+    if not rows:
+        return None
+    return pd.DataFrame(rows).set_index("Date").sort_index()
+
+
 def _history_via_chart(symbol: str, days: int = 15) -> Optional[pd.DataFrame]:
     """Yahoo chart API — avoids crumb/cookie failures from yfinance."""
     try:
-        import requests
-
-        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol.upper()}"
-        resp = requests.get(
-            url,
-            params={"range": f"{max(days, 5)}d", "interval": "1d"},
-            headers={"User-Agent": "Mozilla/5.0 (compatible; Infobroker/0.5)"},
-            timeout=20,
-        )
-        if resp.status_code >= 400:
-            return None
-        result = ((resp.json().get("chart") or {}).get("result") or [None])[0]
-        if not result:
-            return None
-        ts = result.get("timestamp") or []
-        q = ((result.get("indicators") or {}).get("quote") or [{}])[0]
-        rows = []
-        for i, t in enumerate(ts):
-            c = (q.get("close") or [None])[i]
-            if c is None:
-                continue
-            rows.append(
-                {
-                    "Date": pd.Timestamp(t, unit="s"),
-                    "Open": float((q.get("open") or [c])[i] or c),
-                    "High": float((q.get("high") or [c])[i] or c),
-                    "Low": float((q.get("low") or [c])[i] or c),
-                    "Close": float(c),
-                    "Volume": float((q.get("volume") or [0])[i] or 0),
-                }
-            )
-        if not rows:
-            return None
-        return pd.DataFrame(rows).set_index("Date").sort_index()
+        return _chart_frame(http_pool.run(yahoo_chart_async(symbol, f"{max(days, 5)}d", "1d")))
     except Exception:
         return None
 
 
-_yahoo_session: dict[str, Any] = {"cookie": None, "crumb": None, "fetched_at": 0.0}
+_yahoo_session: dict[str, Any] = {"crumb": None, "fetched_at": 0.0}
+_yahoo_auth_locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
 
+# Cumulative bulk-quote HTTP outcomes (the universe scheduler paces off the deltas)
+_bulk_stats_lock = threading.Lock()
+_bulk_stats: dict[str, int] = {"requests": 0, "ok": 0, "rate_limited": 0, "failed": 0}
 
-def _yahoo_auth(session: Any) -> tuple[Optional[Any], Optional[str]]:
-    """Obtain Yahoo cookie + crumb for authenticated quote endpoints."""
-    import time
 
-    ua = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-        )
-    }
-    now = time.time()
-    if (
-        _yahoo_session.get("cookie")
-        and _yahoo_session.get("crumb")
-        and now - float(_yahoo_session.get("fetched_at") or 0) < 6 * 3600
-    ):
-        return _yahoo_session["cookie"], _yahoo_session["crumb"]
+def _count_bulk(**deltas: int) -> None:
+    with _bulk_stats_lock:
+        for k, v in deltas.items():
+            _bulk_stats[k] += v
 
-    try:
-        session.get("https://fc.yahoo.com", headers=ua, timeout=15)
-    except Exception:
-        pass
-    try:
-        crumb_resp = session.get(
-            "https://query2.finance.yahoo.com/v1/test/getcrumb",
-            headers=ua,
-            timeout=15,
-        )
-        crumb = (crumb_resp.text or "").strip()
-        if crumb_resp.status_code >= 400 or not crumb or "<" in crumb:
-            return None, None
-        _yahoo_session["cookie"] = session.cookies
+
+def bulk_quote_stats() -> dict[str, int]:
+    with _bulk_stats_lock:
+        return dict(_bulk_stats)
+
+
+async def _yahoo_auth(force: bool = False) -> Optional[str]:
+    """Yahoo crumb for authenticated quote endpoints (cookie lives in the pooled session)."""
+    lock = _yahoo_auth_locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+    async with lock:
+        now = time.time()
+        if (
+            not force
+            and _yahoo_session.get("crumb")
+            and now - float(_yahoo_session.get("fetched_at") or 0) < 6 * 3600
+        ):
+            return _yahoo_session["crumb"]
+        yahoo = http_pool.client("yahoo")
+        await yahoo.get_text(_COOKIE_URL, timeout=15)
+        status, crumb = await yahoo.get_text(f"{_QUERY_HOSTS[1]}/v1/test/getcrumb", timeout=15)
+        crumb = (crumb or "").strip()
+        if not status or status >= 400 or not crumb or "<" in crumb:
+            return None
         _yahoo_session["crumb"] = crumb
         _yahoo_session["fetched_at"] = now
-        return session.cookies, crumb
-    except Exception:
-        return None, None
+        return crumb
+
+
+def _quote_snapshot(q: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Map one Yahoo v7 quote result onto the snapshot shape."""
+    sym = (q.get("symbol") or "").upper().replace(".", "-")
+    if not sym:
+        return None
+    price = _safe_float(q.get("regularMarketPrice"))
+    if price is None:
+        return None
+    prev = _safe_float(q.get("regularMarketPreviousClose"))
+    chg_abs = _safe_float(q.get("regularMarketChange"))
+    chg_pct = _safe_float(q.get("regularMarketChangePercent"))
+    if chg_pct is None and prev and prev > 0 and price is not None:
+        chg_pct = ((price / prev) - 1.0) * 100
+    if chg_abs is None and prev is not None:
+        chg_abs = price - prev
+    vol = _safe_float(q.get("regularMarketVolume")) or 0.0
+    avg_vol = _safe_float(q.get("averageDailyVolume3Month") or q.get("averageDailyVolume10Day"))
+    rvol = (vol / avg_vol) if avg_vol else None
+    name = q.get("shortName") or q.get("longName") or sym
+    bid = _safe_float(q.get("bid"))
+    ask = _safe_float(q.get("ask"))
+    if bid is None:
+        bid = _safe_float(q.get("bidPrice"))
+    if ask is None:
+        ask = _safe_float(q.get("askPrice"))
+    # Spread fallback when exchange doesn't publish bid/ask
+    if price is not None:
+        if bid is None:
+            bid = round(price * 0.9995, 4)
+        if ask is None:
+            ask = round(price * 1.0005, 4)
+    return {
+        "symbol": sym,
+        "name": name,
+        "price": round(price, 4),
+        "bid": round(bid, 4) if bid is not None else None,
+        "ask": round(ask, 4) if ask is not None else None,
+        "change_abs_day": round(chg_abs, 4) if chg_abs is not None else None,
+        "change_pct_day": round(chg_pct, 2) if chg_pct is not None else None,
+        "change_pct_week": None,
+        "volume": vol,
+        "rel_volume": round(rvol, 2) if rvol is not None else None,
+        "high": _safe_float(q.get("regularMarketDayHigh")),
+        "low": _safe_float(q.get("regularMarketDayLow")),
+        "sparkline": [],
+        "as_of": datetime.now(timezone.utc).isoformat(),
+        "source": "yahoo_bulk",
+    }
+
+
+async def _quote_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+    return [snap for snap in map(_quote_snapshot, await _quote_results(chunk)) if snap]
+
+
+async def _quote_results(chunk: list[str]) -> list[dict[str, Any]]:
+    key = flight_key("yahoo", "quote", symbols=",".join(chunk))
+    return await single_flight_async(key, lambda: _fetch_quote_chunk(chunk))
+
+
+async def _fetch_quote_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+    """Raw Yahoo v7 quote results for one chunk ([] on failure)."""
+    yahoo = http_pool.client("yahoo")
+    crumb = await _yahoo_auth()
+    params: dict[str, Any] = {"symbols": ",".join(chunk)}
+    if crumb:
+        params["crumb"] = crumb
+    status, data = await yahoo.get_json(f"{_QUERY_HOSTS[0]}/v7/finance/quote", params=params)
+    limited = status == 429
+    if status in {401, 403}:
+        # Refresh crumb once and retry
+        crumb = await _yahoo_auth(force=True)
+        if crumb:
+            params["crumb"] = crumb
+        status, data = await yahoo.get_json(f"{_QUERY_HOSTS[1]}/v7/finance/quote", params=params)
+    elif not status or status >= 400:
+        status, data = await yahoo.get_json(f"{_QUERY_HOSTS[1]}/v7/finance/quote", params=params)
+    limited = limited or status == 429
+    _count_bulk(requests=1, rate_limited=int(limited))
+    if not status or status >= 400 or not isinstance(data, dict):
+        _count_bulk(failed=1)
+        return []
+    _count_bulk(ok=1)
+    return ((data.get("quoteResponse") or {}).get("result")) or []
+
+
+async def fetch_yahoo_quotes_bulk_async(
+    symbols: list[str],
+    chunk_size: int = 80,
+    concurrency: int = 4,
+) -> dict[str, dict[str, Any]]:
+    """Bulk quotes with chunks in flight concurrently over the shared keep-alive pool."""
+    ordered = list(dict.fromkeys(s for s in ((x or "").strip().upper().replace(".", "-") for x in symbols) if s))
+    if not ordered:
+        return {}
+    chunk_size = max(10, min(int(chunk_size), 100))
+    chunks = [ordered[i : i + chunk_size] for i in range(0, len(ordered), chunk_size)]
+    out: dict[str, dict[str, Any]] = {}
+    for snaps in await http_pool.gather_limited([_quote_chunk(c) for c in chunks], concurrency):
+        for snap in snaps:
+            out[snap["symbol"]] = snap
+    return out
+
+
+async def yahoo_quote_results_async(
+    symbols: list[str],
+    chunk_size: int = 80,
+    concurrency: int = 4,
+) -> dict[str, dict[str, Any]]:
+    """{SYMBOL: raw v7 quote result} for many symbols, batched like `fetch_yahoo_quotes_bulk_async`."""
+    ordered = list(dict.fromkeys(s for s in ((x or "").strip().upper().replace(".", "-") for x in symbols) if s))
+    chunk_size = max(10, min(int(chunk_size), 100))
+    chunks = [ordered[i : i + chunk_size] for i in range(0, len(ordered), chunk_size)]
+    out: dict[str, dict[str, Any]] = {}
+    for results in await http_pool.gather_limited([_quote_results(c) for c in chunks], concurrency):
+        for q in results:
+            sym = (q.get("symbol") or "").upper().replace(".", "-")
+            if sym:
+                out[sym] = q
+    return out
 
 
 def fetch_yahoo_quotes_bulk(symbols: list[str], chunk_size: int = 80) -> dict[str, dict[str, Any]]:
@@ -148,181 +291,94 @@ def fetch_yahoo_quotes_bulk(symbols: list[str], chunk_size: int = 80) -> dict[st
     Returns {SYMBOL: snapshot_dict}. Failures are omitted — caller may fall back
     to per-symbol chart snapshots.
     """
-    import requests
-
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for s in symbols:
-        sym = (s or "").strip().upper().replace(".", "-")
-        if sym and sym not in seen:
-            seen.add(sym)
-            ordered.append(sym)
-    if not ordered:
+    try:
+        return http_pool.run(fetch_yahoo_quotes_bulk_async(symbols, chunk_size))
+    except Exception:
         return {}
 
-    out: dict[str, dict[str, Any]] = {}
-    ua = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-        )
+
+def _snapshot_from_history(symbol: str, hist: Optional[pd.DataFrame]) -> Optional[dict[str, Any]]:
+    if hist is None or hist.empty:
+        return None
+    close = hist["Close"].astype(float)
+    last = float(close.iloc[-1])
+    prev = float(close.iloc[-2]) if len(close) > 1 else last
+    day_chg = ((last / prev) - 1.0) * 100 if prev else 0.0
+
+    week_ref = close.iloc[0]
+    # Prefer ~5 trading days back when available
+    if len(close) >= 6:
+        week_ref = float(close.iloc[-6])
+    week_chg = ((last / week_ref) - 1.0) * 100 if week_ref else 0.0
+
+    volume = float(hist["Volume"].iloc[-1]) if "Volume" in hist else 0.0
+    avg_vol = float(hist["Volume"].tail(5).mean()) if "Volume" in hist else 0.0
+    rvol = (volume / avg_vol) if avg_vol else None
+
+    name = symbol
+    spark = [round(float(x), 4) for x in close.tolist()]
+    return {
+        "symbol": symbol,
+        "name": name,
+        "price": round(last, 4),
+        "change_abs_day": round(last - prev, 4),
+        "change_pct_day": round(day_chg, 2),
+        "change_pct_week": round(week_chg, 2),
+        "volume": volume,
+        "rel_volume": round(rvol, 2) if rvol is not None else None,
+        "high": round(float(hist["High"].iloc[-1]), 4),
+        "low": round(float(hist["Low"].iloc[-1]), 4),
+        "sparkline": spark,
+        "as_of": datetime.now(timezone.utc).isoformat(),
+        "source": "yahoo",
     }
-    sess = requests.Session()
-    cookies, crumb = _yahoo_auth(sess)
-    chunk_size = max(10, min(int(chunk_size), 100))
-    for i in range(0, len(ordered), chunk_size):
-        chunk = ordered[i : i + chunk_size]
-        try:
-            params: dict[str, Any] = {"symbols": ",".join(chunk)}
-            if crumb:
-                params["crumb"] = crumb
-            resp = sess.get(
-                "https://query1.finance.yahoo.com/v7/finance/quote",
-                params=params,
-                headers=ua,
-                cookies=cookies,
-                timeout=25,
-            )
-            if resp.status_code in {401, 403}:
-                # Refresh crumb once and retry
-                _yahoo_session["fetched_at"] = 0
-                cookies, crumb = _yahoo_auth(sess)
-                if crumb:
-                    params["crumb"] = crumb
-                resp = sess.get(
-                    "https://query2.finance.yahoo.com/v7/finance/quote",
-                    params=params,
-                    headers=ua,
-                    cookies=cookies,
-                    timeout=25,
-                )
-            elif resp.status_code >= 400:
-                resp = sess.get(
-                    "https://query2.finance.yahoo.com/v7/finance/quote",
-                    params=params,
-                    headers=ua,
-                    cookies=cookies,
-                    timeout=25,
-                )
-            if resp.status_code >= 400:
-                continue
-            results = ((resp.json().get("quoteResponse") or {}).get("result")) or []
-            for q in results:
-                sym = (q.get("symbol") or "").upper().replace(".", "-")
-                if not sym:
-                    continue
-                price = _safe_float(q.get("regularMarketPrice"))
-                if price is None:
-                    continue
-                prev = _safe_float(q.get("regularMarketPreviousClose"))
-                chg_abs = _safe_float(q.get("regularMarketChange"))
-                chg_pct = _safe_float(q.get("regularMarketChangePercent"))
-                if chg_pct is None and prev and prev > 0 and price is not None:
-                    chg_pct = ((price / prev) - 1.0) * 100
-                if chg_abs is None and prev is not None:
-                    chg_abs = price - prev
-                vol = _safe_float(q.get("regularMarketVolume")) or 0.0
-                avg_vol = _safe_float(q.get("averageDailyVolume3Month") or q.get("averageDailyVolume10Day"))
-                rvol = (vol / avg_vol) if avg_vol else None
-                name = q.get("shortName") or q.get("longName") or sym
-                bid = _safe_float(q.get("bid"))
-                ask = _safe_float(q.get("ask"))
-                if bid is None:
-                    bid = _safe_float(q.get("bidPrice"))
-                if ask is None:
-                    ask = _safe_float(q.get("askPrice"))
-                # Spread fallback when exchange doesn't publish bid/ask
-                if price is not None:
-                    if bid is None:
-                        bid = round(price * 0.9995, 4)
-                    if ask is None:
-                        ask = round(price * 1.0005, 4)
-                out[sym] = {
-                    "symbol": sym,
-                    "name": name,
-                    "price": round(price, 4),
-                    "bid": round(bid, 4) if bid is not None else None,
-                    "ask": round(ask, 4) if ask is not None else None,
-                    "change_abs_day": round(chg_abs, 4) if chg_abs is not None else None,
-                    "change_pct_day": round(chg_pct, 2) if chg_pct is not None else None,
-                    "change_pct_week": None,
-                    "volume": vol,
-                    "rel_volume": round(rvol, 2) if rvol is not None else None,
-                    "high": _safe_float(q.get("regularMarketDayHigh")),
-                    "low": _safe_float(q.get("regularMarketDayLow")),
-                    "sparkline": [],
-                    "as_of": datetime.now(timezone.utc).isoformat(),
-                    "source": "yahoo_bulk",
-                }
-        except Exception:
-            continue
-    return out
+
+
+def _yfinance_snapshot(symbol: str) -> Optional[dict[str, Any]]:
+    try:
+        return _snapshot_from_history(symbol, yf.Ticker(symbol).history(period="10d", auto_adjust=True))
+    except Exception:
+        return None
+
+
+async def fetch_ticker_snapshot_async(symbol: str) -> Optional[dict[str, Any]]:
+    """One-symbol snapshot via pooled Yahoo chart; yfinance fallback off-loop."""
+    try:
+        snap = _snapshot_from_history(symbol, _chart_frame(await yahoo_chart_async(symbol, "15d", "1d")))
+    except Exception:
+        snap = None
+    if snap is None:
+        snap = await asyncio.to_thread(_yfinance_snapshot, symbol)
+    return snap
 
 
 def fetch_ticker_snapshot(symbol: str) -> Optional[dict[str, Any]]:
     """One-symbol snapshot via Yahoo chart (primary), yfinance fallback."""
     try:
-        hist = _history_via_chart(symbol, days=15)
-        if hist is None or hist.empty:
-            t = yf.Ticker(symbol)
-            hist = t.history(period="10d", auto_adjust=True)
-        if hist is None or hist.empty:
-            return None
-        close = hist["Close"].astype(float)
-        last = float(close.iloc[-1])
-        prev = float(close.iloc[-2]) if len(close) > 1 else last
-        day_chg = ((last / prev) - 1.0) * 100 if prev else 0.0
-
-        week_ref = close.iloc[0]
-        # Prefer ~5 trading days back when available
-        if len(close) >= 6:
-            week_ref = float(close.iloc[-6])
-        week_chg = ((last / week_ref) - 1.0) * 100 if week_ref else 0.0
-
-        volume = float(hist["Volume"].iloc[-1]) if "Volume" in hist else 0.0
-        avg_vol = float(hist["Volume"].tail(5).mean()) if "Volume" in hist else 0.0
-        rvol = (volume / avg_vol) if avg_vol else None
-
-        name = symbol
-        spark = [round(float(x), 4) for x in close.tolist()]
-        return {
-            "symbol": symbol,
-            "name": name,
-            "price": round(last, 4),
-            "change_abs_day": round(last - prev, 4),
-            "change_pct_day": round(day_chg, 2),
-            "change_pct_week": round(week_chg, 2),
-            "volume": volume,
-            "rel_volume": round(rvol, 2) if rvol is not None else None,
-            "high": round(float(hist["High"].iloc[-1]), 4),
-            "low": round(float(hist["Low"].iloc[-1]), 4),
-            "sparkline": spark,
-            "as_of": datetime.now(timezone.utc).isoformat(),
-            "source": "yahoo",
-        }
+        return _snapshot_from_history(symbol, _history_via_chart(symbol, days=15)) or _yfinance_snapshot(symbol)
     except Exception:
         return None
 
 
 def _batch_snapshots(symbols: list[str], max_workers: int = 14) -> list[dict[str, Any]]:
-    out: list[dict[str, Any]] = []
     # Dedupe preserve order
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for s in symbols:
-        if s and s not in seen:
-            seen.add(s)
-            ordered.append(s)
-
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futures = {pool.submit(fetch_ticker_snapshot, s): s for s in ordered}
-        for fut in as_completed(futures):
-            row = fut.result()
-            if row:
-                out.append(row)
-    return out
+    ordered = list(dict.fromkeys(s for s in symbols if s))
+    try:
+        rows = http_pool.run(
+            http_pool.gather_limited([fetch_ticker_snapshot_async(s) for s in ordered], max_workers)
+        )
+    except Exception:
+        return []
+    return [row for row in rows if row]
 
 
+@swr_cache(
+    "tracked_quotes",
+    soft_ttl=15,
+    hard_ttl=15 * 60,
+    key=lambda symbols=None: tuple(symbols or list_symbols()),
+    accept=bool,
+)
 def get_tracked_quotes(symbols: Optional[list[str]] = None) -> list[dict[str, Any]]:
     syms = symbols or list_symbols()
     rows = _batch_snapshots(syms)
@@ -332,6 +388,13 @@ def get_tracked_quotes(symbols: Optional[list[str]] = None) -> list[dict[str, An
     return rows
 
 
+@swr_cache(
+    "market_highlights",
+    soft_ttl=20,
+    hard_ttl=15 * 60,
+    key=lambda: tuple(list_symbols()),
+    accept=lambda out: not out.get("error"),
+)
 def get_market_highlights() -> dict[str, Any]:
     """Stocks of the day/week from the market universe cache + notable tracked names."""
     tracked = list_symbols()
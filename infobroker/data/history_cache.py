@@ -0,0 +1,498 @@
+"""Local OHLCV history cache shared by the web app, MCP server and CLI.
+
+`data/history.db` (SQLite, WAL) keeps bars per (symbol, interval, adjusted)
+plus the date window that has been fetched. A request is served from disk;
+only the missing head, or the tail since the last cached bar once it is older
+than the interval's TTL, goes upstream. If the re-fetched overlap bar no longer
+matches (split / dividend re-adjustment), the symbol is re-downloaded whole.
+
+Each (symbol, interval, adjusted) carries a data version that moves only when
+stored bars actually change, so derived results can be keyed on it.
+`read_versions()` reports the version each read in a block was served at.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from infobroker.config import DATA_DIR
+from infobroker.data.singleflight import flight_key, single_flight
+
+HISTORY_DB = DATA_DIR / "history.db"
+_LOCK = threading.RLock()
+_local = threading.local()
+_reads = threading.local()  # .seen: (symbol, interval, adjusted) → version, inside read_versions()
+_ready: set[str] = set()
+
+# Re-check the tail after this many seconds (by bar interval)
+_TAIL_TTL_SEC: dict[str, float] = {
+    "1m": 60,
+    "2m": 120,
+    "5m": 180,
+    "15m": 300,
+    "30m": 600,
+    "60m": 900,
+    "90m": 900,
+    "1h": 900,
+    "1d": 900,
+    "5d": 3600,
+    "1wk": 3600,
+    "1mo": 6 * 3600,
+    "3mo": 6 * 3600,
+}
+# Bar length, to tell a coverage that reached the live edge from a historical window
+_BAR_SEC: dict[str, float] = {
+    "1m": 60,
+    "2m": 120,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "60m": 3600,
+    "90m": 5400,
+    "1h": 3600,
+    "1d": 86400,
+    "5d": 5 * 86400,
+    "1wk": 7 * 86400,
+    "1mo": 31 * 86400,
+    "3mo": 92 * 86400,
+}
+_REVISION_TOL = 1e-4  # relative close drift on the overlap bar that forces a full reload
+
+_PERIOD_DAYS: dict[str, int] = {
+    "1d": 1,
+    "5d": 5,
+    "7d": 7,
+    "1mo": 31,
+    "3mo": 92,
+    "6mo": 183,
+    "1y": 366,
+    "2y": 731,
+    "5y": 1827,
+    "10y": 3653,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    adjusted INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume REAL,
+    PRIMARY KEY (symbol, interval, adjusted, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    adjusted INTEGER NOT NULL,
+    start_ts INTEGER NOT NULL,
+    end_ts INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    tz TEXT,
+    PRIMARY KEY (symbol, interval, adjusted)
+);
+CREATE TABLE IF NOT EXISTS versions (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    adjusted INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    PRIMARY KEY (symbol, interval, adjusted)
+);
+"""
+
+_COLS = ("Open", "High", "Low", "Close", "Volume")
+
+Fetcher = Callable[[str, str, str], pd.DataFrame]  # (symbol, start, end) → OHLCV frame
+
+_stats_lock = threading.Lock()
+_stats: dict[str, int] = {"hits": 0, "tail_fetches": 0, "head_fetches": 0, "full_fetches": 0, "reloads": 0}
+
+
+def _count(key: str) -> None:
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def _connect() -> sqlite3.Connection:
+    """Per-thread connection (sqlite3 objects must not cross threads)."""
+    db = str(HISTORY_DB)
+    conn: Optional[sqlite3.Connection] = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "path", None) == db:
+        return conn
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    _local.conn = conn
+    _local.path = db
+    if db not in _ready:
+        with _LOCK:
+            if db not in _ready:
+                conn.executescript(_SCHEMA)
+                _ready.add(db)
+    return conn
+
+
+def _epoch(day: str) -> int:
+    return int(datetime.fromisoformat(day).replace(tzinfo=timezone.utc).timestamp())
+
+
+def _day(ts: int) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def period_window(period: str, today: Optional[date] = None) -> Optional[tuple[str, str]]:
+    """(start, end) dates for a yfinance `period`; None for 'max' (not cacheable)."""
+    today = today or datetime.now(timezone.utc).date()
+    end = (today + timedelta(days=1)).isoformat()
+    p = (period or "").strip().lower()
+    if p == "ytd":
+        return date(today.year, 1, 1).isoformat(), end
+    days = _PERIOD_DAYS.get(p)
+    if days is None:
+        return None
+    return (today - timedelta(days=days)).isoformat(), end
+
+
+def _frame_rows(symbol: str, interval: str, adjusted: int, df: pd.DataFrame) -> tuple[list[tuple[Any, ...]], Optional[str]]:
+    idx = pd.DatetimeIndex(df.index)
+    tz = str(idx.tz) if idx.tz is not None else None
+    utc = idx.tz_convert("UTC") if idx.tz is not None else idx
+    ts = utc.as_unit("s").asi8.tolist()
+    values = df[list(_COLS)].to_numpy(dtype=float).tolist()
+    return [(symbol, interval, adjusted, t, *v) for t, v in zip(ts, values)], tz
+
+
+def _write(
+    conn: sqlite3.Connection,
+    symbol: str,
+    interval: str,
+    adjusted: int,
+    df: Optional[pd.DataFrame],
+    start_ts: int,
+    end_ts: int,
+    tz: Optional[str] = None,
+) -> None:
+    rows: list[tuple[Any, ...]] = []
+    if df is not None and not df.empty:
+        rows, tz = _frame_rows(symbol, interval, adjusted, df)
+    with _LOCK:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = conn.total_changes
+            # Identical re-fetched bars are left alone so they don't bump the version
+            conn.executemany(
+                """
+                INSERT INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(symbol, interval, adjusted, ts) DO UPDATE SET
+                    open = excluded.open,
+                    high = excluded.high,
+                    low = excluded.low,
+                    close = excluded.close,
+                    volume = excluded.volume
+                WHERE open IS NOT excluded.open OR high IS NOT excluded.high OR low IS NOT excluded.low
+                    OR close IS NOT excluded.close OR volume IS NOT excluded.volume
+                """,
+                rows,
+            )
+            if conn.total_changes != before:
+                _bump(conn, symbol, interval, adjusted)
+            conn.execute(
+                """
+                INSERT INTO coverage (symbol, interval, adjusted, start_ts, end_ts, fetched_at, tz)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(symbol, interval, adjusted) DO UPDATE SET
+                    start_ts = MIN(start_ts, excluded.start_ts),
+                    end_ts = MAX(end_ts, excluded.end_ts),
+                    fetched_at = excluded.fetched_at,
+                    tz = COALESCE(excluded.tz, tz)
+                """,
+                (symbol, interval, adjusted, start_ts, end_ts, time.time(), tz),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def _bump(conn: sqlite3.Connection, symbol: str, interval: str, adjusted: int) -> None:
+    # Wall-clock milliseconds, strictly increasing: a wiped and refilled db never reuses a version
+    conn.execute(
+        """
+        INSERT INTO versions (symbol, interval, adjusted, version) VALUES (?, ?, ?, ?)
+        ON CONFLICT(symbol, interval, adjusted) DO UPDATE SET version = MAX(version + 1, excluded.version)
+        """,
+        (symbol, interval, adjusted, int(time.time() * 1000)),
+    )
+
+
+def _coverage(conn: sqlite3.Connection, symbol: str, interval: str, adjusted: int) -> Optional[tuple[int, int, float, Optional[str]]]:
+    return conn.execute(
+        "SELECT start_ts, end_ts, fetched_at, tz FROM coverage WHERE symbol = ? AND interval = ? AND adjusted = ?",
+        (symbol, interval, adjusted),
+    ).fetchone()
+
+
+def _read(conn: sqlite3.Connection, symbol: str, interval: str, adjusted: int, start_ts: int, end_ts: int, tz: Optional[str]) -> pd.DataFrame:
+    rows = conn.execute(
+        """
+        SELECT ts, open, high, low, close, volume FROM bars
+        WHERE symbol = ? AND interval = ? AND adjusted = ? AND ts >= ? AND ts < ?
+        ORDER BY ts
+        """,
+        (symbol, interval, adjusted, start_ts, end_ts),
+    ).fetchall()
+    arr = np.asarray(rows, dtype=float).reshape(-1, 6)
+    index = pd.to_datetime(arr[:, 0].astype(np.int64), unit="s")
+    if tz:
+        index = index.tz_localize("UTC").tz_convert(tz)
+    df = pd.DataFrame(arr[:, 1:], index=index, columns=list(_COLS))
+    df.index.name = "Date"
+    return df
+
+
+def _last_bars(conn: sqlite3.Connection, symbol: str, interval: str, adjusted: int, n: int = 2) -> list[tuple[int, float]]:
+    return conn.execute(
+        """
+        SELECT ts, close FROM bars WHERE symbol = ? AND interval = ? AND adjusted = ?
+        ORDER BY ts DESC LIMIT ?
+        """,
+        (symbol, interval, adjusted, n),
+    ).fetchall()
+
+
+def _drop(conn: sqlite3.Connection, symbol: str, interval: str, adjusted: int) -> None:
+    with _LOCK:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM bars WHERE symbol = ? AND interval = ? AND adjusted = ?", (symbol, interval, adjusted))
+            conn.execute("DELETE FROM coverage WHERE symbol = ? AND interval = ? AND adjusted = ?", (symbol, interval, adjusted))
+            _bump(conn, symbol, interval, adjusted)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def _try_fetch(fetch: Fetcher, symbol: str, start: str, end: str) -> Optional[pd.DataFrame]:
+    try:
+        return fetch(symbol, start, end)
+    except ValueError:
+        return None  # no bars in the gap (weekend / holiday / not yet listed)
+
+
+def _revised(fresh: pd.DataFrame, cached: list[tuple[int, float]], interval: str, adjusted: int, symbol: str) -> bool:
+    """True when the overlap bar's close moved — history was re-adjusted upstream."""
+    if not adjusted or len(cached) < 2 or fresh is None or fresh.empty:
+        return False
+    ts, close = cached[1]  # second-to-last cached bar is complete
+    rows, _ = _frame_rows(symbol, interval, adjusted, fresh)
+    match = next((r[7] for r in rows if r[3] == ts), None)
+    if match is None or not close:
+        return False
+    return abs(match / close - 1.0) > _REVISION_TOL
+
+
+def store_history(symbol: str, df: pd.DataFrame, start: str, end: str, interval: str = "1d", auto_adjust: bool = True) -> None:
+    """Write bars fetched elsewhere (e.g. a batched multi-symbol download) into the cache."""
+    conn = _connect()
+    sym, adjusted = symbol.upper().strip(), int(auto_adjust)
+    start_ts, end_ts = _epoch(start), min(_epoch(end), int(time.time()))
+    if adjusted and df is not None and not df.empty:
+        rows, _ = _frame_rows(sym, interval, adjusted, df)
+        probe = conn.execute(
+            "SELECT close FROM bars WHERE symbol = ? AND interval = ? AND adjusted = ? AND ts = ?",
+            (sym, interval, adjusted, rows[0][3]),
+        ).fetchone()
+        if probe and probe[0] and abs(rows[0][7] / probe[0] - 1.0) > _REVISION_TOL:
+            # Re-adjusted upstream: bars outside this window are stale now
+            _count("reloads")
+            _drop(conn, sym, interval, adjusted)
+    _write(conn, sym, interval, adjusted, df, start_ts, end_ts)
+
+
+def _version(conn: sqlite3.Connection, symbol: str, interval: str, adjusted: int) -> Optional[int]:
+    row = conn.execute(
+        "SELECT version FROM versions WHERE symbol = ? AND interval = ? AND adjusted = ?",
+        (symbol, interval, adjusted),
+    ).fetchone()
+    return int(row[0]) if row else None
+
+
+def data_version(symbol: str, interval: str = "1d", auto_adjust: bool = True) -> Optional[int]:
+    """Version of the cached bars for a symbol (changes whenever bars land or are revised); None if uncached."""
+    conn = _connect()
+    sym, adjusted = symbol.upper().strip(), int(auto_adjust)
+    if _coverage(conn, sym, interval, adjusted) is None:
+        return None
+    return _version(conn, sym, interval, adjusted)
+
+
+@contextmanager
+def read_versions() -> Iterator[dict[tuple[str, str, int], Optional[int]]]:
+    """Collect, for this thread, the data version each `cached_history` read was served at.
+
+    Keys are (symbol, interval, adjusted); a symbol read twice keeps the older
+    version, so a result is never attributed to bars newer than it used.
+    """
+    prev = getattr(_reads, "seen", None)
+    seen: dict[tuple[str, str, int], Optional[int]] = {}
+    _reads.seen = seen
+    try:
+        yield seen
+    finally:
+        _reads.seen = prev
+        if prev is not None:
+            for k, v in seen.items():
+                prev[k] = v if k not in prev else _older(prev[k], v)
+
+
+def _older(a: Optional[int], b: Optional[int]) -> Optional[int]:
+    return None if a is None or b is None else min(a, b)
+
+
+def _note_read(key: tuple[str, str, int], version: Optional[int]) -> None:
+    seen = getattr(_reads, "seen", None)
+    if seen is not None:
+        seen[key] = version if key not in seen else _older(seen[key], version)
+
+
+def _tail_due(interval: str, cov_end: int, fetched_at: float, e_ts: int, now: float) -> bool:
+    """Whether (cov_end, e_ts] has to come from upstream.
+
+    The TTL only covers a coverage that ended at the live edge when it was
+    fetched (the newest bars just don't exist yet); a gap after a historical
+    window is always fetched.
+    """
+    if e_ts <= cov_end:
+        return False
+    if cov_end >= fetched_at - _BAR_SEC.get(interval, 86400):
+        return now - fetched_at > _TAIL_TTL_SEC.get(interval, 900)
+    return True
+
+
+def needs_fetch(symbol: str, start: str, end: str, interval: str = "1d", auto_adjust: bool = True) -> bool:
+    """True when serving [start, end) would have to go upstream (uncached head or stale tail)."""
+    cov = _coverage(_connect(), symbol.upper().strip(), interval, int(auto_adjust))
+    if cov is None:
+        return True
+    now = time.time()
+    cov_start, cov_end, fetched_at, _ = cov
+    if _epoch(start) < cov_start:
+        return True
+    return _tail_due(interval, cov_end, fetched_at, min(_epoch(end), int(now)), now)
+
+
+def cached_history(
+    symbol: str,
+    start: str,
+    end: str,
+    fetch: Fetcher,
+    *,
+    interval: str = "1d",
+    auto_adjust: bool = True,
+) -> pd.DataFrame:
+    """OHLCV for [start, end) served from the cache; `fetch` fills only what's missing."""
+    sym = symbol.upper().strip()
+    key = flight_key("history", interval, sym, start=start, end=end, adjusted=auto_adjust)
+    df, version = single_flight(key, lambda: _cached_history(sym, start, end, fetch, interval, int(auto_adjust)))
+    _note_read((sym, interval, int(auto_adjust)), version)
+    return df.copy()
+
+
+def _cached_history(
+    sym: str, start: str, end: str, fetch: Fetcher, interval: str, adjusted: int
+) -> tuple[pd.DataFrame, Optional[int]]:
+    conn = _connect()
+    now = time.time()
+    s_ts, e_ts = _epoch(start), min(_epoch(end), int(now))
+    cov = _coverage(conn, sym, interval, adjusted)
+
+    if cov is None:
+        _count("full_fetches")
+        df = fetch(sym, start, end)  # raises when upstream has nothing at all
+        _write(conn, sym, interval, adjusted, df, s_ts, e_ts)
+        cov = _coverage(conn, sym, interval, adjusted)
+    else:
+        cov_start, cov_end, fetched_at, _ = cov
+        hit = True
+        if s_ts < cov_start:
+            hit = False
+            _count("head_fetches")
+            head = _try_fetch(fetch, sym, start, _day(cov_start + 86400))
+            _write(conn, sym, interval, adjusted, head, s_ts, cov_start)
+        if _tail_due(interval, cov_end, fetched_at, e_ts, now):
+            hit = False
+            cached = _last_bars(conn, sym, interval, adjusted)
+            # Start at the last complete bar: it is the re-adjustment probe, and a
+            # partial (in-progress) final bar gets replaced
+            from_ts = cached[-1][0] if cached else cov_end
+            tail = _try_fetch(fetch, sym, _day(from_ts), end)
+            if _revised(tail, cached, interval, adjusted, sym):
+                _count("reloads")
+                _drop(conn, sym, interval, adjusted)
+                full_start = _day(min(s_ts, cov_start))
+                _write(conn, sym, interval, adjusted, fetch(sym, full_start, end), min(s_ts, cov_start), e_ts)
+            else:
+                _count("tail_fetches")
+                _write(conn, sym, interval, adjusted, tail, from_ts, e_ts)
+        if hit:
+            _count("hits")
+        cov = _coverage(conn, sym, interval, adjusted)
+
+    # One read transaction: the version returned is the one these bars belong to
+    conn.execute("BEGIN")
+    try:
+        df = _read(conn, sym, interval, adjusted, s_ts, _epoch(end), cov[3] if cov else None)
+        version = _version(conn, sym, interval, adjusted)
+    finally:
+        conn.execute("COMMIT")
+    if df.empty:
+        raise ValueError(f"no cached bars for {sym} {interval} {start}..{end}")
+    return df, version
+
+
+def clear_history(symbol: Optional[str] = None) -> int:
+    """Drop cached bars (one symbol or everything); returns rows removed."""
+    conn = _connect()
+    with _LOCK:
+        if symbol:
+            sym = symbol.upper().strip()
+            n = conn.execute("DELETE FROM bars WHERE symbol = ?", (sym,)).rowcount
+            conn.execute("DELETE FROM coverage WHERE symbol = ?", (sym,))
+        else:
+            n = conn.execute("DELETE FROM bars").rowcount
+            conn.execute("DELETE FROM coverage")
+    return n
+
+
+def history_cache_stats() -> dict[str, Any]:
+    conn = _connect()
+    symbols, bars = conn.execute("SELECT COUNT(DISTINCT symbol), COUNT(*) FROM bars").fetchone()
+    with _stats_lock:
+        counters = dict(_stats)
+    return {"path": str(HISTORY_DB), "symbols": symbols, "bars": bars, **counters}
+
+
+__all__ = [
+    "HISTORY_DB",
+    "cached_history",
+    "clear_history",
+    "data_version",
+    "history_cache_stats",
+    "needs_fetch",
+    "period_window",
+    "read_versions",
+    "store_history",
+]
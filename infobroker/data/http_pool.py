@@ -0,0 +1,204 @@
+"""Long-lived pooled aiohttp clients (one per provider) on a background event loop.
+
+Market-data fetches used to open a fresh `requests` session or thread pool per
+call. Here every provider gets one keep-alive connection pool for the life of
+the process; coroutines fan out with bounded parallelism and sync callers
+(worker threads, FastAPI threadpool routes) bridge in with `run()`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import os
+import threading
+from typing import Any, Awaitable, Optional, TypeVar
+
+import aiohttp
+
+T = TypeVar("T")
+
+_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+# provider → (max open connections, default timeout seconds)
+_PROVIDERS: dict[str, tuple[int, float]] = {
+    "yahoo": (16, 25.0),
+    "finnhub": (4, 15.0),
+}
+
+_loop_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_pid: Optional[int] = None
+_clients: dict[str, "ProviderClient"] = {}
+
+
+class ProviderClient:
+    """One aiohttp session + connector per provider; counts requests and sockets."""
+
+    def __init__(self, name: str, limit: int, timeout: float):
+        self.name = name
+        self.limit = limit
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._stats_lock = threading.Lock()
+        self.stats: dict[str, int] = {
+            "requests": 0,
+            "ok": 0,
+            "errors": 0,
+            "rate_limited": 0,
+            "sockets_opened": 0,
+            "sockets_reused": 0,
+        }
+
+    def _count(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += n
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Created lazily on the pool loop (sessions are loop-bound)."""
+        if self._session is None or self._session.closed:
+            trace = aiohttp.TraceConfig()
+
+            async def _opened(*_: Any) -> None:
+                self._count("sockets_opened")
+
+            async def _reused(*_: Any) -> None:
+                self._count("sockets_reused")
+
+            trace.on_connection_create_end.append(_opened)
+            trace.on_connection_reuseconn.append(_reused)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit, ttl_dns_cache=300, keepalive_timeout=60),
+                headers={"User-Agent": _UA},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[trace],
+            )
+        return self._session
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> tuple[int, Any]:
+        """(status, parsed JSON or None). Network errors come back as status 0."""
+        self._count("requests")
+        kwargs: dict[str, Any] = {"params": params}
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        try:
+            async with self.session.get(url, **kwargs) as resp:
+                status = resp.status
+                if status == 429:
+                    self._count("rate_limited")
+                if status >= 400:
+                    self._count("errors")
+                    return status, None
+                data = await resp.json(content_type=None)
+                self._count("ok")
+                return status, data
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            self._count("errors")
+            return 0, None
+
+    async def get_text(self, url: str, timeout: Optional[float] = None) -> tuple[int, str]:
+        self._count("requests")
+        try:
+            kwargs: dict[str, Any] = {}
+            if timeout is not None:
+                kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+            async with self.session.get(url, **kwargs) as resp:
+                text = await resp.text()
+                self._count("ok" if resp.status < 400 else "errors")
+                return resp.status, text
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._count("errors")
+            return 0, ""
+
+    def snapshot(self) -> dict[str, int]:
+        with self._stats_lock:
+            return dict(self.stats)
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _loop_pid
+    with _loop_lock:
+        # Forked workers inherit a dead loop thread — start a fresh one
+        if _loop is None or _loop.is_closed() or _loop_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="infobroker-http", daemon=True).start()
+            _loop = loop
+            _loop_pid = os.getpid()
+            _clients.clear()
+        return _loop
+
+
+def client(provider: str) -> ProviderClient:
+    """The shared client for `provider` (yahoo, finnhub, ...)."""
+    _ensure_loop()
+    with _loop_lock:
+        c = _clients.get(provider)
+        if c is None:
+            limit, timeout = _PROVIDERS.get(provider, (8, 20.0))
+            c = _clients[provider] = ProviderClient(provider, limit, timeout)
+        return c
+
+
+def run(coro: Awaitable[T], timeout: Optional[float] = 120.0) -> T:
+    """Run a coroutine on the pool loop from sync code and wait for its result."""
+    loop = _ensure_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError("http_pool.run() called on the pool loop — await the coroutine instead")
+    fut = asyncio.run_coroutine_threadsafe(coro, loop)  # type: ignore[arg-type]
+    try:
+        return fut.result(timeout)
+    except TimeoutError:
+        fut.cancel()
+        raise
+
+
+async def gather_limited(coros: list[Awaitable[T]], limit: int) -> list[T]:
+    """`asyncio.gather` with at most `limit` coroutines in flight."""
+    sem = asyncio.Semaphore(max(1, limit))
+
+    async def _one(c: Awaitable[T]) -> T:
+        async with sem:
+            return await c
+
+    return await asyncio.gather(*(_one(c) for c in coros))
+
+
+async def _close_sessions() -> None:
+    for c in list(_clients.values()):
+        if c._session is not None and not c._session.closed:
+            await c._session.close()
+
+
+@atexit.register
+def _shutdown() -> None:
+    loop = _loop
+    if loop is None or loop.is_closed() or _loop_pid != os.getpid():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_sessions(), loop).result(5)
+    except Exception:  # noqa: BLE001
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def http_stats() -> dict[str, dict[str, int]]:
+    """Cumulative per-provider counters (diff two calls for per-cycle numbers)."""
+    with _loop_lock:
+        clients = list(_clients.values())
+    return {c.name: c.snapshot() for c in clients}
+
+
+__all__ = ["ProviderClient", "client", "gather_limited", "http_stats", "run"]
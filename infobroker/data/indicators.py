@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 import talib
 
+from infobroker.data.downsample import aggregate_ohlc, bucket_starts
+from infobroker.data.serialize import bar_columns, rows_from_columns
+
 
 def _as_float64(prices: pd.Series | np.ndarray) -> np.ndarray:
     arr = np.asarray(prices, dtype=np.float64)
@@ -123,6 +127,195 @@ def bollinger_bands(
     )
 
 
+# Plan indicator → the enriched columns it fills (enrich_ohlcv naming)
+INDICATOR_COLUMNS: dict[str, tuple[str, ...]] = {
+    "SMA_20": ("SMA_20",),
+    "SMA_50": ("SMA_50",),
+    "SMA_200": ("SMA_200",),
+    "EMA_12": ("EMA_12",),
+    "EMA_26": ("EMA_26",),
+    "RSI_14": ("RSI_14",),
+    "MACD": ("MACD", "MACD_signal", "MACD_hist"),
+    "ATR_14": ("ATR_14",),
+    "BB": ("BB_upper", "BB_mid", "BB_lower"),
+}
+
+_SNAPSHOT_KEYS = (
+    ("close", "Close"),
+    ("rsi_14", "RSI_14"),
+    ("sma_20", "SMA_20"),
+    ("sma_50", "SMA_50"),
+    ("sma_200", "SMA_200"),
+    ("macd", "MACD"),
+    ("macd_signal", "MACD_signal"),
+    ("macd_hist", "MACD_hist"),
+    ("atr_14", "ATR_14"),
+    ("bb_upper", "BB_upper"),
+    ("bb_lower", "BB_lower"),
+)
+
+# Bar payload key → enriched column (chart pack / analyze records)
+_BAR_KEYS = (
+    ("sma20", "SMA_20"),
+    ("sma50", "SMA_50"),
+    ("sma200", "SMA_200"),
+    ("rsi", "RSI_14"),
+    ("macd", "MACD"),
+    ("macd_signal", "MACD_signal"),
+    ("macd_hist", "MACD_hist"),
+    ("atr", "ATR_14"),
+    ("bb_upper", "BB_upper"),
+    ("bb_lower", "BB_lower"),
+)
+
+
+@dataclass(frozen=True)
+class EnrichmentPlan:
+    """Which indicators a consumer needs; `run()` computes each exactly once.
+
+    SMA_200 is only computed with ≥ 200 bars and ATR only with High/Low, as in
+    `enrich_ohlcv`.
+    """
+
+    indicators: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        unknown = [i for i in self.indicators if i not in INDICATOR_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown indicators {unknown}; choose from {list(INDICATOR_COLUMNS)}")
+
+    def run(self, df: pd.DataFrame) -> "Enriched":
+        frame = df.rename(columns={c: str(c).title() for c in df.columns})
+        ohlcv = {c: frame[c].to_numpy(dtype=np.float64) for c in ("Open", "High", "Low", "Close", "Volume") if c in frame.columns}
+        close = ohlcv["Close"]
+        n = close.size
+        todo = [
+            i
+            for i in self.indicators
+            if not (i == "SMA_200" and n < 200) and not (i == "ATR_14" and not {"High", "Low"}.issubset(ohlcv))
+        ]
+        columns = [c for i in todo for c in INDICATOR_COLUMNS[i]]
+        values = np.empty((len(columns), n), dtype=np.float64)
+        row = 0
+        for ind in todo:
+            if ind.startswith("SMA_"):
+                outs = (talib.SMA(close, timeperiod=int(ind[4:])),)
+            elif ind.startswith("EMA_"):
+                outs = (talib.EMA(close, timeperiod=int(ind[4:])),)
+            elif ind == "RSI_14":
+                outs = (talib.RSI(close, timeperiod=14),)
+            elif ind == "MACD":
+                outs = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+            elif ind == "ATR_14":
+                outs = (talib.ATR(ohlcv["High"], ohlcv["Low"], close, timeperiod=14),)
+            else:
+                outs = talib.BBANDS(close, timeperiod=20, nbdevup=2.0, nbdevdn=2.0, matype=0)
+            for out in outs:
+                values[row] = out
+                row += 1
+        return Enriched(frame, ohlcv, columns, values)
+
+
+FULL_PLAN = EnrichmentPlan(tuple(INDICATOR_COLUMNS))
+# Chart pack / analyze bars and `latest_snapshot`
+SNAPSHOT_PLAN = EnrichmentPlan(("SMA_20", "SMA_50", "SMA_200", "RSI_14", "MACD", "ATR_14", "BB"))
+SCAN_PLAN = EnrichmentPlan(("SMA_50", "SMA_200", "RSI_14", "MACD"))
+
+
+class Enriched:
+    """Result of an `EnrichmentPlan`: OHLCV and indicator columns as float64 arrays
+    (one row per indicator column in a single preallocated block)."""
+
+    __slots__ = ("source", "index", "ohlcv", "columns", "values", "_pos")
+
+    def __init__(self, source: pd.DataFrame, ohlcv: dict[str, np.ndarray], columns: list[str], values: np.ndarray):
+        self.source = source
+        self.index = source.index
+        self.ohlcv = ohlcv
+        self.columns = columns
+        self.values = values
+        self._pos = {c: j for j, c in enumerate(columns)}
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._pos or name in self.ohlcv
+
+    def column(self, name: str) -> Optional[np.ndarray]:
+        if name in self.ohlcv:
+            return self.ohlcv[name]
+        j = self._pos.get(name)
+        return None if j is None else self.values[j]
+
+    def last(self, name: str, digits: Optional[int] = 4) -> Optional[float]:
+        """Last bar's value (None when missing / NaN)."""
+        col = self.column(name)
+        if col is None or not col.size or np.isnan(col[-1]):
+            return None
+        v = float(col[-1])
+        return round(v, digits) if digits is not None else v
+
+    def last_valid(self, name: str, digits: Optional[int] = 4) -> Optional[float]:
+        """Latest non-NaN value (None when there is none)."""
+        col = self.column(name)
+        ok = np.flatnonzero(~np.isnan(col)) if col is not None else []
+        if not len(ok):
+            return None
+        v = float(col[ok[-1]])
+        return round(v, digits) if digits is not None else v
+
+    def frame(self) -> pd.DataFrame:
+        """`enrich_ohlcv`-shaped DataFrame."""
+        base = self.source.drop(columns=[c for c in self.columns if c in self.source.columns])
+        extra = pd.DataFrame(self.values.T, index=self.index, columns=self.columns)
+        return pd.concat([base, extra], axis=1)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Same shape as `latest_snapshot`."""
+        if not len(self):
+            return {}
+        return {**{key: self.last(col) for key, col in _SNAPSHOT_KEYS}, "engine": "TA-Lib"}
+
+    def macd(self) -> dict[str, float]:
+        """Same as `calculate_macd` on the close: latest bar with all three MACD values."""
+        cols = [self.column(c) for c in INDICATOR_COLUMNS["MACD"]]
+        if any(c is None for c in cols):
+            return {"macd_line": 0.0, "signal_line": 0.0, "histogram": 0.0}
+        ok = np.flatnonzero(~np.isnan(np.vstack(cols)).any(axis=0))
+        if not ok.size:
+            return {"macd_line": 0.0, "signal_line": 0.0, "histogram": 0.0}
+        i = ok[-1]
+        return {"macd_line": float(cols[0][i]), "signal_line": float(cols[1][i]), "histogram": float(cols[2][i])}
+
+    def bar_columns(self, start: int = 0, max_points: Optional[int] = None) -> dict[str, list[Any]]:
+        """Chart bars from bar `start` on, column-wise: `t`, OHLCV, indicators rounded to 4dp.
+
+        With `max_points`, longer ranges are merged into OHLC buckets (indicator
+        values and volume sums taken per bucket; `t` is the bucket's first bar).
+        """
+        fields: dict[str, Optional[np.ndarray]] = {
+            key: (self.ohlcv[col][start:] if col in self.ohlcv else None)
+            for key, col in (("o", "Open"), ("h", "High"), ("l", "Low"), ("c", "Close"), ("v", "Volume"))
+        }
+        for key, name in _BAR_KEYS:
+            col = self.column(name)
+            fields[key] = col[start:] if col is not None else None
+        index = self.index[start:]
+        if max_points and len(index) > max_points:
+            starts = bucket_starts(len(index), max_points)
+            agg = aggregate_ohlc(starts, fields["o"], fields["h"], fields["l"], fields["c"], fields["v"])
+            last = agg.pop("last")
+            agg.pop("first")
+            fields = {key: (agg[key] if key in agg else (None if col is None else col[last])) for key, col in fields.items()}
+            index = index[starts]
+        return bar_columns(index, fields, {key: 4 for key, _ in _BAR_KEYS})
+
+    def bar_records(self, start: int = 0, max_points: Optional[int] = None) -> list[dict[str, Any]]:
+        """`bar_columns` as one dict per bar."""
+        return rows_from_columns(self.bar_columns(start, max_points))
+
+
 def enrich_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
     """
     Attach standard TA-Lib columns to an OHLCV Pandas frame.
@@ -130,60 +323,19 @@ def enrich_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
     """
     if df is None or df.empty:
         return df
-    out = df.copy()
-    # Normalize column names
-    rename = {c: str(c).title() for c in out.columns}
-    out = out.rename(columns=rename)
-    close = out["Close"].astype(float)
-    out["SMA_20"] = sma(close, 20)
-    out["SMA_50"] = sma(close, 50)
-    if len(close) >= 200:
-        out["SMA_200"] = sma(close, 200)
-    out["EMA_12"] = ema(close, 12)
-    out["EMA_26"] = ema(close, 26)
-    out["RSI_14"] = rsi_series(close, 14)
-    macd = macd_series(close)
-    out["MACD"] = macd["macd_line"]
-    out["MACD_signal"] = macd["signal_line"]
-    out["MACD_hist"] = macd["histogram"]
-    if {"High", "Low", "Close"}.issubset(out.columns):
-        out["ATR_14"] = atr_series(out, 14)
-    bb = bollinger_bands(close, 20, 2.0)
-    out["BB_upper"] = bb["bb_upper"]
-    out["BB_mid"] = bb["bb_mid"]
-    out["BB_lower"] = bb["bb_lower"]
-    return out
+    return FULL_PLAN.run(df).frame()
 
 
 def latest_snapshot(df: pd.DataFrame) -> dict[str, Any]:
-    """Compact latest indicator values from an enriched OHLCV frame."""
+    """Compact latest indicator values from an OHLCV frame (enriched or not)."""
     if df is None or df.empty:
         return {}
-    frame = enrich_ohlcv(df)
-    row = frame.iloc[-1]
-
-    def g(key: str):
-        if key not in frame.columns:
-            return None
-        v = row[key]
-        try:
-            if v is None or (isinstance(v, float) and np.isnan(v)):
-                return None
-            return round(float(v), 4)
-        except Exception:
-            return None
-
-    return {
-        "close": g("Close"),
-        "rsi_14": g("RSI_14"),
-        "sma_20": g("SMA_20"),
-        "sma_50": g("SMA_50"),
-        "sma_200": g("SMA_200"),
-        "macd": g("MACD"),
-        "macd_signal": g("MACD_signal"),
-        "macd_hist": g("MACD_hist"),
-        "atr_14": g("ATR_14"),
-        "bb_upper": g("BB_upper"),
-        "bb_lower": g("BB_lower"),
-        "engine": "TA-Lib",
-    }
+    if "RSI_14" in df.columns:
+        # Already enriched: read the last row instead of recomputing
+        row = df.iloc[-1]
+        out: dict[str, Any] = {}
+        for key, col in _SNAPSHOT_KEYS:
+            v = row[col] if col in df.columns else None
+            out[key] = None if v is None or pd.isna(v) else round(float(v), 4)
+        return {**out, "engine": "TA-Lib"}
+    return SNAPSHOT_PLAN.run(df).snapshot()
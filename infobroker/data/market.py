@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 import pandas as pd
 import yfinance as yf
 
 from infobroker.data.providers import get_provider
-from infobroker.data.yf_pipeline import download_history, download_quote
+from infobroker.data.singleflight import flight_key, single_flight
+from infobroker.data.swr import swr_cache
+from infobroker.data.yf_pipeline import download_history, download_history_batch, download_quote
 
 
 def _retry(fn, attempts: int = 3, delay: float = 0.35):
@@ -28,6 +31,11 @@ def _retry(fn, attempts: int = 3, delay: float = 0.35):
 
 
 def get_last_price(symbol: str) -> Optional[float]:
+    """Last trade price; concurrent callers for the same symbol share one lookup."""
+    return single_flight(flight_key("yahoo", "last_price", symbol), lambda: _last_price(symbol))
+
+
+def _last_price(symbol: str) -> Optional[float]:
     try:
         q = _retry(lambda: download_quote(symbol))
         return float(q["Price"])
@@ -46,6 +54,10 @@ def get_last_price(symbol: str) -> Optional[float]:
 
 def get_stock_quote(symbol: str) -> dict[str, Any]:
     """Single-symbol quote: Yahoo → Finnhub → Alpha Vantage (via provider cascade)."""
+    return dict(single_flight(flight_key("yahoo", "quote", symbol), lambda: _stock_quote(symbol)))
+
+
+def _stock_quote(symbol: str) -> dict[str, Any]:
     try:
         q = _retry(lambda: download_quote(symbol))
         q["provider"] = q.get("provider") or "yahoo"
@@ -63,6 +75,14 @@ def get_historical_data(symbol: str, start: str, end: str) -> pd.DataFrame:
         return get_provider().get_history(symbol, start, end)
 
 
+@swr_cache(
+    "fundamentals",
+    soft_ttl=60 * 60,
+    hard_ttl=24 * 60 * 60,
+    key=lambda symbol: symbol.strip().upper(),
+    accept=lambda out: any(v != "N/A" for k, v in out.items() if k != "source"),
+    max_entries=512,
+)
 def get_fundamentals(symbol: str) -> dict[str, Any]:
     # Fundamentals via yfinance (primary integrated source)
     stock = yf.Ticker(symbol)
@@ -83,3 +103,25 @@ def get_fundamentals(symbol: str) -> dict[str, Any]:
 
 def fetch_ohlcv(symbol: str, start: str, end: str) -> pd.DataFrame:
     return get_historical_data(symbol, start, end)
+
+
+def fetch_ohlcv_many(symbols: list[str], start: str, end: str, max_workers: int = 6) -> dict[str, pd.DataFrame]:
+    """Batched `fetch_ohlcv`: multi-ticker Yahoo download, per-symbol cascade for the misses."""
+    try:
+        frames = download_history_batch(symbols, start=start, end=end)
+    except Exception:  # noqa: BLE001
+        frames = {}
+    missing = [s.upper().strip() for s in symbols if s and s.upper().strip() not in frames]
+
+    def _one(sym: str) -> tuple[str, Optional[pd.DataFrame]]:
+        try:
+            return sym, get_historical_data(sym, start, end)
+        except Exception:  # noqa: BLE001
+            return sym, None
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for sym, df in pool.map(_one, missing):
+                if df is not None and not df.empty:
+                    frames[sym] = df
+    return frames
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
 from collections import deque
@@ -11,7 +12,9 @@ from typing import Any, Optional
 import requests
 
 from infobroker.config import get_settings
-from infobroker.data.highlights import fetch_ticker_snapshot
+from infobroker.data import http_pool
+from infobroker.data.highlights import fetch_ticker_snapshot, fetch_ticker_snapshot_async
+from infobroker.data.singleflight import flight_key, single_flight
 from infobroker.data.providers import (
     AlphaVantageProvider,
     FinnhubProvider,
@@ -121,6 +124,11 @@ def _alphavantage() -> Optional[AlphaVantageProvider]:
 
 
 def fetch_finnhub_snapshot(symbol: str) -> Optional[dict[str, Any]]:
+    # Coalesced callers share one budgeted call instead of each spending budget
+    return single_flight(flight_key("finnhub", "quote", symbol), lambda: _finnhub_snapshot(symbol))
+
+
+def _finnhub_snapshot(symbol: str) -> Optional[dict[str, Any]]:
     if not _FINNHUB_BUDGET.try_acquire():
         return None
     fh = _finnhub()
@@ -179,6 +187,50 @@ def fetch_snapshot_multisource(
     return None
 
 
+async def fetch_snapshot_multisource_async(
+    symbol: str,
+    *,
+    allow_finnhub: bool = True,
+    allow_alphavantage: bool = False,
+) -> Optional[dict[str, Any]]:
+    """Async `fetch_snapshot_multisource`: pooled Yahoo chart, budgeted fallbacks off-loop."""
+    sym = (symbol or "").strip().upper()
+    if not sym:
+        return None
+
+    yahoo = await fetch_ticker_snapshot_async(sym)
+    if yahoo:
+        yahoo["source"] = yahoo.get("source") or "yahoo"
+        return yahoo
+
+    if allow_finnhub:
+        fh = await asyncio.to_thread(fetch_finnhub_snapshot, sym)
+        if fh:
+            return fh
+
+    if allow_alphavantage:
+        av = await asyncio.to_thread(fetch_alphavantage_snapshot, sym)
+        if av:
+            return av
+    return None
+
+
+def fetch_snapshots_multisource(
+    symbols: list[str],
+    *,
+    allow_finnhub: bool = True,
+    allow_alphavantage: bool = False,
+    concurrency: int = 18,
+) -> dict[str, Optional[dict[str, Any]]]:
+    """Many single-symbol snapshots concurrently over the shared connection pool."""
+    ordered = list(dict.fromkeys(symbols))
+    coros = [
+        fetch_snapshot_multisource_async(s, allow_finnhub=allow_finnhub, allow_alphavantage=allow_alphavantage)
+        for s in ordered
+    ]
+    return dict(zip(ordered, http_pool.run(http_pool.gather_limited(coros, concurrency))))
+
+
 def cross_check_snapshot(
     symbol: str,
     primary: dict[str, Any],
@@ -319,6 +371,43 @@ def _sort_live_items(items: list[dict[str, Any]], sort: str) -> list[dict[str, A
     return sorted(items, key=lambda r: abs(r.get("change_pct_day") or 0), reverse=True)
 
 
+LIVE_DELTA_MAX_FRACTION = 0.5  # past this share of the board changed, a full resync is smaller
+
+
+def _breadth_class(row: dict[str, Any]) -> str:
+    chg = row.get("change_pct_day") or 0
+    return "up" if chg > 0.15 else "down" if chg < -0.15 else "flat"
+
+
+def _rollups(items: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """Exchange volume rollup + breadth over row dicts (movers views)."""
+    by_exchange: dict[str, dict[str, Any]] = {}
+    for r in items:
+        ex = r.get("exchange") or "Unknown"
+        bucket = by_exchange.setdefault(
+            ex,
+            {"exchange": ex, "count": 0, "volume": 0.0, "avg_change_pct": 0.0, "_chg_sum": 0.0},
+        )
+        bucket["count"] += 1
+        bucket["volume"] += float(r.get("volume") or 0)
+        bucket["_chg_sum"] += float(r.get("change_pct_day") or 0)
+    markets = []
+    for bucket in by_exchange.values():
+        n = max(1, bucket["count"])
+        markets.append(
+            {
+                "exchange": bucket["exchange"],
+                "count": bucket["count"],
+                "volume": bucket["volume"],
+                "avg_change_pct": round(bucket["_chg_sum"] / n, 2),
+            }
+        )
+    markets.sort(key=lambda m: m["volume"], reverse=True)
+    up_n = sum(1 for r in items if _breadth_class(r) == "up")
+    down_n = sum(1 for r in items if _breadth_class(r) == "down")
+    return markets, {"up": up_n, "down": down_n, "flat": max(0, len(items) - up_n - down_n)}
+
+
 def build_live_board(
     mode: str = "universe",
     asset_class: str = "",
@@ -326,13 +415,17 @@ def build_live_board(
     enrich: bool = True,
     sort: str = "abs_change",
     exchange: str = "",
+    since: Optional[int] = None,
 ) -> dict[str, Any]:
     """Live heat board backed by universe cache + optional Finnhub cross-check / news.
 
-    limit=0 means return every quoted symbol (full universe board).
+    limit=0 means return every quoted symbol (full universe board). With
+    `since` (a previous response's `version`) full-board views return only
+    rows changed after that version plus `removed` symbols (`delta: true`);
+    clients too far behind, and top-N / movers views, get the full board.
     """
-    from infobroker.universe.engine import movers, quoted_rows
-    from infobroker.universe.store import load_universe, symbol_count
+    from infobroker.universe.engine import movers
+    from infobroker.universe.snapshot import changes_since, current_snapshot
 
     mode_n = (mode or "universe").strip().lower()
     ac = (asset_class or "").strip().lower()
@@ -346,10 +439,14 @@ def build_live_board(
         limit_n = min(limit_n, 20000)
     status = provider_status()
 
+    snap = current_snapshot()
     items: list[dict[str, Any]] = []
+    delta = False
+    removed: list[str] = []
     if mode_n in {"gainers", "losers", "volume"}:
         mv_limit = limit_n if limit_n > 0 else 120
-        mv = movers(limit=min(200, mv_limit))
+        mv_classes = {"etf": "etf", "stock": "stock,adr,other"}.get(ac, "")
+        mv = movers(limit=min(200, mv_limit), asset_class=mv_classes, exchange=exch)
         if mode_n == "gainers":
             items = list((mv.get("stocks_of_day") or {}).get("gainers") or [])
             if sort_n == "abs_change":
@@ -362,56 +459,51 @@ def build_live_board(
             items = list(mv.get("volume_leaders") or [])
             if sort_n == "abs_change":
                 sort_n = "volume"
+
+        if ac == "etf":
+            items = [r for r in items if r.get("etf") or r.get("asset_class") == "etf"]
+        elif ac == "stock":
+            items = [
+                r
+                for r in items
+                if not r.get("etf") and (r.get("asset_class") or "stock") in {"stock", "adr", "other"}
+            ]
+
+        if exch:
+            items = [r for r in items if exch in (r.get("exchange") or "").lower()]
+
+        items = [r for r in items if r.get("price") is not None]
+        items = _sort_live_items(items, sort_n)
+        if limit_n > 0:
+            items = items[:limit_n]
+        markets, breadth = _rollups(items)
+        count = len(items)
     else:
-        # heat / universe — full quoted universe by default
-        items = quoted_rows()
+        # heat / universe — full quoted universe by default, ranked on columns
         if mode_n == "heat" and limit_n == 0:
             # "Top movers" convenience slice when no explicit limit
             limit_n = 180
-
-    if ac == "etf":
-        items = [r for r in items if r.get("etf") or r.get("asset_class") == "etf"]
-    elif ac == "stock":
-        items = [
-            r
-            for r in items
-            if not r.get("etf") and (r.get("asset_class") or "stock") in {"stock", "adr", "other"}
-        ]
-
-    if exch:
-        items = [r for r in items if exch in (r.get("exchange") or "").lower()]
-
-    items = [r for r in items if r.get("price") is not None]
-    items = _sort_live_items(items, sort_n)
-    if limit_n > 0:
-        items = items[:limit_n]
-
-    # Exchange volume rollup for "markets" view
-    by_exchange: dict[str, dict[str, Any]] = {}
-    for r in items:
-        ex = r.get("exchange") or "Unknown"
-        bucket = by_exchange.setdefault(
-            ex,
-            {"exchange": ex, "count": 0, "volume": 0.0, "avg_change_pct": 0.0, "_chg_sum": 0.0},
-        )
-        bucket["count"] += 1
-        bucket["volume"] += float(r.get("volume") or 0)
-        bucket["_chg_sum"] += float(r.get("change_pct_day") or 0)
-    markets = []
-    for bucket in by_exchange.values():
-        n = max(1, bucket["count"])
-        markets.append(
-            {
-                "exchange": bucket["exchange"],
-                "count": bucket["count"],
-                "volume": bucket["volume"],
-                "avg_change_pct": round(bucket["_chg_sum"] / n, 2),
-            }
-        )
-    markets.sort(key=lambda m: m["volume"], reverse=True)
+        cols = snap.columns
+        mask = cols.exchange_mask(exch)
+        if ac == "etf":
+            mask &= cols.etf | cols.asset_class_mask({"etf"})
+        elif ac == "stock":
+            mask &= ~cols.etf & cols.asset_class_mask({"stock", "adr", "other"}, default="stock")
+        idx = cols.order(sort_n, limit_n, mask)
+        # Rollups are columnar over the whole board, so deltas carry them too
+        markets, breadth = cols.exchange_rollup(idx), cols.breadth(idx)
+        count = len(idx)
+        changed = changes_since(int(since)) if since is not None and limit_n == 0 else None
+        if changed is not None and len(changed) <= LIVE_DELTA_MAX_FRACTION * max(count, 1):
+            delta = True
+            hit = idx[cols.symbol_mask(changed)[idx]] if changed else idx[:0]
+            items = cols.take(hit)
+            removed = sorted(s for s in changed if s not in snap.rows)
+        else:
+            items = cols.take(idx)
 
     cross_checked = 0
-    if enrich and status.get("finnhub") and items:
+    if enrich and not delta and status.get("finnhub") and items:
         # Cross-check the most visible tiles so Live stays honest vs Yahoo lag
         sample_n = min(12, len(items))
         for i in range(sample_n):
@@ -431,16 +523,17 @@ def build_live_board(
                         items[i]["name"] = prof["name"]
                         items[i]["industry"] = prof.get("industry")
                         items[i]["market_cap"] = prof.get("market_cap")
+                before, after = _breadth_class(row), _breadth_class(items[i])
+                if before != after:
+                    breadth[before] -= 1
+                    breadth[after] += 1
             except Exception:
                 continue
 
     news = finnhub_market_news(10) if status.get("finnhub") else []
     mkt = finnhub_market_status() if status.get("finnhub") else None
-    data = load_universe()
-    total = symbol_count(data)
-    quoted = sum(1 for v in (data.get("symbols") or {}).values() if (v.get("quote") or {}).get("price") is not None)
-    up_n = sum(1 for r in items if (r.get("change_pct_day") or 0) > 0.15)
-    down_n = sum(1 for r in items if (r.get("change_pct_day") or 0) < -0.15)
+    total = snap.total
+    quoted = snap.quoted_count
 
     return {
         "as_of": datetime.now(timezone.utc).isoformat(),
@@ -448,9 +541,12 @@ def build_live_board(
         "sort": sort_n,
         "exchange": exchange or None,
         "items": items,
-        "count": len(items),
+        "count": count,
+        "delta": delta,
+        "since": since if delta else None,
+        "removed": removed,
         "markets": markets,
-        "breadth": {"up": up_n, "down": down_n, "flat": max(0, len(items) - up_n - down_n)},
+        "breadth": breadth,
         "coverage": {
             "quoted": quoted,
             "total": total,
@@ -462,15 +558,17 @@ def build_live_board(
         "cross_checked": cross_checked,
         "market_status": mkt,
         "news": news,
-        "listings_as_of": data.get("listings_as_of"),
-        "quotes_as_of": data.get("quotes_as_of"),
+        "version": snap.version,
+        "listings_as_of": snap.listings_as_of,
+        "quotes_as_of": snap.quotes_as_of,
     }
 
-
 __all__ = [
     "build_live_board",
     "cross_check_snapshot",
     "fetch_snapshot_multisource",
+    "fetch_snapshot_multisource_async",
+    "fetch_snapshots_multisource",
     "finnhub_company_profile",
     "finnhub_market_news",
     "finnhub_market_status",
@@ -0,0 +1,202 @@
+"""Content-addressed cache for derived per-symbol results (backtests, chart packs, analyses).
+
+A result is keyed by what produced it — kind, symbol, window, parameters — plus
+the symbol's history data version (`history_cache.data_version`). New or
+revised bars move the version, so stale results simply stop matching; nothing
+has to be invalidated by hand. Entries live in an in-memory LRU backed by
+`data/results.db` (SQLite), so they survive restarts and are shared by the web
+app, MCP server and CLI. Results are stored as JSON; callers get a fresh copy
+with `cache_hit` set.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from infobroker.config import DATA_DIR
+from infobroker.data.history_cache import data_version, needs_fetch, read_versions
+from infobroker.data.singleflight import flight_key, single_flight
+
+RESULTS_DB = DATA_DIR / "results.db"
+MEMORY_ENTRIES = 256
+DISK_ENTRIES = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    payload BLOB NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_symbol ON results (symbol, version);
+CREATE INDEX IF NOT EXISTS results_used ON results (used_at);
+"""
+
+_lock = threading.Lock()
+_local = threading.local()
+_ready: set[str] = set()
+_memory: "OrderedDict[str, tuple[str, int, bytes]]" = OrderedDict()  # key → (symbol, version, payload)
+_stats: dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "uncacheable": 0}
+_puts = 0
+
+
+def _count(key: str) -> None:
+    with _lock:
+        _stats[key] += 1
+
+
+def _connect() -> sqlite3.Connection:
+    db = str(RESULTS_DB)
+    conn: Optional[sqlite3.Connection] = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "path", None) == db:
+        return conn
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    _local.conn = conn
+    _local.path = db
+    if db not in _ready:
+        with _lock:
+            if db not in _ready:
+                conn.executescript(_SCHEMA)
+                _ready.add(db)
+    return conn
+
+
+def _jsonable(v: Any) -> Any:
+    if isinstance(v, np.generic):
+        return v.item()
+    if isinstance(v, np.ndarray):
+        return v.tolist()
+    if hasattr(v, "isoformat"):
+        return v.isoformat()
+    return str(v)
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, default=_jsonable, separators=(",", ":")).encode()
+
+
+def result_key(kind: str, symbol: str, version: int, **params: Any) -> str:
+    """Digest of (kind, symbol, data version, params) — params must be JSON-serializable."""
+    blob = json.dumps([kind, symbol.upper().strip(), version, params], sort_keys=True, default=_jsonable)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _get(key: str) -> Optional[bytes]:
+    with _lock:
+        hit = _memory.get(key)
+        if hit is not None:
+            _memory.move_to_end(key)
+            _stats["memory_hits"] += 1
+            return hit[2]
+    conn = _connect()
+    row = conn.execute("SELECT symbol, version, payload FROM results WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        return None
+    conn.execute("UPDATE results SET used_at = ? WHERE key = ?", (time.time(), key))
+    _remember(key, row[0], int(row[1]), bytes(row[2]))
+    _count("disk_hits")
+    return bytes(row[2])
+
+
+def _remember(key: str, symbol: str, version: int, payload: bytes) -> None:
+    with _lock:
+        _memory[key] = (symbol, version, payload)
+        _memory.move_to_end(key)
+        while len(_memory) > MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def _put(key: str, kind: str, symbol: str, version: int, payload: bytes) -> None:
+    global _puts
+    with _lock:
+        # Results computed on an older data version can never match again
+        for k in [k for k, (s, v, _) in _memory.items() if s == symbol and v < version]:
+            del _memory[k]
+        _puts += 1
+        trim = _puts % 100 == 0
+    _remember(key, symbol, version, payload)
+    conn = _connect()
+    conn.execute("DELETE FROM results WHERE symbol = ? AND version < ?", (symbol, version))
+    conn.execute(
+        "INSERT OR REPLACE INTO results (key, kind, symbol, version, payload, used_at) VALUES (?, ?, ?, ?, ?, ?)",
+        (key, kind, symbol, version, payload, time.time()),
+    )
+    if trim:
+        conn.execute(
+            "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+            (DISK_ENTRIES,),
+        )
+
+
+def cached_result(
+    kind: str,
+    symbol: str,
+    start: str,
+    end: str,
+    compute: Callable[[], dict[str, Any]],
+    **params: Any,
+) -> dict[str, Any]:
+    """`compute()` once per (kind, symbol, start, end, params, data version).
+
+    Only consulted when the history cache can serve the window without going
+    upstream — otherwise the data may be about to change, so `compute` runs
+    (refreshing the bars) and its result is stored under the new version.
+    The result is stored under the version of the bars `compute` actually
+    read, so an append landing mid-compute can't relabel it as current.
+    Results built from a non-cached fallback provider are not stored.
+    """
+    sym = symbol.upper().strip()
+    params = {"start": start, "end": end, **params}
+    if not needs_fetch(sym, start, end):
+        version = data_version(sym)
+        if version is not None:
+            payload = _get(result_key(kind, sym, version, **params))
+            if payload is not None:
+                return {**json.loads(payload), "cache_hit": True}
+
+    def run() -> tuple[dict[str, Any], Optional[int]]:
+        with read_versions() as seen:
+            value = compute()
+        return value, seen.get((sym, "1d", 1))
+
+    out, version = single_flight(flight_key("results", kind, sym, digest=result_key(kind, sym, 0, **params)), run)
+    if version is None:
+        _count("uncacheable")
+    else:
+        _count("misses")
+        _put(result_key(kind, sym, version, **params), kind, sym, version, _dumps(out))
+    return {**out, "cache_hit": False}
+
+
+def clear_results(symbol: Optional[str] = None) -> int:
+    """Drop cached results (one symbol or everything); returns disk rows removed."""
+    sym = symbol.upper().strip() if symbol else None
+    with _lock:
+        for k in [k for k, (s, _, _) in _memory.items() if sym is None or s == sym]:
+            del _memory[k]
+    conn = _connect()
+    if sym:
+        return conn.execute("DELETE FROM results WHERE symbol = ?", (sym,)).rowcount
+    return conn.execute("DELETE FROM results").rowcount
+
+
+def result_cache_stats() -> dict[str, Any]:
+    rows = _connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    with _lock:
+        return {"path": str(RESULTS_DB), "memory_entries": len(_memory), "disk_entries": rows, **_stats}
+
+
+__all__ = ["RESULTS_DB", "cached_result", "clear_results", "result_cache_stats", "result_key"]
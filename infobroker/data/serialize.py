@@ -0,0 +1,178 @@
+"""Column-wise bar serialization and fast JSON encoding for chart payloads.
+
+Bars are converted a column at a time: NaN → null through a NumPy mask,
+rounding in one vectorized pass. Payloads come in three shapes:
+
+  rows     [{"t": ..., "o": ..., ...}, ...]            (the historical shape)
+  columns  {"t": [...], "o": [...], ...}               (smaller; chart front end opts in)
+  table    {"fields": ["t", "o", ...], "rows": [[...], ...]}   (row tuples, one key header)
+
+Board payloads (lists of row dicts under `items`) use the same shapes via
+`shape_items`.
+
+`dumps` uses orjson when installed (NumPy arrays encode natively, NaN → null)
+and falls back to the stdlib encoder.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from infobroker.data.downsample import aggregate_ohlc, bucket_starts
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None  # type: ignore[assignment]
+
+SHAPES = ("rows", "columns", "table")
+Columns = dict[str, Union[list[Any], np.ndarray]]
+
+
+def check_shape(shape: str) -> str:
+    s = (shape or "rows").strip().lower()
+    if s not in SHAPES:
+        raise ValueError(f"shape must be one of {list(SHAPES)}")
+    return s
+
+
+def _offset(seconds: int) -> str:
+    sign = "-" if seconds < 0 else "+"
+    hours, minutes = divmod(abs(seconds) // 60, 60)
+    return f"{sign}{hours:02d}:{minutes:02d}"
+
+
+def timestamps(index: Iterable[Any]) -> list[str]:
+    """`isoformat()` strings for an index; whole-second DatetimeIndexes are formatted in C."""
+    if isinstance(index, pd.DatetimeIndex) and not (index.microsecond.any() or index.nanosecond.any()):
+        local = index.tz_localize(None) if index.tz is not None else index
+        text = np.datetime_as_string(local.to_numpy().astype("datetime64[s]"), unit="s").tolist()
+        if index.tz is None:
+            return text
+        shift = ((local - index.tz_convert("UTC").tz_localize(None)) // pd.Timedelta(seconds=1)).to_numpy()
+        if not (shift % 60).any():
+            suffix = {int(o): _offset(int(o)) for o in np.unique(shift)}
+            return [t + suffix[o] for t, o in zip(text, shift.tolist())]
+    return [ts.isoformat() if hasattr(ts, "isoformat") else str(ts) for ts in index]
+
+
+def column_values(values: Any, digits: Optional[int] = None) -> list[Optional[float]]:
+    """float64 column → list with NaN as None, optionally rounded."""
+    arr = np.asarray(values, dtype=np.float64)
+    if digits is not None:
+        arr = np.round(arr, digits)
+    nan = np.isnan(arr)
+    if not nan.any():
+        return arr.tolist()
+    out = arr.astype(object)
+    out[nan] = None
+    return out.tolist()
+
+
+def bar_columns(
+    index: Iterable[Any],
+    fields: Mapping[str, Optional[Any]],
+    digits: Optional[Mapping[str, Optional[int]]] = None,
+) -> Columns:
+    """{"t": [...], key: [...]} from an index and {key: 1-D values or None (all null)}."""
+    t = timestamps(index)
+    digits = digits or {}
+    blank = [None] * len(t)
+    out: Columns = {"t": t}
+    for key, values in fields.items():
+        out[key] = blank if values is None else column_values(values, digits.get(key))
+    return out
+
+
+def rows_from_columns(cols: Columns) -> list[dict[str, Any]]:
+    keys = list(cols)
+    return [dict(zip(keys, row)) for row in zip(*(cols[k] for k in keys))]
+
+
+def shaped(cols: Columns, shape: str = "rows") -> Union[Columns, list[dict[str, Any]], dict[str, Any]]:
+    s = check_shape(shape)
+    if s == "columns":
+        return cols
+    if s == "table":
+        return {"fields": list(cols), "rows": list(zip(*cols.values()))}
+    return rows_from_columns(cols)
+
+
+def records_shaped(records: list[dict[str, Any]], shape: str = "rows") -> Any:
+    """Row dicts in `shape`; fields are the union of keys in first-seen order (missing → null)."""
+    s = check_shape(shape)
+    if s == "rows":
+        return records
+    fields = list(dict.fromkeys(k for r in records for k in r))
+    if s == "columns":
+        return {k: [r.get(k) for r in records] for k in fields}
+    return {"fields": fields, "rows": [[r.get(k) for k in fields] for r in records]}
+
+
+def shape_items(payload: dict[str, Any], shape: str = "rows", key: str = "items") -> dict[str, Any]:
+    """`payload` with its `key` list re-shaped (and `shape` recorded) unless rows were asked for."""
+    s = check_shape(shape)
+    if s == "rows" or key not in payload:
+        return payload
+    return {**payload, key: records_shaped(payload[key], s), "shape": s}
+
+
+def ohlcv_columns(df: pd.DataFrame, tail: Optional[int] = None, max_points: Optional[int] = None) -> Columns:
+    """t/o/h/l/c/v columns from an OHLCV frame (case-insensitive names; bars without a close dropped).
+
+    `max_points` merges longer ranges into that many OHLC buckets.
+    """
+    lower = {str(c).lower(): c for c in df.columns}
+    for needed in ("open", "high", "low", "close"):
+        if needed not in lower:
+            raise KeyError(needed)
+    frame = df.iloc[-tail:] if tail else df
+    close = frame[lower["close"]].to_numpy(dtype=np.float64)
+    keep = ~np.isnan(close)
+    fields: dict[str, Any] = {
+        key: frame[lower[name]].to_numpy(dtype=np.float64)[keep]
+        for key, name in (("o", "open"), ("h", "high"), ("l", "low"), ("c", "close"))
+    }
+    fields["v"] = frame[lower["volume"]].to_numpy(dtype=np.float64)[keep] if "volume" in lower else np.zeros(int(keep.sum()))
+    index = frame.index[keep]
+    if max_points and len(index) > max_points:
+        starts = bucket_starts(len(index), max_points)
+        agg = aggregate_ohlc(starts, fields["o"], fields["h"], fields["l"], fields["c"], fields["v"])
+        fields = {key: agg[key] for key in fields}
+        index = index[starts]
+    return bar_columns(index, fields)
+
+
+def _default(v: Any) -> Any:
+    if isinstance(v, np.generic):
+        return v.item()
+    if isinstance(v, np.ndarray):
+        return [None if isinstance(x, float) and x != x else x for x in v.tolist()]
+    if hasattr(v, "isoformat"):
+        return v.isoformat()
+    return str(v)
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, separators=(",", ":")).encode()
+
+
+__all__ = [
+    "SHAPES",
+    "bar_columns",
+    "check_shape",
+    "column_values",
+    "dumps",
+    "ohlcv_columns",
+    "records_shaped",
+    "rows_from_columns",
+    "shape_items",
+    "shaped",
+    "timestamps",
+]
@@ -0,0 +1,108 @@
+"""Single-flight coalescing for identical in-flight market-data fetches.
+
+Concurrent callers asking for the same (provider, endpoint, symbol, params)
+share one upstream request: the first caller issues it, everyone else waits
+for that result. Nothing is cached after the call returns. Shared results are
+handed to every waiter as-is, so treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+Key = tuple[Hashable, ...]
+
+_lock = threading.Lock()
+_calls: dict[Key, "_Call"] = {}
+_async_calls: dict[tuple[asyncio.AbstractEventLoop, Key], asyncio.Task] = {}
+_stats: dict[str, list[int]] = {}  # "provider/endpoint" → [issued, coalesced]
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def flight_key(provider: str, endpoint: str, symbol: str = "", **params: Any) -> Key:
+    return (provider, endpoint, (symbol or "").strip().upper(), tuple(sorted(params.items())))
+
+
+def _count(key: Key, leader: bool) -> None:
+    bucket = _stats.setdefault(f"{key[0]}/{key[1]}", [0, 0])
+    bucket[0 if leader else 1] += 1
+
+
+def single_flight(key: Key, fn: Callable[[], T]) -> T:
+    """Run `fn` once per key across threads; concurrent callers get its result (or error)."""
+    with _lock:
+        call = _calls.get(key)
+        leader = call is None
+        if leader:
+            call = _calls[key] = _Call()
+        _count(key, leader)
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+    try:
+        call.result = fn()
+        return call.result
+    except BaseException as exc:
+        call.error = exc
+        raise
+    finally:
+        with _lock:
+            _calls.pop(key, None)
+        call.done.set()
+
+
+async def single_flight_async(key: Key, fn: Callable[[], Awaitable[T]]) -> T:
+    """Coroutine flavour: callers on the same event loop await one in-flight `fn()`.
+
+    `fn()` runs as its own task, so a caller that is cancelled (or times out)
+    only stops waiting; the shared fetch keeps going for everyone else.
+    """
+    loop = asyncio.get_running_loop()
+    slot = (loop, key)
+    with _lock:
+        task = _async_calls.get(slot)
+        leader = task is None
+        if leader:
+            task = _async_calls[slot] = loop.create_task(fn())
+            task.add_done_callback(lambda t: _async_done(slot, t))
+        _count(key, leader)
+    return await asyncio.shield(task)
+
+
+def _async_done(slot: tuple[asyncio.AbstractEventLoop, Key], task: asyncio.Task) -> None:
+    with _lock:
+        if _async_calls.get(slot) is task:
+            del _async_calls[slot]
+    if not task.cancelled():
+        task.exception()  # mark retrieved when every waiter had already left
+
+
+def singleflight_stats() -> dict[str, Any]:
+    """Issued vs coalesced upstream calls, overall and per provider/endpoint."""
+    with _lock:
+        by = {k: {"issued": v[0], "coalesced": v[1]} for k, v in sorted(_stats.items())}
+    issued = sum(v["issued"] for v in by.values())
+    coalesced = sum(v["coalesced"] for v in by.values())
+    total = issued + coalesced
+    return {
+        "issued": issued,
+        "coalesced": coalesced,
+        "coalesced_ratio": round(coalesced / total, 4) if total else 0.0,
+        "by_endpoint": by,
+    }
+
+
+__all__ = ["flight_key", "single_flight", "single_flight_async", "singleflight_stats"]
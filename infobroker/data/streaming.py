@@ -0,0 +1,343 @@
+"""Incremental (O(1) per bar) indicators that track TA-Lib.
+
+Each indicator follows TA-Lib's own recurrence and operation order, so values
+match `talib.*` over the same bars (see `scripts/check_streaming.py`).
+`update()` commits a closed bar; `preview()` returns what the value would be if
+the forming bar closed at this price, without touching state — call it on
+every tick. Seed by replaying history through `update()` (`IndicatorSet.seed`),
+which is a single pass over the backfill.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+NAN = float("nan")
+
+
+class StreamingSMA:
+    """TA-Lib SMA: running total of the last `period - 1` values plus the new one."""
+
+    __slots__ = ("period", "_window", "_total")
+
+    def __init__(self, period: int):
+        self.period = int(period)
+        self._window: deque[float] = deque(maxlen=self.period - 1)
+        self._total = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return len(self._window) >= self.period - 1
+
+    def update(self, x: float) -> float:
+        if not self.ready:
+            self._total += x
+            self._window.append(x)
+            return NAN
+        temp = self._total + x
+        trailing = self._window[0] if self._window else x
+        self._total = temp - trailing
+        self._window.append(x)
+        return temp / self.period
+
+    def preview(self, x: float) -> float:
+        return (self._total + x) / self.period if self.ready else NAN
+
+
+class StreamingEMA:
+    """TA-Lib EMA, seeded with the SMA of the `period` values ending at bar `seed_at`
+    (default: the `period`-th bar; MACD seeds its fast EMA on the slow one's bar)."""
+
+    __slots__ = ("period", "seed_at", "k", "_recent", "_count", "value")
+
+    def __init__(self, period: int, seed_at: Optional[int] = None):
+        self.period = int(period)
+        self.seed_at = int(seed_at or period)
+        self.k = 2.0 / (self.period + 1)
+        self._recent: deque[float] = deque(maxlen=self.period)
+        self._count = 0
+        self.value = NAN
+
+    def _seed(self, values: Iterable[float]) -> float:
+        total = 0.0
+        for v in values:
+            total += v
+        return total / self.period
+
+    def update(self, x: float) -> float:
+        self._count += 1
+        if self._count < self.seed_at:
+            self._recent.append(x)
+            return NAN
+        if self._count == self.seed_at:
+            self._recent.append(x)
+            self.value = self._seed(self._recent)
+            self._recent.clear()
+        else:
+            self.value = ((x - self.value) * self.k) + self.value
+        return self.value
+
+    def preview(self, x: float) -> float:
+        n = self._count + 1
+        if n < self.seed_at:
+            return NAN
+        if n == self.seed_at:
+            return self._seed([*self._recent, x][-self.period :])
+        return ((x - self.value) * self.k) + self.value
+
+
+class StreamingRSI:
+    """TA-Lib (Wilder) RSI."""
+
+    __slots__ = ("period", "_prev", "_n", "_gain", "_loss")
+
+    def __init__(self, period: int = 14):
+        self.period = int(period)
+        self._prev = NAN
+        self._n = 0  # price changes seen
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def _step(self, x: float) -> tuple[float, float, float]:
+        d = x - self._prev
+        gain, loss = self._gain, self._loss
+        if self._n < self.period:
+            # Seed: plain sums of the first `period` changes, averaged on the last one
+            if d < 0:
+                loss -= d
+            else:
+                gain += d
+            if self._n + 1 < self.period:
+                return NAN, gain, loss
+            loss /= self.period
+            gain /= self.period
+        else:
+            loss *= self.period - 1
+            gain *= self.period - 1
+            if d < 0:
+                loss -= d
+            else:
+                gain += d
+            loss /= self.period
+            gain /= self.period
+        total = gain + loss
+        return (100.0 * (gain / total) if total != 0.0 else 0.0), gain, loss
+
+    def update(self, x: float) -> float:
+        if math.isnan(self._prev):
+            self._prev = x
+            return NAN
+        out, self._gain, self._loss = self._step(x)
+        self._n += 1
+        self._prev = x
+        return out
+
+    def preview(self, x: float) -> float:
+        if math.isnan(self._prev):
+            return NAN
+        return self._step(x)[0]
+
+
+class StreamingMACD:
+    """TA-Lib MACD: both EMAs start on the slow EMA's first bar; outputs start with the signal."""
+
+    __slots__ = ("fast", "slow", "signal_ema")
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = StreamingEMA(fast, seed_at=slow)
+        self.slow = StreamingEMA(slow)
+        self.signal_ema = StreamingEMA(signal)
+
+    @staticmethod
+    def _out(line: float, sig: float) -> tuple[float, float, float]:
+        if math.isnan(sig):
+            return NAN, NAN, NAN
+        return line, sig, line - sig
+
+    def update(self, x: float) -> tuple[float, float, float]:
+        f, s = self.fast.update(x), self.slow.update(x)
+        if math.isnan(s):
+            return NAN, NAN, NAN
+        line = f - s
+        return self._out(line, self.signal_ema.update(line))
+
+    def preview(self, x: float) -> tuple[float, float, float]:
+        s = self.slow.preview(x)
+        if math.isnan(s):
+            return NAN, NAN, NAN
+        line = self.fast.preview(x) - s
+        return self._out(line, self.signal_ema.preview(line))
+
+
+class StreamingATR:
+    """TA-Lib ATR: SMA of the first `period` true ranges, then Wilder smoothing."""
+
+    __slots__ = ("period", "_prev_close", "_seed", "value")
+
+    def __init__(self, period: int = 14):
+        self.period = int(period)
+        self._prev_close = NAN
+        self._seed = StreamingSMA(period)
+        self.value = NAN
+
+    def _true_range(self, high: float, low: float) -> float:
+        pc = self._prev_close
+        return max(high - low, abs(pc - high), abs(pc - low))
+
+    def _step(self, tr: float, seed_value: float) -> float:
+        if math.isnan(self.value):
+            return seed_value
+        return (self.value * (self.period - 1) + tr) / self.period
+
+    def update(self, high: float, low: float, close: float) -> float:
+        if math.isnan(self._prev_close):
+            self._prev_close = close
+            return NAN
+        tr = self._true_range(high, low)
+        seed = self._seed.update(tr) if math.isnan(self.value) else NAN
+        self.value = self._step(tr, seed)
+        self._prev_close = close
+        return self.value
+
+    def preview(self, high: float, low: float, close: float) -> float:
+        if math.isnan(self._prev_close):
+            return NAN
+        tr = self._true_range(high, low)
+        seed = self._seed.preview(tr) if math.isnan(self.value) else NAN
+        return self._step(tr, seed)
+
+
+class StreamingBollinger:
+    """TA-Lib BBANDS (SMA middle, population stddev from running sums)."""
+
+    __slots__ = ("period", "nbdev", "_sma", "_squares", "_total2")
+
+    def __init__(self, period: int = 20, nbdev: float = 2.0):
+        self.period = int(period)
+        self.nbdev = float(nbdev)
+        self._sma = StreamingSMA(period)
+        self._squares: deque[float] = deque(maxlen=self.period - 1)
+        self._total2 = 0.0
+
+    def _bands(self, mid: float, total2: float) -> tuple[float, float, float]:
+        mean2 = total2 / self.period - mid * mid
+        std = math.sqrt(mean2) if mean2 > 0.0 else 0.0
+        if self.nbdev == 1.0:
+            return mid + std, mid, mid - std
+        band = std * self.nbdev
+        return mid + band, mid, mid - band
+
+    def update(self, x: float) -> tuple[float, float, float]:
+        sq = x * x
+        if not self._sma.ready:
+            self._sma.update(x)
+            self._total2 += sq
+            self._squares.append(sq)
+            return NAN, NAN, NAN
+        mid = self._sma.update(x)
+        total2 = self._total2 + sq
+        self._total2 = total2 - (self._squares[0] if self._squares else sq)
+        self._squares.append(sq)
+        return self._bands(mid, total2)
+
+    def preview(self, x: float) -> tuple[float, float, float]:
+        if not self._sma.ready:
+            return NAN, NAN, NAN
+        return self._bands(self._sma.preview(x), self._total2 + x * x)
+
+
+class IndicatorSet:
+    """The `enrich_ohlcv` indicator set, maintained bar by bar."""
+
+    def __init__(self) -> None:
+        self.sma20 = StreamingSMA(20)
+        self.sma50 = StreamingSMA(50)
+        self.ema12 = StreamingEMA(12)
+        self.ema26 = StreamingEMA(26)
+        self.rsi14 = StreamingRSI(14)
+        self.macd = StreamingMACD()
+        self.atr14 = StreamingATR(14)
+        self.bb = StreamingBollinger(20, 2.0)
+        self.bars = 0
+
+    def seed(self, df: pd.DataFrame) -> dict[str, Optional[float]]:
+        """Replay an OHLCV frame (TA-Lib backfill window); returns the last bar's values."""
+        cols = [df["High"], df["Low"], df["Close"]] if {"High", "Low"}.issubset(df.columns) else [df["Close"]] * 3
+        out: dict[str, Optional[float]] = {}
+        for h, l, c in np.column_stack([np.asarray(s, dtype=np.float64) for s in cols]).tolist():
+            if not math.isnan(c):
+                out = self.update(h, l, c)
+        return out
+
+    def update(self, high: float, low: float, close: float) -> dict[str, Optional[float]]:
+        """Commit one closed bar."""
+        self.bars += 1
+        return self._values(
+            self.sma20.update(close),
+            self.sma50.update(close),
+            self.ema12.update(close),
+            self.ema26.update(close),
+            self.rsi14.update(close),
+            self.macd.update(close),
+            self.atr14.update(high, low, close),
+            self.bb.update(close),
+            close,
+        )
+
+    def preview(self, high: float, low: float, close: float) -> dict[str, Optional[float]]:
+        """Values for the still-forming bar (per tick); state is unchanged."""
+        return self._values(
+            self.sma20.preview(close),
+            self.sma50.preview(close),
+            self.ema12.preview(close),
+            self.ema26.preview(close),
+            self.rsi14.preview(close),
+            self.macd.preview(close),
+            self.atr14.preview(high, low, close),
+            self.bb.preview(close),
+            close,
+        )
+
+    @staticmethod
+    def _values(sma20, sma50, ema12, ema26, rsi, macd, atr, bb, close) -> dict[str, Optional[float]]:
+        def r(v: float) -> Optional[float]:
+            return None if math.isnan(v) else round(v, 4)
+
+        return {
+            "close": r(close),
+            "rsi_14": r(rsi),
+            "sma_20": r(sma20),
+            "sma_50": r(sma50),
+            "ema_12": r(ema12),
+            "ema_26": r(ema26),
+            "macd": r(macd[0]),
+            "macd_signal": r(macd[1]),
+            "macd_hist": r(macd[2]),
+            "atr_14": r(atr),
+            "bb_upper": r(bb[0]),
+            "bb_mid": r(bb[1]),
+            "bb_lower": r(bb[2]),
+        }
+
+
+def seeded(df: pd.DataFrame) -> IndicatorSet:
+    ind = IndicatorSet()
+    ind.seed(df)
+    return ind
+
+
+__all__ = [
+    "IndicatorSet",
+    "StreamingATR",
+    "StreamingBollinger",
+    "StreamingEMA",
+    "StreamingMACD",
+    "StreamingRSI",
+    "StreamingSMA",
+    "seeded",
+]
@@ -0,0 +1,218 @@
+"""Stale-while-revalidate caching for slow upstream-backed calls.
+
+`@swr_cache(name, soft_ttl, hard_ttl)` keeps the last good result per key.
+Younger than `soft_ttl` it is returned as-is; between the TTLs it is returned
+immediately (marked stale) while one background refresh runs; past `hard_ttl`
+(or never fetched) the caller waits for a fresh call, coalesced with
+`single_flight`. A refresh that raises — or whose result `accept` rejects —
+keeps the previous value, so a provider outage serves stale data until the
+hard TTL instead of blocking or failing the desk. Failed refreshes back off
+for `soft_ttl` before the next attempt.
+
+Calling the decorated function returns the value; `.fetch(...)` returns an
+`SWRResult` with `stale` / `age_sec` for endpoints to surface. Shared values
+are handed out as-is, so treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+from infobroker.data.singleflight import single_flight
+
+T = TypeVar("T")
+
+_REFRESH_WORKERS = 4
+
+_lock = threading.Lock()
+_pool: Optional[ThreadPoolExecutor] = None
+_caches: dict[str, "SWRCache"] = {}
+
+
+class SWRResult(Generic[T]):
+    __slots__ = ("value", "stale", "age_sec", "error")
+
+    def __init__(self, value: T, stale: bool, age_sec: float, error: Optional[str] = None):
+        self.value = value
+        self.stale = stale
+        self.age_sec = age_sec
+        self.error = error
+
+    def meta(self) -> dict[str, Any]:
+        """`stale` / `age_sec` (+ `refresh_error`) to merge into a response."""
+        out: dict[str, Any] = {"stale": self.stale, "age_sec": round(self.age_sec, 1)}
+        if self.error:
+            out["refresh_error"] = self.error
+        return out
+
+
+class _Entry:
+    __slots__ = ("value", "at", "retry_at", "refreshing", "error")
+
+    def __init__(self, value: Any, at: float):
+        self.value = value
+        self.at = at
+        self.retry_at = 0.0
+        self.refreshing = False
+        self.error: Optional[str] = None
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=_REFRESH_WORKERS, thread_name_prefix="swr")
+        return _pool
+
+
+def _default_key(*args: Any, **kwargs: Any) -> Hashable:
+    return (args, tuple(sorted(kwargs.items())))
+
+
+class SWRCache:
+    """Per-function entry table, TTLs and counters (see `swr_cache`)."""
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        soft_ttl: float,
+        hard_ttl: float,
+        key: Optional[Callable[..., Hashable]] = None,
+        accept: Optional[Callable[[Any], bool]] = None,
+        max_entries: int = 256,
+    ):
+        if hard_ttl < soft_ttl:
+            raise ValueError(f"{name}: hard_ttl must be >= soft_ttl")
+        self.name = name
+        self.fn = fn
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.key = key or _default_key
+        self.accept = accept
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"fresh": 0, "stale": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0, "rejected": 0}
+
+    def _call(self, args: tuple, kwargs: dict) -> tuple[Any, bool]:
+        """Run the wrapped function; (value, accepted)."""
+        value = self.fn(*args, **kwargs)
+        return value, self.accept is None or bool(self.accept(value))
+
+    def _store(self, k: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[k] = _Entry(value, time.monotonic())
+            self._entries.move_to_end(k)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _refresh(self, k: Hashable, entry: _Entry, args: tuple, kwargs: dict) -> None:
+        error: Optional[str] = None
+        try:
+            value, ok = self._call(args, kwargs)
+            if ok:
+                self._store(k, value)
+            else:
+                error = "upstream returned no usable data"
+        except Exception as exc:  # noqa: BLE001 — keep serving the last good value
+            error = str(exc)[:160] or type(exc).__name__
+        with self._lock:
+            entry.refreshing = False
+            if error is not None:
+                entry.error = error
+                entry.retry_at = time.monotonic() + self.soft_ttl
+                self.stats["refresh_errors"] += 1
+
+    def fetch(self, *args: Any, **kwargs: Any) -> SWRResult:
+        k = self.key(*args, **kwargs)
+        now = time.monotonic()
+        refresh = False
+        with self._lock:
+            entry = self._entries.get(k)
+            age = now - entry.at if entry is not None else 0.0
+            if entry is not None and age < self.hard_ttl:
+                self._entries.move_to_end(k)
+                if age < self.soft_ttl:
+                    self.stats["fresh"] += 1
+                    return SWRResult(entry.value, False, age)
+                self.stats["stale"] += 1
+                if not entry.refreshing and now >= entry.retry_at:
+                    entry.refreshing = refresh = True
+                    self.stats["refreshes"] += 1
+        if entry is not None and age < self.hard_ttl:
+            if refresh:
+                try:
+                    _executor().submit(self._refresh, k, entry, args, kwargs)
+                except RuntimeError:  # interpreter shutting down
+                    entry.refreshing = False
+            return SWRResult(entry.value, True, age, entry.error)
+
+        with self._lock:
+            self.stats["misses"] += 1
+        value, ok = single_flight(("swr", self.name, k), lambda: self._call(args, kwargs))
+        if ok:
+            self._store(k, value)
+        else:
+            with self._lock:
+                self.stats["rejected"] += 1
+        return SWRResult(value, False, 0.0)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "entries": len(self._entries),
+                "soft_ttl": self.soft_ttl,
+                "hard_ttl": self.hard_ttl,
+            }
+
+
+def swr_cache(
+    name: str,
+    soft_ttl: float,
+    hard_ttl: float,
+    key: Optional[Callable[..., Hashable]] = None,
+    accept: Optional[Callable[[Any], bool]] = None,
+    max_entries: int = 256,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorate a sync function with stale-while-revalidate caching.
+
+    `key` maps the call's arguments to a cache key (default: the arguments
+    themselves); `accept` rejects results that signal an upstream failure
+    without raising (e.g. an empty batch), so they never replace a good value.
+    """
+
+    def wrap(fn: Callable[..., T]) -> Callable[..., T]:
+        cache = SWRCache(name, fn, soft_ttl, hard_ttl, key=key, accept=accept, max_entries=max_entries)
+        with _lock:
+            _caches[name] = cache
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            return cache.fetch(*args, **kwargs).value
+
+        wrapper.fetch = cache.fetch  # type: ignore[attr-defined]
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return wrap
+
+
+def swr_stats() -> dict[str, Any]:
+    """Fresh / stale / miss counters per cached function."""
+    with _lock:
+        caches = list(_caches.values())
+    return {c.name: c.snapshot() for c in caches}
+
+
+__all__ = ["SWRCache", "SWRResult", "swr_cache", "swr_stats"]
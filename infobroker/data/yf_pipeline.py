@@ -6,12 +6,16 @@ Canonical market-data pipeline:
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 import pandas as pd
 import yfinance as yf
 
-from infobroker.data.indicators import enrich_ohlcv, latest_snapshot
+from infobroker.data.history_cache import cached_history, needs_fetch, period_window, store_history
+from infobroker.data.indicators import SNAPSHOT_PLAN
+from infobroker.data.result_cache import cached_result
+from infobroker.data.serialize import check_shape, shaped
 
 
 def download_history(
@@ -22,13 +26,44 @@ def download_history(
     period: Optional[str] = None,
     interval: str = "1d",
     auto_adjust: bool = True,
+    cache: bool = True,
 ) -> pd.DataFrame:
     """
     Download OHLCV with yfinance into a clean Pandas DataFrame.
 
     Prefer `start`/`end` (YYYY-MM-DD) or a yfinance `period` (e.g. '6mo', '1y').
+    Served through the local history cache (`data/history.db`) unless
+    `cache=False`; only bars missing from the cache are fetched upstream.
     """
     sym = symbol.upper().strip()
+    if not period and (not start or not end):
+        raise ValueError("Provide start+end or period")
+    window = (start, end) if not period else period_window(period)
+    if not cache or window is None:
+        df = _download_upstream(sym, start=start, end=end, period=period, interval=interval, auto_adjust=auto_adjust)
+        if window is None and period:
+            store_history(sym, df, df.index[0].strftime("%Y-%m-%d"), _tomorrow(), interval, auto_adjust)
+        return df
+
+    def fetch(s: str, first: str, last: str) -> pd.DataFrame:
+        return _download_upstream(s, start=first, end=last, interval=interval, auto_adjust=auto_adjust)
+
+    return cached_history(sym, window[0], window[1], fetch, interval=interval, auto_adjust=auto_adjust)
+
+
+def _tomorrow() -> str:
+    return (datetime.now(timezone.utc).date() + timedelta(days=1)).isoformat()
+
+
+def _download_upstream(
+    sym: str,
+    *,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    period: Optional[str] = None,
+    interval: str = "1d",
+    auto_adjust: bool = True,
+) -> pd.DataFrame:
     kwargs: dict[str, Any] = {
         "interval": interval,
         "auto_adjust": auto_adjust,
@@ -38,8 +73,6 @@ def download_history(
     if period:
         kwargs["period"] = period
     else:
-        if not start or not end:
-            raise ValueError("Provide start+end or period")
         kwargs["start"] = start
         kwargs["end"] = end
 
@@ -54,7 +87,11 @@ def download_history(
 
     if df is None or df.empty:
         raise ValueError(f"yfinance returned no data for {sym}")
+    return normalize_ohlcv(df, sym)
+
 
+def normalize_ohlcv(df: pd.DataFrame, sym: str) -> pd.DataFrame:
+    """yfinance frame → float Open/High/Low/Close/Volume indexed by 'Date'."""
     if isinstance(df.columns, pd.MultiIndex):
         df.columns = df.columns.get_level_values(0)
 
@@ -68,11 +105,96 @@ def download_history(
         df["Volume"] = 0.0
 
     df = df[needed + ["Volume"]].astype(float).dropna(how="any")
+    if df.empty:
+        raise ValueError(f"yfinance returned no data for {sym}")
     df.index = pd.to_datetime(df.index)
     df.index.name = "Date"
     return df.sort_index()
 
 
+def download_history_batch(
+    symbols: list[str],
+    *,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    period: Optional[str] = None,
+    interval: str = "1d",
+    auto_adjust: bool = True,
+    chunk_size: int = 80,
+    cache: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """
+    OHLCV for many tickers: symbols the history cache can't serve are fetched
+    with multi-ticker `yf.download` calls (`chunk_size` per call), split into
+    per-symbol frames and written to the cache. Symbols with no data are omitted
+    (no per-symbol retry here; see `market.fetch_ohlcv_many`).
+    """
+    syms = list(dict.fromkeys(s.upper().strip() for s in symbols if s and s.strip()))
+    if not period and (not start or not end):
+        raise ValueError("Provide start+end or period")
+    window = (start, end) if not period else period_window(period)
+    use_cache = cache and window is not None
+    todo = [s for s in syms if not use_cache or needs_fetch(s, window[0], window[1], interval, auto_adjust)]
+
+    fetched: dict[str, pd.DataFrame] = {}
+    for i in range(0, len(todo), max(1, chunk_size)):
+        fetched.update(_download_chunk(todo[i : i + chunk_size], start=start, end=end, period=period, interval=interval, auto_adjust=auto_adjust))
+    if not use_cache:
+        return fetched
+
+    out: dict[str, pd.DataFrame] = {}
+    pending = set(todo)
+    for sym in syms:
+        if sym in fetched:
+            store_history(sym, fetched[sym], window[0], window[1], interval, auto_adjust)
+        elif sym in pending:
+            continue  # batch call had nothing for it — leave the fallback to the caller
+        try:
+            out[sym] = download_history(sym, start=window[0], end=window[1], interval=interval, auto_adjust=auto_adjust)
+        except Exception:  # noqa: BLE001
+            continue
+    return out
+
+
+def _download_chunk(
+    syms: list[str],
+    *,
+    start: Optional[str],
+    end: Optional[str],
+    period: Optional[str],
+    interval: str,
+    auto_adjust: bool,
+) -> dict[str, pd.DataFrame]:
+    if not syms:
+        return {}
+    kwargs: dict[str, Any] = {
+        "interval": interval,
+        "auto_adjust": auto_adjust,
+        "progress": False,
+        "threads": True,
+        "group_by": "ticker",
+    }
+    if period:
+        kwargs["period"] = period
+    else:
+        kwargs["start"] = start
+        kwargs["end"] = end
+    try:
+        raw = yf.download(syms, **kwargs)
+    except Exception:  # noqa: BLE001
+        return {}
+    if raw is None or raw.empty:
+        return {}
+    out: dict[str, pd.DataFrame] = {}
+    for sym in syms:
+        try:
+            part = raw[sym] if isinstance(raw.columns, pd.MultiIndex) else raw
+            out[sym] = normalize_ohlcv(part.copy(), sym)
+        except (KeyError, ValueError):
+            continue
+    return out
+
+
 def download_quote(symbol: str) -> dict[str, Any]:
     """Real-time-ish quote via yfinance + Pandas last bar."""
     sym = symbol.upper().strip()
@@ -108,55 +230,39 @@ def analyze_symbol(
     start: Optional[str] = None,
     end: Optional[str] = None,
     period: str = "1y",
+    cache: bool = True,
+    shape: str = "rows",
 ) -> dict[str, Any]:
     """
     Full analysis pack: yfinance download → Pandas → TA-Lib enrich.
+
+    `shape="columns"` returns `bars` column-wise. Served from the result cache
+    while the symbol's bars are unchanged (`cache_hit` in the result);
+    `period="max"` is always recomputed.
     """
+    shape = check_shape(shape)
+    window = (start, end) if start and end else period_window(period)
+    if not cache or window is None:
+        return _analyze(symbol, start, end, period, shape)
+    return cached_result(
+        "analysis", symbol, window[0], window[1], lambda: _analyze(symbol, start, end, period, shape), shape=shape
+    )
+
+
+def _analyze(symbol: str, start: Optional[str], end: Optional[str], period: str, shape: str = "rows") -> dict[str, Any]:
     if start and end:
         df = download_history(symbol, start=start, end=end)
     else:
         df = download_history(symbol, period=period)
-    enriched = enrich_ohlcv(df)
-    snap = latest_snapshot(enriched)
-    # Tail for API consumers (avoid huge payloads)
-    tail = enriched.tail(120).copy()
-    records = []
-    for ts, row in tail.iterrows():
-        records.append(
-            {
-                "t": ts.isoformat() if hasattr(ts, "isoformat") else str(ts),
-                "o": float(row["Open"]),
-                "h": float(row["High"]),
-                "l": float(row["Low"]),
-                "c": float(row["Close"]),
-                "v": float(row["Volume"]),
-                "sma20": _num(row.get("SMA_20")),
-                "sma50": _num(row.get("SMA_50")),
-                "sma200": _num(row.get("SMA_200")),
-                "rsi": _num(row.get("RSI_14")),
-                "macd": _num(row.get("MACD")),
-                "macd_signal": _num(row.get("MACD_signal")),
-                "macd_hist": _num(row.get("MACD_hist")),
-                "atr": _num(row.get("ATR_14")),
-                "bb_upper": _num(row.get("BB_upper")),
-                "bb_lower": _num(row.get("BB_lower")),
-            }
-        )
+    enriched = SNAPSHOT_PLAN.run(df)
     return {
         "symbol": symbol.upper(),
         "rows": len(enriched),
         "start": str(enriched.index[0].date()) if len(enriched) else None,
         "end": str(enriched.index[-1].date()) if len(enriched) else None,
-        "snapshot": snap,
-        "bars": records,
+        "snapshot": enriched.snapshot(),
+        # Tail for API consumers (avoid huge payloads)
+        "shape": shape,
+        "bars": shaped(enriched.bar_columns(max(0, len(enriched) - 120)), shape),
         "stack": ["yfinance", "pandas", "TA-Lib"],
     }
-
-
-def _num(v: Any) -> float | None:
-    try:
-        if v is None or (isinstance(v, float) and pd.isna(v)):
-            return None
-        return round(float(v), 4)
-    except Exception:
-        return None
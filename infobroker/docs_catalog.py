@@ -23,7 +23,7 @@ Infobroker is a **local trading desk**: learn chart/risk skills, research US equ
 | Piece | Role |
 |-------|------|
 | FastAPI desk (`python -m infobroker.web.app`) | UI + REST API on `http://127.0.0.1:8000` |
-| Universe engine | NASDAQ Trader listings + rotating Yahoo quote cache |
+| Universe engine | NASDAQ Trader listings + scheduled Yahoo quote cache |
 | Paper broker | Local ledger — no keys required |
 | Grapevine | Ollama assistant (`arriella-grapevine`) with desk tools |
 | MCP server | Optional Cursor tool bridge (`python -m infobroker.mcp_server`) |
@@ -290,7 +290,7 @@ Free Yahoo / Finnhub / Alpha Vantage tiers punish aggressive polling. Infobroker
 
 ## Strategies
 
-1. **Universe cache** — rotating batches (~160 symbols / ~35s) into `data/universe.json`
+1. **Universe cache** — adaptive due-time batches (40–400 symbols / 15–180s) into `data/universe.db` (SQLite WAL, per-row upserts)
 2. **Shared tick cache** — ~0.85s when US open, ~12s when closed
 3. **Bulk Yahoo first**, per-symbol only on misses
 4. **Cascade** Yahoo → Finnhub → Alpha Vantage (AV never for full universe)
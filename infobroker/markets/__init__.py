@@ -1,13 +1,28 @@
 """Global market sessions, clocks, and lightweight realtime ticks."""
 
-from infobroker.markets.boards import build_market_board, list_market_focuses
-from infobroker.markets.realtime import fetch_intraday_bars, fetch_live_tick
+from infobroker.markets.boards import build_market_board, focus_symbols, list_market_focuses
+from infobroker.markets.hub import MAX_SYMBOLS_PER_SUBSCRIPTION, TickHub, tick_hub, tick_hub_stats
+from infobroker.markets.realtime import (
+    fetch_intraday_bars,
+    fetch_live_tick,
+    fetch_live_ticks,
+    live_indicators,
+    seed_live_indicators,
+)
 from infobroker.markets.sessions import market_clocks
 
 __all__ = [
+    "MAX_SYMBOLS_PER_SUBSCRIPTION",
+    "TickHub",
     "build_market_board",
     "fetch_intraday_bars",
     "fetch_live_tick",
+    "fetch_live_ticks",
+    "focus_symbols",
     "list_market_focuses",
+    "live_indicators",
     "market_clocks",
+    "seed_live_indicators",
+    "tick_hub",
+    "tick_hub_stats",
 ]
@@ -5,8 +5,9 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from infobroker.data.highlights import fetch_yahoo_quotes_bulk
+from infobroker.data.swr import swr_cache
 from infobroker.markets.sessions import market_clocks
-from infobroker.universe.engine import quoted_rows
+from infobroker.universe.snapshot import current_snapshot
 
 # US exchange filters (substring match on listing exchange)
 _US_VENUES: dict[str, dict[str, Any]] = {
@@ -169,18 +170,16 @@ def _sort_rows(items: list[dict[str, Any]], sort: str) -> list[dict[str, Any]]:
 
 
 def _from_universe(exchange: str, limit: int, sort: str) -> list[dict[str, Any]]:
-    exch = (exchange or "").strip().lower()
-    rows = quoted_rows()
-    if exch:
-        rows = [r for r in rows if exch in (r.get("exchange") or "").lower()]
-    rows = [r for r in rows if r.get("price") is not None]
-    return _sort_rows(rows, sort)[: max(1, min(limit, 2000))]
+    cols = current_snapshot().columns
+    idx = cols.order(sort or "volume", max(1, min(limit, 2000)), cols.exchange_mask(exchange), default="volume")
+    return cols.take(idx)
 
 
-def _from_symbols(symbols: list[str], label: str, limit: int, sort: str) -> list[dict[str, Any]]:
-    bulk = fetch_yahoo_quotes_bulk(symbols[:80])
+@swr_cache("foreign_boards", soft_ttl=15, hard_ttl=15 * 60, accept=bool, max_entries=64)
+def _from_symbols(symbols: tuple[str, ...], label: str, limit: int, sort: str) -> list[dict[str, Any]]:
+    bulk = fetch_yahoo_quotes_bulk(list(symbols[:80]))
     # Prefer universe cache when present (sparklines / exchange)
-    by_sym = {r["symbol"]: r for r in quoted_rows()}
+    by_sym = current_snapshot().rows
     rows: list[dict[str, Any]] = []
     for sym in symbols:
         cached = by_sym.get(sym)
@@ -239,12 +238,14 @@ def build_market_board(
         None,
     )
 
+    freshness = {"stale": False, "age_sec": 0.0}
     if key in _US_VENUES:
         items = _from_universe(meta.get("exchange") or "", limit, sort)
         kind = "us"
         note = "US listings from the universe quote cache."
     else:
-        items = _from_symbols(list(meta.get("symbols") or []), meta["label"], limit, sort)
+        res = _from_symbols.fetch(tuple(meta.get("symbols") or ()), meta["label"], limit, sort)
+        items, freshness = res.value, res.meta()
         kind = "foreign"
         note = meta.get("note") or "Regional proxies."
 
@@ -260,6 +261,7 @@ def build_market_board(
         "session": sess,
         "is_open": bool(sess and sess.get("is_open")),
         "sort": sort,
+        **freshness,
         "items": items,
         "count": len(items),
         "breadth": {"up": up_n, "down": down_n, "flat": max(0, len(items) - up_n - down_n)},
@@ -268,6 +270,17 @@ def build_market_board(
     }
 
 
+def focus_symbols(focus: str = "us", limit: int = 30) -> list[str]:
+    """Symbols behind a board focus: proxy list for foreign sessions, top volume for US venues."""
+    key = (focus or "us").strip().lower()
+    meta = _ALL_FOCUSES.get(key)
+    if meta is None:
+        raise ValueError(f"Unknown board focus: {focus}. Choose from {list(_ALL_FOCUSES)}")
+    if key in _US_VENUES:
+        return [r["symbol"] for r in _from_universe(meta.get("exchange") or "", limit, "volume")]
+    return list(meta.get("symbols") or [])[: max(1, limit)]
+
+
 def resolve_focus_from_session(session_id: str) -> Optional[str]:
     """Map clock session id (nyse/london/…) to a board focus key."""
     sid = (session_id or "").strip().lower()
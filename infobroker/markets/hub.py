@@ -0,0 +1,239 @@
+"""Multiplexed tick hub: one upstream poller for every open tick stream.
+
+Clients `open()` a `Subscription` and subscribe / unsubscribe symbols on it;
+the hub keeps a reference count per symbol and a single asyncio task polls
+the distinct symbols in batched quote requests (`fetch_live_ticks`) at the
+cadence `market_clocks` sets (~1s while US cash is open, ~12s otherwise).
+Each tick is fanned out to every subscription holding that symbol, so
+upstream load follows distinct symbols, not open tabs. The poller starts
+with the first subscription and stops when the last one closes.
+
+Live indicators need a 5-day 1m history seed per symbol. Seeds run
+concurrently in the background (`_SEED_CONCURRENCY`), never inside the quote
+poll; a symbol's ticks carry `indicators: null` until its seed lands.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from typing import Any, Iterable, Optional
+
+from infobroker.data.http_pool import gather_limited
+from infobroker.markets.realtime import (
+    _MIN_TICK_SEC_CLOSED,
+    _MIN_TICK_SEC_OPEN,
+    _norm,
+    fetch_live_ticks,
+    live_indicators,
+    seed_live_indicators,
+)
+from infobroker.markets.sessions import market_clocks
+
+MAX_SYMBOLS_PER_SUBSCRIPTION = 50
+_QUEUE_SIZE = 256
+_SEED_CONCURRENCY = 8
+
+
+class Subscription:
+    """One client's view of the hub: a symbol set and a bounded message queue.
+
+    A slow consumer loses its oldest queued ticks rather than holding up the
+    poller (the next tick for a symbol supersedes the last one anyway).
+    """
+
+    def __init__(self, hub: "TickHub", indicators: bool = True):
+        self.hub = hub
+        self.indicators = indicators
+        self.symbols: set[str] = set()
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(_QUEUE_SIZE)
+        self.dropped = 0
+        self.closed = False
+
+    def subscribe(self, symbols: Iterable[str]) -> list[str]:
+        """Add symbols (normalized); returns the full subscribed set."""
+        added = [s for s in dict.fromkeys(_norm(x) for x in symbols if x) if s and s not in self.symbols]
+        room = MAX_SYMBOLS_PER_SUBSCRIPTION - len(self.symbols)
+        if len(added) > room:
+            raise ValueError(f"At most {MAX_SYMBOLS_PER_SUBSCRIPTION} symbols per tick subscription")
+        self.symbols.update(added)
+        self.hub._ref(added, self.indicators)
+        for sym in added:
+            last = self.hub.last.get(sym)
+            if last is not None:
+                self.push(last)
+        return sorted(self.symbols)
+
+    def unsubscribe(self, symbols: Iterable[str]) -> list[str]:
+        removed = [s for s in dict.fromkeys(_norm(x) for x in symbols if x) if s in self.symbols]
+        self.symbols.difference_update(removed)
+        self.hub._unref(removed, self.indicators)
+        return sorted(self.symbols)
+
+    def push(self, tick: dict[str, Any]) -> None:
+        if not self.indicators and "indicators" in tick:
+            tick = {k: v for k, v in tick.items() if k != "indicators"}
+        while True:
+            try:
+                self.queue.put_nowait(tick)
+                return
+            except asyncio.QueueFull:
+                self.queue.get_nowait()
+                self.dropped += 1
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict[str, Any]]:
+        """Next tick, or None after `timeout` seconds without one."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.unsubscribe(list(self.symbols))
+            self.hub._subs.discard(self)
+
+
+class TickHub:
+    """Symbol reference counts, the shared poller task and the latest tick per symbol."""
+
+    def __init__(self) -> None:
+        self._subs: set[Subscription] = set()
+        self._refs: Counter[str] = Counter()
+        self._ind_refs: Counter[str] = Counter()
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._seeding: set[str] = set()
+        self._seed_tasks: set[asyncio.Task] = set()
+        self.last: dict[str, dict[str, Any]] = {}
+        self.stats: dict[str, Any] = {"polls": 0, "ticks": 0, "errors": 0, "last_poll_ms": None, "seeds": 0}
+
+    def open(self, symbols: Iterable[str] = (), indicators: bool = True) -> Subscription:
+        """New subscription (call from the app's event loop); starts the poller if idle."""
+        sub = Subscription(self, indicators)
+        self._subs.add(sub)
+        sub.subscribe(symbols)
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return sub
+
+    def _ref(self, symbols: list[str], indicators: bool) -> None:
+        fresh = [s for s in symbols if not self._refs[s]]
+        self._refs.update(symbols)
+        if indicators:
+            self._ind_refs.update(symbols)
+        if fresh and self._wake is not None:
+            self._wake.set()  # poll new symbols now rather than next cycle
+
+    def _unref(self, symbols: list[str], indicators: bool) -> None:
+        for counts in (self._refs, self._ind_refs) if indicators else (self._refs,):
+            counts.subtract(symbols)
+            for sym in symbols:
+                if counts[sym] <= 0:
+                    del counts[sym]
+        for sym in symbols:
+            if sym not in self._refs:
+                self.last.pop(sym, None)
+
+    def _poll(self, symbols: list[str], with_indicators: set[str]) -> tuple[dict[str, dict[str, Any]], set[str]]:
+        """Batched ticks, plus the indicator symbols that still need a seed."""
+        ticks = fetch_live_ticks(symbols)
+        unseeded: set[str] = set()
+        for sym in with_indicators:
+            tick = ticks.get(sym)
+            if tick and tick.get("ok"):
+                try:
+                    tick["indicators"] = live_indicators(sym, tick, seed=False)
+                except Exception:  # noqa: BLE001
+                    tick["indicators"] = None
+                if tick["indicators"] is None:
+                    unseeded.add(sym)
+        return ticks, unseeded
+
+    def _seed(self, symbols: set[str]) -> None:
+        """Seed indicator state for `symbols` in the background (skips ones already in flight)."""
+        fresh = symbols - self._seeding
+        if not fresh:
+            return
+        self._seeding |= fresh
+
+        async def run() -> None:
+            try:
+                done = await gather_limited(
+                    [asyncio.to_thread(seed_live_indicators, s) for s in sorted(fresh)], _SEED_CONCURRENCY
+                )
+                self.stats["seeds"] += sum(1 for ok in done if ok)
+            except Exception:  # noqa: BLE001
+                self.stats["errors"] += 1
+            finally:
+                self._seeding -= fresh
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._seed_tasks.add(task)  # keep a reference until it finishes
+        task.add_done_callback(self._seed_tasks.discard)
+
+    async def _run(self) -> None:
+        while self._subs:
+            symbols = sorted(self._refs)
+            interval = _MIN_TICK_SEC_OPEN if market_clocks().get("us_open") else _MIN_TICK_SEC_CLOSED
+            if symbols:
+                t0 = time.perf_counter()
+                unseeded: set[str] = set()
+                try:
+                    ticks, unseeded = await asyncio.to_thread(self._poll, symbols, set(self._ind_refs))
+                except Exception as exc:  # noqa: BLE001
+                    self.stats["errors"] += 1
+                    ticks = {s: {"ok": False, "symbol": s, "error": str(exc)[:160]} for s in symbols}
+                self.stats["polls"] += 1
+                self.stats["last_poll_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+                self._publish(ticks, interval)
+                self._seed(unseeded & set(self._ind_refs))
+            assert self._wake is not None
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), max(1.0, interval))
+            except asyncio.TimeoutError:
+                pass
+        self._task = None
+
+    def _publish(self, ticks: dict[str, dict[str, Any]], interval: float) -> None:
+        for sym, tick in ticks.items():
+            if sym not in self._refs:
+                continue  # unsubscribed while the poll was in flight
+            tick = {**tick, "poll_sec": max(1.0, interval)}
+            self.last[sym] = tick
+            self.stats["ticks"] += 1
+            for sub in self._subs:
+                if sym in sub.symbols:
+                    sub.push(tick)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            **self.stats,
+            "subscriptions": len(self._subs),
+            "symbols": len(self._refs),
+            "dropped": sum(s.dropped for s in self._subs),
+            "running": self._task is not None and not self._task.done(),
+            "seeding": len(self._seeding),
+        }
+
+
+_hub: Optional[TickHub] = None
+
+
+def tick_hub() -> TickHub:
+    """The process-wide hub."""
+    global _hub
+    if _hub is None:
+        _hub = TickHub()
+    return _hub
+
+
+def tick_hub_stats() -> dict[str, Any]:
+    return tick_hub().snapshot() if _hub is not None else {"subscriptions": 0, "symbols": 0, "running": False}
+
+
+__all__ = ["MAX_SYMBOLS_PER_SUBSCRIPTION", "Subscription", "TickHub", "tick_hub", "tick_hub_stats"]
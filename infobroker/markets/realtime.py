@@ -2,27 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-import requests
-
+from infobroker.data import http_pool
+from infobroker.data.downsample import downsample_rows
+from infobroker.data.highlights import yahoo_chart_async, yahoo_quote_results_async
+from infobroker.data.streaming import IndicatorSet
 from infobroker.markets.sessions import market_clocks
 
-_UA = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-    )
-}
-
 # Per-symbol tick cache — keeps many clients from hammering Yahoo
 _cache_lock = threading.Lock()
 _tick_cache: dict[str, dict[str, Any]] = {}
 _MIN_TICK_SEC_OPEN = 0.85
 _MIN_TICK_SEC_CLOSED = 12.0
+# Batch misses fall back to per-symbol chart requests: this many at once, all done within the budget
+_CHART_FALLBACK_CONCURRENCY = 8
+_CHART_FALLBACK_BUDGET_SEC = 8.0
+
+# Per-symbol live indicator state for tick streams (1m bars, seeded from intraday history)
+_live_lock = threading.Lock()
+_live: dict[str, "_LiveIndicators"] = {}
+_LIVE_MAX_SYMBOLS = 256
+_LIVE_BAR_SEC = 60
+_SEED_RETRY_SEC = 60.0
+_seed_failed: dict[str, float] = {}  # symbol → monotonic time a failed seed may be retried
+
+# Batched ticks: v7 quotes carry day volume only, so the forming 1m bar's volume
+# is accumulated from day-volume deltas between polls (symbol → [bar_time, day_vol, bar_vol])
+_bar_volume: dict[str, list[Any]] = {}
 
 
 def _norm(symbol: str) -> str:
@@ -30,25 +41,8 @@ def _norm(symbol: str) -> str:
 
 
 def _chart_json(symbol: str, range_: str, interval: str) -> Optional[dict[str, Any]]:
-    sym = _norm(symbol)
     try:
-        resp = requests.get(
-            f"https://query1.finance.yahoo.com/v8/finance/chart/{sym}",
-            params={"range": range_, "interval": interval},
-            headers=_UA,
-            timeout=12,
-        )
-        if resp.status_code >= 400:
-            resp = requests.get(
-                f"https://query2.finance.yahoo.com/v8/finance/chart/{sym}",
-                params={"range": range_, "interval": interval},
-                headers=_UA,
-                timeout=12,
-            )
-        if resp.status_code >= 400:
-            return None
-        result = ((resp.json().get("chart") or {}).get("result") or [None])[0]
-        return result
+        return http_pool.run(yahoo_chart_async(_norm(symbol), range_, interval, timeout=12), timeout=30)
     except Exception:
         return None
 
@@ -71,7 +65,11 @@ def fetch_live_tick(symbol: str, force: bool = False) -> dict[str, Any]:
             out["cached"] = True
             return out
 
-    result = _chart_json(sym, range_="1d", interval="1m")
+    return _chart_tick(sym, _chart_json(sym, range_="1d", interval="1m"), us_open, min_age)
+
+
+def _chart_tick(sym: str, result: Optional[dict[str, Any]], us_open: bool, min_age: float) -> dict[str, Any]:
+    """A tick from a 1d/1m chart result (cached), or the `ok: False` placeholder."""
     if not result:
         return {
             "symbol": sym,
@@ -136,12 +134,113 @@ def fetch_live_tick(symbol: str, force: bool = False) -> dict[str, Any]:
     return tick
 
 
+def _quote_tick(sym: str, q: dict[str, Any], us_open: bool, poll_sec: float) -> Optional[dict[str, Any]]:
+    """A v7 quote result in `fetch_live_tick`'s shape (volume = forming 1m bar so far)."""
+    price, market_time = q.get("regularMarketPrice"), q.get("regularMarketTime")
+    if price is None or market_time is None:
+        return None
+    prev = q.get("regularMarketPreviousClose") or q.get("chartPreviousClose")
+    price_f = float(price)
+    bar_time = int(market_time) // _LIVE_BAR_SEC * _LIVE_BAR_SEC
+    day_vol = q.get("regularMarketVolume")
+    bar_vol = None
+    if day_vol is not None:
+        day_vol = float(day_vol)
+        seen = _bar_volume.get(sym)
+        if seen is not None and day_vol >= seen[1]:
+            bar_vol = (seen[2] if seen[0] == bar_time else 0.0) + day_vol - seen[1]
+        _bar_volume[sym] = [bar_time, day_vol, bar_vol or 0.0]
+    chg = price_f - float(prev) if prev else None
+    return {
+        "ok": True,
+        "symbol": sym,
+        "price": round(price_f, 4),
+        "change_abs": round(chg, 4) if chg is not None else None,
+        "change_pct": round((price_f / float(prev) - 1.0) * 100, 2) if prev else None,
+        "prev_close": float(prev) if prev is not None else None,
+        "day_high": q.get("regularMarketDayHigh"),
+        "day_low": q.get("regularMarketDayLow"),
+        "volume": bar_vol,
+        "day_volume": day_vol,
+        "bar_time": bar_time,
+        "currency": q.get("currency") or "USD",
+        "exchange": q.get("fullExchangeName") or q.get("exchange"),
+        "market_state": q.get("marketState"),
+        "us_open": us_open,
+        "source": "yahoo_quote",
+        "as_of": datetime.now(timezone.utc).isoformat(),
+        "cached": False,
+        "poll_sec": poll_sec,
+    }
+
+
+def fetch_live_ticks(symbols: list[str]) -> dict[str, dict[str, Any]]:
+    """Ticks for many symbols in batched quote requests (one per ~80 symbols).
+
+    Shares `fetch_live_tick`'s cache and throttle; symbols the quote endpoint
+    misses fall back to per-symbol chart requests, fetched concurrently and
+    bounded to `_CHART_FALLBACK_BUDGET_SEC` in total (late ones come back
+    `ok: False` and are retried on the next poll).
+    """
+    syms = list(dict.fromkeys(_norm(s) for s in symbols if s))
+    us_open = bool(market_clocks().get("us_open"))
+    min_age = _MIN_TICK_SEC_OPEN if us_open else _MIN_TICK_SEC_CLOSED
+    now = time.monotonic()
+    out: dict[str, dict[str, Any]] = {}
+    with _cache_lock:
+        for sym in syms:
+            cached = _tick_cache.get(sym)
+            if cached and now - float(cached.get("_mono") or 0) < min_age:
+                out[sym] = {**{k: v for k, v in cached.items() if not k.startswith("_")}, "cached": True}
+    stale = [s for s in syms if s not in out]
+    if not stale:
+        return out
+    try:
+        quotes = http_pool.run(yahoo_quote_results_async(stale), timeout=30)
+    except Exception:  # noqa: BLE001
+        quotes = {}
+    with _cache_lock:
+        for sym in stale:
+            tick = _quote_tick(sym, quotes[sym], us_open, min_age) if sym in quotes else None
+            if tick is not None:
+                _tick_cache[sym] = {**tick, "_mono": time.monotonic()}
+                out[sym] = tick
+    misses = [s for s in stale if s not in out]
+    if misses:
+        try:
+            charts = http_pool.run(_chart_results_async(misses), timeout=_CHART_FALLBACK_BUDGET_SEC + 5)
+        except Exception:  # noqa: BLE001
+            charts = {}
+        for sym in misses:
+            out[sym] = _chart_tick(sym, charts.get(sym), us_open, min_age)
+    return out
+
+
+async def _chart_results_async(symbols: list[str]) -> dict[str, Optional[dict[str, Any]]]:
+    """1d/1m chart results fetched concurrently; anything past the shared budget is None."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _CHART_FALLBACK_BUDGET_SEC
+
+    async def one(sym: str) -> Optional[dict[str, Any]]:
+        left = deadline - loop.time()
+        if left <= 0:
+            return None
+        try:
+            return await asyncio.wait_for(yahoo_chart_async(sym, "1d", "1m", timeout=min(12.0, left)), left)
+        except Exception:  # noqa: BLE001
+            return None
+
+    results = await http_pool.gather_limited([one(s) for s in symbols], _CHART_FALLBACK_CONCURRENCY)
+    return dict(zip(symbols, results))
+
+
 def fetch_intraday_bars(
     symbol: str,
     interval: str = "1m",
     range_: str = "1d",
+    max_points: Optional[int] = None,
 ) -> dict[str, Any]:
-    """Intraday OHLCV for live charting (1m / 5m)."""
+    """Intraday OHLCV for live charting (1m / 5m); `max_points` merges bars into OHLC buckets."""
     sym = _norm(symbol)
     interval_n = interval if interval in {"1m", "2m", "5m", "15m", "30m", "60m"} else "1m"
     range_n = range_ if range_ in {"1d", "5d", "1mo"} else "1d"
@@ -185,10 +284,110 @@ def fetch_intraday_bars(
         "symbol": sym,
         "interval": interval_n,
         "range": range_n,
-        "bars": bars,
+        "bars": downsample_rows(bars, max_points) if max_points else bars,
+        "raw_bars": len(bars),
         "last": bars[-1]["c"] if bars else meta.get("regularMarketPrice"),
         "market_state": meta.get("marketState"),
         "us_open": clocks.get("us_open"),
         "as_of": datetime.now(timezone.utc).isoformat(),
         "source": "yahoo_chart",
     }
+
+
+class _LiveIndicators:
+    """Committed 1m bars in an `IndicatorSet` plus the forming bar built from ticks."""
+
+    __slots__ = ("ind", "bar_time", "high", "low", "close", "fresh")
+
+    def __init__(self, ind: IndicatorSet, bar_time: int, high: float, low: float, close: float):
+        self.ind = ind
+        self.bar_time = bar_time
+        self.high, self.low, self.close = high, low, close
+        self.fresh = True  # just seeded: the first tick may be any distance past the last bar
+
+    def on_tick(self, price: float, bar_time: int) -> None:
+        if bar_time > self.bar_time:
+            self.ind.update(self.high, self.low, self.close)
+            self.bar_time = bar_time
+            self.high = self.low = self.close = price
+        else:
+            self.high, self.low, self.close = max(self.high, price), min(self.low, price), price
+
+    def values(self) -> dict[str, Any]:
+        return {
+            **self.ind.preview(self.high, self.low, self.close),
+            "interval": "1m",
+            "bar_time": self.bar_time,
+            "bars": self.ind.bars + 1,
+        }
+
+
+def _seed_live(sym: str) -> Optional[_LiveIndicators]:
+    data = fetch_intraday_bars(sym, interval="1m", range_="5d")
+    bars = data.get("bars") or []
+    if not bars:
+        return None
+    ind = IndicatorSet()
+    for b in bars[:-1]:
+        ind.update(b["h"], b["l"], b["c"])
+    last = bars[-1]
+    bar_time = int(datetime.fromisoformat(last["t"]).timestamp())
+    return _LiveIndicators(ind, bar_time, last["h"], last["l"], last["c"])
+
+
+def _advance_live(sym: str, price: float, bar_time: int) -> Optional[dict[str, Any]]:
+    """Apply a tick to seeded state; None when unseeded or too far past the last bar."""
+    with _live_lock:
+        state = _live.get(sym)
+        if state is None or (not state.fresh and bar_time - state.bar_time > 2 * _LIVE_BAR_SEC):
+            return None
+        state.fresh = False
+        state.on_tick(price, max(bar_time, state.bar_time))
+        return state.values()
+
+
+def seed_live_indicators(symbol: str) -> bool:
+    """(Re)seed a symbol's live indicator state from 5 days of 1m bars; True when ready.
+
+    A failed seed (no 1m history, chart error) is remembered for
+    `_SEED_RETRY_SEC`, so callers can retry freely without hitting Yahoo per tick.
+    """
+    sym = _norm(symbol)
+    with _live_lock:
+        if time.monotonic() < _seed_failed.get(sym, 0.0):
+            return False
+    try:
+        state = _seed_live(sym)
+    except Exception:  # noqa: BLE001
+        state = None
+    with _live_lock:
+        if state is None:
+            _seed_failed[sym] = time.monotonic() + _SEED_RETRY_SEC
+            while len(_seed_failed) > _LIVE_MAX_SYMBOLS:
+                _seed_failed.pop(next(iter(_seed_failed)))
+            return False
+        _seed_failed.pop(sym, None)
+        _live[sym] = state
+        while len(_live) > _LIVE_MAX_SYMBOLS:
+            _live.pop(next(iter(_live)))
+        return True
+
+
+def live_indicators(symbol: str, tick: dict[str, Any], seed: bool = True) -> Optional[dict[str, Any]]:
+    """RSI/EMA/MACD/ATR/Bollinger on 1m bars, updated in O(1) from one tick.
+
+    The first call per symbol seeds from 5 days of 1m bars; after that each
+    tick either extends the forming bar or commits it and opens the next.
+    A gap of missed bars (stream paused, session break) triggers a re-seed.
+    With `seed=False` an unseeded (or gapped) symbol just returns None, for
+    callers that seed out of band (`seed_live_indicators`).
+    """
+    sym = _norm(symbol)
+    price, bar_time = tick.get("price"), tick.get("bar_time")
+    if not tick.get("ok") or price is None or bar_time is None:
+        return None
+    price, bar_time = float(price), int(bar_time)
+    out = _advance_live(sym, price, bar_time)
+    if out is not None or not seed or not seed_live_indicators(sym):
+        return out
+    return _advance_live(sym, price, bar_time)
@@ -1,3 +1,4 @@
+from infobroker.services.leader import LeaderElection
 from infobroker.services.process_control import (
     mcp_restart,
     mcp_start,
@@ -7,6 +8,7 @@ from infobroker.services.process_control import (
 )
 
 __all__ = [
+    "LeaderElection",
     "mcp_start",
     "mcp_stop",
     "mcp_restart",
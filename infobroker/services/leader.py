@@ -0,0 +1,222 @@
+"""Cross-process leader election on a SQLite lease (`data/leader.db`).
+
+Every process that could run background workers (uvicorn workers, the MCP
+server, the CLI) competes for a named lease row. The holder renews it every
+`ttl / 3` seconds; the others retry on the same cadence and take over once the
+lease expires, so a dead leader is replaced within `ttl`. A lease held by a
+process on this host whose pid is gone is taken over immediately. On clean
+shutdown the leader deletes its row so a follower takes over on its next try.
+A leader whose renewal hits a database error (busy lock, I/O hiccup) retries
+every second and keeps leading while its last lease has more than
+`_RENEW_MARGIN_SEC` left; only then does it step down.
+
+Leaders run `on_elected` once when they gain the lease and `on_demoted` when
+they lose it (missed renewals, another holder) or stop.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from infobroker.config import DATA_DIR
+
+LEADER_DB = DATA_DIR / "leader.db"
+DEFAULT_TTL_SEC = 15.0
+_RENEW_MARGIN_SEC = 2.0
+_RETRY_SEC = 1.0
+
+_HOST = socket.gethostname()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    host TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    acquired_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    if os.name == "nt":
+        return True  # no cheap probe; the TTL covers it
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class LeaderElection:
+    """One named lease, the renew/retry thread and the elected/demoted callbacks."""
+
+    def __init__(
+        self,
+        name: str,
+        on_elected: Optional[Callable[[], None]] = None,
+        on_demoted: Optional[Callable[[], None]] = None,
+        ttl: float = DEFAULT_TTL_SEC,
+        path: Optional[Path] = None,
+    ):
+        self.name = name
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.ttl = float(ttl)
+        self.path = path
+        self.holder = f"{_HOST}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._lease_until = 0.0  # expiry of our last successful acquire/renew
+        self._active = False  # on_elected ran and on_demoted has not
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.stats: dict[str, Any] = {"elections": 0, "demotions": 0, "last_error": None, "leader_since": None}
+
+    def _connect(self) -> sqlite3.Connection:
+        path = self.path or LEADER_DB
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), timeout=5.0, isolation_level=None)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def try_acquire(self) -> bool:
+        """One acquire-or-renew attempt; returns (and records) whether we hold the lease."""
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(
+                    "SELECT holder, host, pid, acquired_at, expires_at FROM leases WHERE name = ?", (self.name,)
+                ).fetchone()
+                free = (
+                    row is None
+                    or row[0] == self.holder
+                    or row[4] < now
+                    or (row[1] == _HOST and not _pid_alive(int(row[2])))
+                )
+                if free:
+                    acquired = row[3] if row is not None and row[0] == self.holder else now
+                    conn.execute(
+                        "INSERT OR REPLACE INTO leases (name, holder, host, pid, acquired_at, expires_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (self.name, self.holder, _HOST, os.getpid(), acquired, now + self.ttl),
+                    )
+                conn.execute("COMMIT")
+            finally:
+                conn.close()
+            self.stats["last_error"] = None
+            if free:
+                self._lease_until = now + self.ttl
+        except sqlite3.Error as exc:
+            # Our last lease still stands for a while; past the margin a leader
+            # steps down rather than risk two
+            self.stats["last_error"] = str(exc)[:160]
+            free = self.is_leader and now + _RENEW_MARGIN_SEC < self._lease_until
+        self.is_leader = free
+        return free
+
+    def release(self) -> None:
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM leases WHERE name = ? AND holder = ?", (self.name, self.holder))
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass  # expires on its own
+        self.is_leader = False
+        self._lease_until = 0.0
+
+    def current(self) -> Optional[dict[str, Any]]:
+        """The lease row as stored (any holder), or None."""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT holder, host, pid, acquired_at, expires_at FROM leases WHERE name = ?", (self.name,)
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return {"holder": row[0], "host": row[1], "pid": row[2], "acquired_at": row[3], "expires_at": row[4]}
+
+    def _sync(self) -> None:
+        """Run the callback matching the current leadership state (once per change)."""
+        with self._lock:
+            if self.is_leader and not self._active:
+                self._active = True
+                self.stats["elections"] += 1
+                self.stats["leader_since"] = time.time()
+                callback = self.on_elected
+            elif not self.is_leader and self._active:
+                self._active = False
+                self.stats["demotions"] += 1
+                self.stats["leader_since"] = None
+                callback = self.on_demoted
+            else:
+                return
+        if callback is not None:
+            try:
+                callback()
+            except Exception as exc:  # noqa: BLE001
+                self.stats["last_error"] = f"{type(exc).__name__}: {exc}"[:160]
+
+    def _loop(self) -> None:
+        interval = max(0.5, self.ttl / 3)
+        while True:
+            self.try_acquire()
+            self._sync()
+            wait = _RETRY_SEC if self.stats["last_error"] else interval
+            if self._stop.wait(min(wait, interval)):
+                break
+
+    def start(self) -> None:
+        """Begin competing for the lease in a daemon thread (idempotent)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=f"leader-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop competing; a leader runs `on_demoted` and hands the lease back."""
+        self._stop.set()
+        t = self._thread
+        if t and t.is_alive():
+            t.join(timeout=3)
+        was_leader = self.is_leader
+        self.is_leader = False
+        self._sync()
+        if was_leader:
+            self.release()
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "holder": self.holder,
+            "is_leader": self.is_leader,
+            "ttl_sec": self.ttl,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "lease": self.current(),
+            **self.stats,
+        }
+
+
+__all__ = ["DEFAULT_TTL_SEC", "LEADER_DB", "LeaderElection"]
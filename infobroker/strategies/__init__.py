@@ -1,12 +1,21 @@
-from infobroker.strategies.backtest import BacktestResult, run_backtest, sma_crossover_signal
-from infobroker.strategies.catalog import list_strategies, run_strategy_backtest
-from infobroker.strategies.scanner import scan_watchlist
+from infobroker.strategies.backtest import BacktestResult, backtest_frame, run_backtest, simulate, sma_crossover_signal
+from infobroker.strategies.catalog import list_strategies, register_strategy, run_strategy_backtest
+from infobroker.strategies.portfolio import run_portfolio_backtest
+from infobroker.strategies.scanner import scan_universe, scan_watchlist
+from infobroker.strategies.sweep import iter_sweep, run_sweep
 
 __all__ = [
     "BacktestResult",
+    "backtest_frame",
     "run_backtest",
+    "simulate",
     "sma_crossover_signal",
+    "scan_universe",
     "scan_watchlist",
     "list_strategies",
+    "register_strategy",
     "run_strategy_backtest",
+    "iter_sweep",
+    "run_portfolio_backtest",
+    "run_sweep",
 ]
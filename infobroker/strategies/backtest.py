@@ -5,10 +5,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable
 
+import numpy as np
 import pandas as pd
 
 from infobroker.data.indicators import sma
 from infobroker.data.market import fetch_ohlcv
+from infobroker.strategies.signals import above, position
 
 
 SignalFn = Callable[[pd.DataFrame], pd.Series]
@@ -28,11 +30,8 @@ class BacktestResult:
 def sma_crossover_signal(fast: int = 20, slow: int = 50) -> SignalFn:
     def _signal(df: pd.DataFrame) -> pd.Series:
         close = df["Close"]
-        f = sma(close, fast)
-        s = sma(close, slow)
-        raw = (f > s).astype(int) - (f < s).astype(int)
         # Position: 1 long, 0 flat (no short in v1 learner mode)
-        return (raw > 0).astype(int)
+        return position(above(sma(close, fast), sma(close, slow)), df.index)
 
     return _signal
 
@@ -43,14 +42,80 @@ def run_backtest(
     end: str,
     signal_fn: SignalFn | None = None,
     starting_cash: float = 10_000.0,
+    engine: str = "vector",
 ) -> BacktestResult:
     df = fetch_ohlcv(symbol, start, end)
     if df.empty:
         raise ValueError(f"No data for {symbol}")
+    return backtest_frame(df, symbol, start, end, signal_fn, starting_cash, engine)
+
+
+def backtest_frame(
+    df: pd.DataFrame,
+    symbol: str,
+    start: str,
+    end: str,
+    signal_fn: SignalFn | None = None,
+    starting_cash: float = 10_000.0,
+    engine: str = "vector",
+) -> BacktestResult:
+    """Backtest an already-fetched OHLCV frame (`engine`: 'vector' or reference 'loop')."""
     signal_fn = signal_fn or sma_crossover_signal()
     signal = signal_fn(df).reindex(df.index).fillna(0)
     close = df["Close"].astype(float)
+    if engine == "loop":
+        equity, trades = _simulate_loop(close, signal, starting_cash)
+    elif engine == "vector":
+        equity, trades = simulate(close.to_numpy(), signal.to_numpy(dtype=float), starting_cash)
+    else:
+        raise ValueError(f"Unknown backtest engine: {engine}. Choose 'vector' or 'loop'")
 
+    curve = pd.Series(equity, index=close.index, name="equity")
+    ret = (curve.iloc[-1] / starting_cash - 1.0) * 100
+    peak = np.maximum.accumulate(equity)
+    dd = ((equity / peak) - 1.0).min() * 100
+    return BacktestResult(
+        symbol=symbol.upper(),
+        start=start,
+        end=end,
+        trades=trades,
+        total_return_pct=round(float(ret), 2),
+        max_drawdown_pct=round(float(dd), 2),
+        equity_curve=curve,
+    )
+
+
+def holding_mask(pos: np.ndarray) -> np.ndarray:
+    """Long/flat state of the all-in/all-out rules: enter on 0→1, exit on 1→0.
+
+    Any other position value leaves the current state alone, exactly like the
+    bar loop's `pos == 1 and prev == 0` / `pos == 0 and prev == 1` checks.
+    """
+    prev = np.concatenate(([0], pos[:-1]))
+    enter = (pos == 1) & (prev == 0)
+    leave = (pos == 0) & (prev == 1)
+    events = np.flatnonzero(enter | leave)
+    # Latch: state at bar t is the most recent event at or before t
+    last = np.full(pos.size, -1)
+    last[events] = events
+    last = np.maximum.accumulate(last)
+    return np.where(last >= 0, enter[np.maximum(last, 0)], False)
+
+
+def simulate(close: np.ndarray, signal: np.ndarray, starting_cash: float = 10_000.0) -> tuple[np.ndarray, int]:
+    """Vectorized execution: (equity per bar, trades) from closes and target positions."""
+    close = np.asarray(close, dtype=np.float64)
+    pos = np.trunc(np.asarray(signal, dtype=np.float64)).astype(np.int64)
+    held = holding_mask(pos) if starting_cash > 0 else np.zeros(close.size, dtype=bool)
+    trades = int(np.count_nonzero(np.diff(held.astype(np.int8), prepend=0)))
+    # Equity compounds bar-over-bar returns while a position is carried into the bar
+    growth = np.ones_like(close)
+    growth[1:] = np.where(held[:-1], close[1:] / close[:-1], 1.0)
+    return starting_cash * np.cumprod(growth), trades
+
+
+def _simulate_loop(close: pd.Series, signal: pd.Series, starting_cash: float) -> tuple[np.ndarray, int]:
+    """Reference bar-by-bar engine; `simulate` must match it."""
     cash = starting_cash
     shares = 0.0
     equity = []
@@ -69,17 +134,4 @@ def run_backtest(
             trades += 1
         prev = pos
         equity.append(cash + shares * float(price))
-
-    curve = pd.Series(equity, index=close.index, name="equity")
-    ret = (curve.iloc[-1] / starting_cash - 1.0) * 100
-    peak = curve.cummax()
-    dd = ((curve / peak) - 1.0).min() * 100
-    return BacktestResult(
-        symbol=symbol.upper(),
-        start=start,
-        end=end,
-        trades=trades,
-        total_return_pct=round(float(ret), 2),
-        max_drawdown_pct=round(float(dd), 2),
-        equity_curve=curve,
-    )
+    return np.asarray(equity, dtype=np.float64), trades
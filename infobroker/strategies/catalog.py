@@ -2,74 +2,72 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
+import numpy as np
 import pandas as pd
 
-from infobroker.data.indicators import macd_series, rsi_series, sma
-from infobroker.strategies.backtest import SignalFn, run_backtest, sma_crossover_signal
+from infobroker.data.downsample import equity_points
+from infobroker.data.market import fetch_ohlcv
+from infobroker.data.result_cache import cached_result
+from infobroker.strategies.backtest import SignalFn, backtest_frame, sma_crossover_signal
+from infobroker.strategies.signals import Bars, above, below, enter_exit, hysteresis, position
 
+Kernel = Callable[..., np.ndarray]
 
-def rsi_mean_reversion(period: int = 14, low: float = 30, high: float = 70) -> SignalFn:
-    def _signal(df: pd.DataFrame) -> pd.Series:
-        rsi = rsi_series(df["Close"], period)
-        # Enter long when oversold; exit when overbought
-        pos = pd.Series(0, index=df.index, dtype=int)
-        long = False
-        for i, ts in enumerate(df.index):
-            v = rsi.iloc[i]
-            if pd.isna(v):
-                pos.iloc[i] = int(long)
-                continue
-            if not long and v <= low:
-                long = True
-            elif long and v >= high:
-                long = False
-            pos.iloc[i] = int(long)
-        return pos
 
-    return _signal
+# Kernels: (Bars, **params) → boolean long state. Factories wrap them into a
+# SignalFn; parameter sweeps call them directly on one memoized Bars per symbol.
+def sma_crossover_kernel(bars: Bars, fast: int = 20, slow: int = 50) -> np.ndarray:
+    return above(bars.sma(fast), bars.sma(slow))
 
 
-def macd_cross_signal() -> SignalFn:
-    def _signal(df: pd.DataFrame) -> pd.Series:
-        macd = macd_series(df["Close"].astype(float))
-        return (macd["macd_line"] > macd["signal_line"]).fillna(False).astype(int)
+def rsi_mean_reversion_kernel(bars: Bars, period: int = 14, low: float = 30, high: float = 70) -> np.ndarray:
+    # Enter long when oversold; exit when overbought
+    return hysteresis(bars.rsi(period), low, high)
 
-    return _signal
 
+def macd_cross_kernel(bars: Bars) -> np.ndarray:
+    macd = bars.macd()
+    return above(macd["macd_line"], macd["signal_line"])
 
-def buy_and_hold_signal() -> SignalFn:
-    def _signal(df: pd.DataFrame) -> pd.Series:
-        s = pd.Series(1, index=df.index, dtype=int)
-        return s
 
-    return _signal
+def buy_and_hold_kernel(bars: Bars) -> np.ndarray:
+    return np.ones(len(bars.index), dtype=bool)
+
+
+def breakout_kernel(bars: Bars, window: int = 20, exit_sma: int = 20) -> np.ndarray:
+    prior_high = bars.breakout_level(window)
+    state = enter_exit(above(bars.close, prior_high), below(bars.close, bars.sma(exit_sma)))
+    # Flat until the first full window exists
+    return state & ~np.isnan(prior_high)
+
 
+def kernel_signal(kernel: Kernel, **params: Any) -> SignalFn:
+    """SignalFn for one parameter set of a kernel."""
 
-def breakout_20d_signal() -> SignalFn:
     def _signal(df: pd.DataFrame) -> pd.Series:
-        high = df["High"].astype(float)
-        close = df["Close"].astype(float)
-        prior_high = high.rolling(20).max().shift(1)
-        pos = pd.Series(0, index=df.index, dtype=int)
-        long = False
-        for i, ts in enumerate(df.index):
-            ph = prior_high.iloc[i]
-            c = close.iloc[i]
-            if pd.isna(ph):
-                pos.iloc[i] = 0
-                continue
-            if not long and c > ph:
-                long = True
-            elif long and c < sma(close, 20).iloc[i]:
-                long = False
-            pos.iloc[i] = int(long)
-        return pos
+        return position(kernel(Bars(df), **params), df.index)
 
     return _signal
 
 
+def rsi_mean_reversion(period: int = 14, low: float = 30, high: float = 70) -> SignalFn:
+    return kernel_signal(rsi_mean_reversion_kernel, period=period, low=low, high=high)
+
+
+def macd_cross_signal() -> SignalFn:
+    return kernel_signal(macd_cross_kernel)
+
+
+def buy_and_hold_signal() -> SignalFn:
+    return kernel_signal(buy_and_hold_kernel)
+
+
+def breakout_20d_signal(window: int = 20, exit_sma: int = 20) -> SignalFn:
+    return kernel_signal(breakout_kernel, window=window, exit_sma=exit_sma)
+
+
 STRATEGIES: dict[str, dict[str, Any]] = {
     "sma_crossover": {
         "id": "sma_crossover",
@@ -78,6 +76,12 @@ STRATEGIES: dict[str, dict[str, Any]] = {
         "cost": "Free (yfinance)",
         "signup": False,
         "factory": sma_crossover_signal,
+        "kernel": sma_crossover_kernel,
+        "params": {
+            "fast": {"default": 20, "min": 5, "max": 100, "step": 5},
+            "slow": {"default": 50, "min": 20, "max": 250, "step": 10},
+        },
+        "valid": lambda p: p["fast"] < p["slow"],
     },
     "rsi_mean_reversion": {
         "id": "rsi_mean_reversion",
@@ -86,6 +90,13 @@ STRATEGIES: dict[str, dict[str, Any]] = {
         "cost": "Free (yfinance)",
         "signup": False,
         "factory": rsi_mean_reversion,
+        "kernel": rsi_mean_reversion_kernel,
+        "params": {
+            "period": {"default": 14, "min": 5, "max": 30, "step": 1},
+            "low": {"default": 30, "min": 10, "max": 45, "step": 5},
+            "high": {"default": 70, "min": 55, "max": 90, "step": 5},
+        },
+        "valid": lambda p: p["low"] < p["high"],
     },
     "macd_cross": {
         "id": "macd_cross",
@@ -94,6 +105,8 @@ STRATEGIES: dict[str, dict[str, Any]] = {
         "cost": "Free (yfinance)",
         "signup": False,
         "factory": macd_cross_signal,
+        "kernel": macd_cross_kernel,
+        "params": {},
     },
     "buy_hold": {
         "id": "buy_hold",
@@ -102,6 +115,8 @@ STRATEGIES: dict[str, dict[str, Any]] = {
         "cost": "Free (yfinance)",
         "signup": False,
         "factory": buy_and_hold_signal,
+        "kernel": buy_and_hold_kernel,
+        "params": {},
     },
     "breakout_20d": {
         "id": "breakout_20d",
@@ -110,10 +125,49 @@ STRATEGIES: dict[str, dict[str, Any]] = {
         "cost": "Free (yfinance)",
         "signup": False,
         "factory": breakout_20d_signal,
+        "kernel": breakout_kernel,
+        "params": {
+            "window": {"default": 20, "min": 5, "max": 120, "step": 5},
+            "exit_sma": {"default": 20, "min": 5, "max": 100, "step": 5},
+        },
     },
 }
 
 
+def register_strategy(
+    strategy_id: str,
+    name: str,
+    description: str,
+    kernel: Kernel,
+    params: Optional[dict[str, dict[str, Any]]] = None,
+    valid: Optional[Callable[[dict[str, Any]], bool]] = None,
+    cost: str = "Free (yfinance)",
+) -> None:
+    """Add (or replace) a catalog strategy.
+
+    `kernel(bars, **params)` returns the boolean long state, built on
+    `strategies.signals`; `params` maps name → {default, min, max, step} for sweeps.
+    """
+    STRATEGIES[strategy_id] = {
+        "id": strategy_id,
+        "name": name,
+        "description": description,
+        "cost": cost,
+        "signup": False,
+        "factory": lambda **kw: kernel_signal(kernel, **kw),
+        "kernel": kernel,
+        "params": params or {},
+        "valid": valid,
+    }
+
+
+def get_strategy(strategy_id: str) -> dict[str, Any]:
+    meta = STRATEGIES.get(strategy_id)
+    if not meta:
+        raise ValueError(f"Unknown strategy: {strategy_id}. Choose from {list(STRATEGIES)}")
+    return meta
+
+
 def list_strategies() -> list[dict[str, Any]]:
     return [
         {
@@ -122,6 +176,7 @@ def list_strategies() -> list[dict[str, Any]]:
             "description": s["description"],
             "cost": s["cost"],
             "signup_required": s["signup"],
+            "params": {k: dict(v) for k, v in (s.get("params") or {}).items()},
         }
         for s in STRATEGIES.values()
     ]
@@ -133,41 +188,56 @@ def run_strategy_backtest(
     start: str,
     end: str,
     starting_cash: float = 10_000.0,
+    engine: str = "vector",
+    params: Optional[dict[str, Any]] = None,
+    cache: bool = True,
+    max_points: int = 80,
 ) -> dict[str, Any]:
-    meta = STRATEGIES.get(strategy_id)
-    if not meta:
-        raise ValueError(f"Unknown strategy: {strategy_id}. Choose from {list(STRATEGIES)}")
-    factory: Callable[..., SignalFn] = meta["factory"]
-    result = run_backtest(
-        symbol,
-        start,
-        end,
-        signal_fn=factory(),
-        starting_cash=starting_cash,
-    )
-    # Benchmark buy & hold on same window
-    bh = run_backtest(
+    """Backtest one catalog strategy vs buy & hold; repeat requests are served from
+    the result cache until new bars land for the symbol (`cache_hit` in the result).
+    The equity curve is downsampled to about `max_points` points, keeping its extremes."""
+    meta = get_strategy(strategy_id)
+    if not cache:
+        return _strategy_backtest(meta, symbol, start, end, starting_cash, engine, params, max_points)
+    return cached_result(
+        "backtest",
         symbol,
         start,
         end,
-        signal_fn=buy_and_hold_signal(),
-        starting_cash=starting_cash,
+        lambda: _strategy_backtest(meta, symbol, start, end, starting_cash, engine, params, max_points),
+        strategy=meta["id"],
+        params=dict(params or {}),
+        starting_cash=float(starting_cash),
+        engine=engine,
+        max_points=int(max_points),
     )
+
+
+def _strategy_backtest(
+    meta: dict[str, Any],
+    symbol: str,
+    start: str,
+    end: str,
+    starting_cash: float,
+    engine: str,
+    params: Optional[dict[str, Any]],
+    max_points: int = 80,
+) -> dict[str, Any]:
+    factory: Callable[..., SignalFn] = meta["factory"]
+    df = fetch_ohlcv(symbol, start, end)
+    if df.empty:
+        raise ValueError(f"No data for {symbol}")
+    result = backtest_frame(df, symbol, start, end, signal_fn=factory(**(params or {})), starting_cash=starting_cash, engine=engine)
+    # Benchmark buy & hold on the same bars
+    bh = backtest_frame(df, symbol, start, end, signal_fn=buy_and_hold_signal(), starting_cash=starting_cash, engine=engine)
     curve = result.equity_curve
     equity_pts = []
     if curve is not None and not curve.empty:
-        step = max(1, len(curve) // 80)
-        for i, (ts, val) in enumerate(curve.items()):
-            if i % step == 0 or i == len(curve) - 1:
-                equity_pts.append(
-                    {
-                        "t": ts.isoformat() if hasattr(ts, "isoformat") else str(ts),
-                        "v": round(float(val), 2),
-                    }
-                )
+        equity_pts = equity_points(curve.index, curve.to_numpy(dtype=float), max_points)
     return {
         "strategy": meta["id"],
         "strategy_name": meta["name"],
+        "params": dict(params or {}),
         "symbol": result.symbol,
         "start": result.start,
         "end": result.end,
@@ -0,0 +1,121 @@
+"""Column-wise indicators over a (bars × symbols) close panel.
+
+Each symbol's closes are right-aligned so the last row is every symbol's latest
+bar; shorter histories are NaN-padded at the top. Recurrences (EMA, Wilder RSI)
+step once over the rows with vector ops across all symbols and are seeded per
+column the way TA-Lib seeds them, so values match the per-Series TA-Lib calls.
+"""
+
+from __future__ import annotations
+
+from typing import Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class ClosePanel:
+    """Right-aligned closes: `values[t, j]` is symbol j's bar `t - rows + len_j`."""
+
+    __slots__ = ("symbols", "values", "lengths", "start")
+
+    def __init__(self, symbols: list[str], values: np.ndarray, lengths: np.ndarray):
+        self.symbols = symbols
+        self.values = values
+        self.lengths = lengths
+        self.start = values.shape[0] - lengths  # first valid row per column
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame], rows: Optional[int] = None, column: str = "Close") -> "ClosePanel":
+        series: list[tuple[str, np.ndarray]] = []
+        for sym, df in frames.items():
+            if df is None or df.empty or column not in df.columns:
+                continue
+            arr = df[column].to_numpy(dtype=np.float64)
+            arr = arr[~np.isnan(arr)]
+            if arr.size:
+                series.append((sym, arr))
+        t = max((a.size for _, a in series), default=0)
+        if rows is not None:
+            t = min(t, rows)
+        values = np.full((t, len(series)), np.nan)
+        lengths = np.zeros(len(series), dtype=np.int64)
+        for j, (_, arr) in enumerate(series):
+            arr = arr[-t:] if t else arr[:0]
+            values[t - arr.size :, j] = arr
+            lengths[j] = arr.size
+        return cls([s for s, _ in series], values, lengths)
+
+    def last(self, offset: int = 0) -> np.ndarray:
+        """Row `offset` bars back from the latest (NaN where the history is shorter)."""
+        if self.values.shape[0] <= offset:
+            return np.full(len(self.symbols), np.nan)
+        return self.values[-1 - offset]
+
+
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """SMA down each column; NaN until a full window of valid values."""
+    t = x.shape[0]
+    out = np.full_like(x, np.nan)
+    if t < window:
+        return out
+    valid = ~np.isnan(x)
+    cs = np.vstack([np.zeros((1,) + x.shape[1:]), np.cumsum(np.where(valid, x, 0.0), axis=0)])
+    cn = np.vstack([np.zeros((1,) + x.shape[1:]), np.cumsum(valid, axis=0)])
+    sums = cs[window:] - cs[:-window]
+    counts = cn[window:] - cn[:-window]
+    out[window - 1 :] = np.where(counts == window, sums / window, np.nan)
+    return out
+
+
+def ema(x: np.ndarray, period: int, start: np.ndarray, seed_row: Optional[np.ndarray] = None) -> np.ndarray:
+    """TA-Lib EMA: seeded with the SMA of the `period` values ending at `seed_row`."""
+    seed_row = start + period - 1 if seed_row is None else seed_row
+    seeds = rolling_mean(x, period)
+    k = 2.0 / (period + 1)
+    out = np.full_like(x, np.nan)
+    e = np.full(x.shape[1], np.nan)
+    for t in range(x.shape[0]):
+        e = np.where(seed_row == t, seeds[t], e + k * (x[t] - e))
+        out[t] = e
+    return out
+
+
+def rsi(x: np.ndarray, start: np.ndarray, period: int = 14) -> np.ndarray:
+    """TA-Lib (Wilder) RSI per column."""
+    t_rows, n = x.shape
+    out = np.full_like(x, np.nan)
+    if t_rows < 2:
+        return out
+    d = np.diff(x, axis=0)  # d[t-1] = x[t] - x[t-1]
+    gain = np.where(d > 0, d, 0.0)
+    loss = np.where(d < 0, -d, 0.0)
+    gain[np.isnan(d)] = np.nan
+    loss[np.isnan(d)] = np.nan
+    seed_g = rolling_mean(gain, period)
+    seed_l = rolling_mean(loss, period)
+    seed_row = start + period
+    up = np.full(n, np.nan)
+    down = np.full(n, np.nan)
+    for t in range(1, t_rows):
+        seeded = seed_row == t
+        up = np.where(seeded, seed_g[t - 1], (up * (period - 1) + gain[t - 1]) / period)
+        down = np.where(seeded, seed_l[t - 1], (down * (period - 1) + loss[t - 1]) / period)
+        total = up + down
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[t] = np.where(total > 0, 100.0 * up / total, np.where(np.isnan(total), np.nan, 0.0))
+    return out
+
+
+def macd(
+    x: np.ndarray, start: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """TA-Lib MACD: both EMAs start on the slow EMA's first bar; all outputs start with the signal."""
+    first = start + slow - 1
+    line = ema(x, fast, start, seed_row=first) - ema(x, slow, start, seed_row=first)
+    sig = ema(line, signal, first)
+    line[np.isnan(sig)] = np.nan
+    return line, sig, line - sig
+
+
+__all__ = ["ClosePanel", "ema", "macd", "rolling_mean", "rsi"]
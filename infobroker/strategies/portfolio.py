@@ -0,0 +1,178 @@
+"""Basket backtests: one strategy over many symbols on a shared date index.
+
+Each symbol gets a capital sleeve (equal, or inverse ATR% for volatility
+parity); the strategy's long state decides whether the sleeve is invested or
+sits in cash. Weights are set at each close and earn the next bar's return, the
+same timing as the single-symbol engine — a one-symbol equal-weight basket
+reproduces `simulate` exactly. Everything is (bars × symbols) array math.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from infobroker.data.downsample import equity_points
+from infobroker.data.indicators import atr_series
+from infobroker.data.market import fetch_ohlcv_many
+from infobroker.strategies.catalog import get_strategy
+from infobroker.strategies.signals import Bars
+
+WEIGHTINGS = ("equal", "atr")
+MAX_SYMBOLS = 300
+
+
+def resolve_basket(basket: str = "watchlist", limit: int = 30) -> list[str]:
+    """'watchlist' | 'liquid' (liquid universe names) | 'board:<focus>' | 'AAPL,MSFT,…'."""
+    key = (basket or "watchlist").strip()
+    low = key.lower()
+    limit = max(1, min(int(limit), MAX_SYMBOLS))
+    if low == "watchlist":
+        from infobroker.watchlist import list_symbols
+
+        return list_symbols()[:limit]
+    if low in {"liquid", "universe"}:
+        from infobroker.universe import liquid_scan_symbols
+
+        return liquid_scan_symbols(max(10, limit))[:limit]
+    if low.startswith("board:"):
+        from infobroker.markets.boards import focus_symbols
+
+        return focus_symbols(low.split(":", 1)[1], limit)
+    return [s.strip().upper() for s in key.split(",") if s.strip()][:limit]
+
+
+def _panel(frames: dict[str, pd.DataFrame], kernel: Any, params: dict[str, Any], atr_period: int) -> dict[str, Any]:
+    index = frames[next(iter(frames))].index
+    for df in list(frames.values())[1:]:
+        index = index.union(df.index)
+    close, state, atr_pct = [], [], []
+    for df in frames.values():
+        c = df["Close"].astype(float)
+        close.append(c.reindex(index).ffill().to_numpy())
+        s = pd.Series(np.asarray(kernel(Bars(df), **params), dtype=bool), index=df.index)
+        state.append(s.reindex(index).ffill().fillna(False).to_numpy(dtype=bool))
+        atr = atr_series(df, atr_period) / c
+        atr_pct.append(atr.reindex(index).ffill().to_numpy())
+    return {
+        "index": index,
+        "close": np.column_stack(close),
+        "state": np.column_stack(state),
+        "atr_pct": np.column_stack(atr_pct),
+    }
+
+
+def _weights(close: np.ndarray, state: np.ndarray, atr_pct: np.ndarray, weighting: str) -> np.ndarray:
+    tradable = ~np.isnan(close)
+    if weighting == "atr":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            raw = np.where(tradable & (atr_pct > 0), 1.0 / atr_pct, 0.0)
+    else:
+        raw = tradable.astype(float)
+    total = raw.sum(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sleeves = np.where(total > 0, raw / total, 0.0)
+    return np.where(state & tradable, sleeves, 0.0)
+
+
+def simulate_portfolio(
+    close: np.ndarray, weights: np.ndarray, starting_cash: float = 10_000.0
+) -> dict[str, np.ndarray]:
+    """Equity, per-symbol P&L and turnover for target weights held close-to-close."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rets = np.nan_to_num(close[1:] / close[:-1] - 1.0, nan=0.0, posinf=0.0, neginf=0.0)
+    held = weights[:-1]
+    port = (held * rets).sum(axis=1)
+    equity = starting_cash * np.concatenate(([1.0], np.cumprod(1.0 + port)))
+    # Dollar P&L per symbol: yesterday's equity × weight × return
+    pnl = (equity[:-1, None] * held * rets).sum(axis=0)
+    # Weights drift with returns; turnover is what it takes to get back to target
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drifted = held * (1.0 + rets) / (1.0 + port)[:, None]
+    traded = np.abs(weights[1:] - np.nan_to_num(drifted)).sum(axis=1)
+    traded = np.concatenate(([np.abs(weights[0]).sum()], traded))
+    return {"equity": equity, "pnl": pnl, "turnover": traded}
+
+
+def run_portfolio_backtest(
+    strategy_id: str,
+    start: str,
+    end: str,
+    *,
+    symbols: Optional[list[str]] = None,
+    basket: str = "watchlist",
+    limit: int = 30,
+    weighting: str = "equal",
+    params: Optional[dict[str, Any]] = None,
+    starting_cash: float = 10_000.0,
+    atr_period: int = 14,
+    max_points: int = 80,
+) -> dict[str, Any]:
+    """Run one catalog strategy across a basket with shared capital."""
+    meta = get_strategy(strategy_id)
+    weighting = (weighting or "equal").strip().lower()
+    if weighting not in WEIGHTINGS:
+        raise ValueError(f"weighting must be one of {list(WEIGHTINGS)}")
+    syms = list(dict.fromkeys(s.upper().strip() for s in (symbols or resolve_basket(basket, limit)) if s))
+    if not syms:
+        raise ValueError("Empty basket")
+    if len(syms) > MAX_SYMBOLS:
+        raise ValueError(f"At most {MAX_SYMBOLS} symbols per portfolio backtest")
+    loaded = fetch_ohlcv_many(syms, start, end)
+    frames = {s: loaded[s] for s in syms if s in loaded and len(loaded[s]) > 1}
+    if not frames:
+        raise ValueError("No data for any basket symbol")
+
+    panel = _panel(frames, meta["kernel"], dict(params or {}), atr_period)
+    close, state = panel["close"], panel["state"]
+    weights = _weights(close, state, panel["atr_pct"], weighting)
+    sim = simulate_portfolio(close, weights, starting_cash)
+    bench = simulate_portfolio(close, _weights(close, np.ones_like(state), panel["atr_pct"], weighting), starting_cash)
+
+    equity = sim["equity"]
+    ret = (equity[-1] / starting_cash - 1.0) * 100
+    dd = ((equity / np.maximum.accumulate(equity)) - 1.0).min() * 100
+    bh = (bench["equity"][-1] / starting_cash - 1.0) * 100
+    years = max(len(equity) / 252.0, 1e-9)
+    trades = np.count_nonzero(np.diff(state.astype(np.int8), axis=0, prepend=0), axis=0)
+
+    index = panel["index"]
+    pts = equity_points(index, equity, max_points)
+    attribution = [
+        {
+            "symbol": sym,
+            "pnl": round(float(sim["pnl"][j]), 2),
+            "contribution_pct": round(float(sim["pnl"][j] / starting_cash * 100), 2),
+            "avg_weight_pct": round(float(weights[:, j].mean() * 100), 2),
+            "time_in_market_pct": round(float(state[:, j].mean() * 100), 1),
+            "trades": int(trades[j]),
+        }
+        for j, sym in enumerate(frames)
+    ]
+    attribution.sort(key=lambda r: r["pnl"], reverse=True)
+    return {
+        "strategy": meta["id"],
+        "strategy_name": meta["name"],
+        "params": dict(params or {}),
+        "weighting": weighting,
+        "symbols": list(frames),
+        "missing": [s for s in syms if s not in frames],
+        "start": start,
+        "end": end,
+        "bars": len(equity),
+        "trades": int(trades.sum()),
+        "total_return_pct": round(float(ret), 2),
+        "max_drawdown_pct": round(float(dd), 2),
+        "buy_hold_return_pct": round(float(bh), 2),
+        "vs_buy_hold_pct": round(float(ret - bh), 2),
+        "turnover": round(float(sim["turnover"].sum()), 2),
+        "turnover_per_year": round(float(sim["turnover"].sum() / years), 2),
+        "attribution": attribution,
+        "data_source": "yfinance (free, no signup)",
+        "equity": pts,
+    }
+
+
+__all__ = ["WEIGHTINGS", "resolve_basket", "run_portfolio_backtest", "simulate_portfolio"]
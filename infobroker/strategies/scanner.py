@@ -2,34 +2,34 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
-from infobroker.data.indicators import calculate_macd, calculate_rsi, sma
-from infobroker.data.market import fetch_ohlcv
+from infobroker.data.indicators import SCAN_PLAN
+from infobroker.data.market import fetch_ohlcv_many
+from infobroker.strategies.panel import ClosePanel, rolling_mean
+from infobroker.strategies.panel import macd as panel_macd
+from infobroker.strategies.panel import rsi as panel_rsi
 from infobroker.watchlist import list_symbols
 
 
-def _scan_one(symbol: str) -> Optional[dict[str, Any]]:
-    end = datetime.utcnow().date()
-    start = end - timedelta(days=220)
-    try:
-        df = fetch_ohlcv(symbol, start.isoformat(), end.isoformat())
-    except Exception:
-        return None
+def _scan_one(symbol: str, df: Optional[pd.DataFrame]) -> Optional[dict[str, Any]]:
     if df is None or df.empty or "Close" not in df.columns:
         return None
     close = df["Close"].astype(float).dropna()
     if len(close) < 50:
         return None
 
-    rsi = calculate_rsi(close, 14)
-    macd = calculate_macd(close)
-    ma50 = float(sma(close, 50).iloc[-1])
-    ma200 = float(sma(close, 200).iloc[-1]) if len(close) >= 200 else None
+    enriched = SCAN_PLAN.run(close.to_frame("Close"))
+    rsi = enriched.last_valid("RSI_14", 2)
+    if rsi is None:
+        rsi = "N/A"
+    macd = enriched.macd()
+    ma50 = float(enriched.column("SMA_50")[-1])
+    ma200 = float(enriched.column("SMA_200")[-1]) if "SMA_200" in enriched else None
     last = float(close.iloc[-1])
     prev = float(close.iloc[-2])
     day_chg = ((last / prev) - 1.0) * 100 if prev else 0.0
@@ -75,17 +75,6 @@ def _scan_one(symbol: str) -> Optional[dict[str, Any]]:
     if not signals:
         return None
 
-    # Teaching tip tied to strongest signal
-    tip = "Confirm with level + volume before acting."
-    if any("oversold" in s.lower() for s in signals):
-        tip = "Oversold is not a buy alone — wait for a higher low or reclaim of support."
-    elif any("overbought" in s.lower() for s in signals):
-        tip = "Overbought can stay hot in trends — tighten risk, don't short blindly."
-    elif any("Downtrend" in s for s in signals):
-        tip = "Against the stack, keep size small or stand aside."
-    elif any("Uptrend" in s for s in signals):
-        tip = "Trend-aligned pulls to MA50 are usually cleaner than chasing green candles."
-
     return {
         "symbol": symbol,
         "price": round(last, 4),
@@ -95,19 +84,41 @@ def _scan_one(symbol: str) -> Optional[dict[str, Any]]:
         "ma200": round(ma200, 4) if ma200 is not None else None,
         "signals": signals,
         "severity": severity,
-        "tip": tip,
+        "tip": _tip(signals),
     }
 
 
+def _tip(signals: list[str]) -> str:
+    """Teaching tip tied to strongest signal."""
+    if any("oversold" in s.lower() for s in signals):
+        return "Oversold is not a buy alone — wait for a higher low or reclaim of support."
+    if any("overbought" in s.lower() for s in signals):
+        return "Overbought can stay hot in trends — tighten risk, don't short blindly."
+    if any("Downtrend" in s for s in signals):
+        return "Against the stack, keep size small or stand aside."
+    if any("Uptrend" in s for s in signals):
+        return "Trend-aligned pulls to MA50 are usually cleaner than chasing green candles."
+    return "Confirm with level + volume before acting."
+
+
+def _window() -> tuple[str, str]:
+    end = datetime.utcnow().date()
+    start = end - timedelta(days=220)
+    return start.isoformat(), end.isoformat()
+
+
 def scan_watchlist(symbols: Optional[list[str]] = None, max_workers: int = 6) -> dict[str, Any]:
     syms = symbols or list_symbols()
+    # One batched history pass (cache + multi-ticker download); `max_workers` bounds the fallbacks
+    frames = fetch_ohlcv_many(syms, *_window(), max_workers=max_workers)
     rows: list[dict[str, Any]] = []
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futures = {pool.submit(_scan_one, s): s for s in syms}
-        for fut in as_completed(futures):
-            row = fut.result()
-            if row:
-                rows.append(row)
+    for sym in syms:
+        try:
+            row = _scan_one(sym, frames.get(sym.upper().strip()))
+        except Exception:  # noqa: BLE001
+            row = None
+        if row:
+            rows.append(row)
     rows.sort(
         key=lambda r: (r["severity"], abs(r.get("change_pct_day") or 0)),
         reverse=True,
@@ -118,3 +129,97 @@ def scan_watchlist(symbols: Optional[list[str]] = None, max_workers: int = 6) ->
         "hits": len(rows),
         "items": rows[:20],
     }
+
+
+# (label, severity) per rule row of the universe signal matrix, in `_scan_one` order
+_RULES: tuple[tuple[str, int], ...] = (
+    ("RSI oversold ({rsi})", 3),
+    ("RSI overbought ({rsi})", 3),
+    ("RSI cooling ({rsi})", 1),
+    ("Uptrend stack (price > MA50 > MA200)", 2),
+    ("Downtrend stack (price < MA50 < MA200)", 2),
+    ("Reclaimed MA50", 2),
+    ("Lost MA50", 2),
+    ("MACD bullish + active day", 1),
+    ("MACD bearish + active day", 1),
+)
+
+
+def scan_universe(
+    symbols: list[str],
+    frames: Optional[dict[str, pd.DataFrame]] = None,
+    top: int = 20,
+    max_workers: int = 6,
+) -> dict[str, Any]:
+    """`scan_watchlist` rules for hundreds/thousands of symbols at once.
+
+    Closes go into one right-aligned (bars × symbols) panel; RSI/MACD/SMA are
+    computed column-wise and each rule is a boolean row of a (rules × symbols)
+    matrix. Same hits, ranking and payload as the per-symbol scan.
+    """
+    syms = [s for s in symbols if s]
+    if frames is None:
+        frames = fetch_ohlcv_many(syms, *_window(), max_workers=max_workers)
+    panel = ClosePanel.from_frames({s: frames.get(s.upper().strip()) for s in syms})
+    if not panel.symbols:
+        return {"as_of": datetime.utcnow().isoformat() + "Z", "scanned": len(syms), "hits": 0, "items": [], "engine": "vectorized"}
+    x = panel.values
+    last, prev = panel.last(0), panel.last(1)
+    rsi = panel_rsi(x, panel.start)[-1]
+    rsi_r = np.round(rsi, 2)
+    line, signal, hist = (np.nan_to_num(a[-1]) for a in panel_macd(x, panel.start))
+    ma50 = rolling_mean(x, 50)[-1]
+    ma200 = rolling_mean(x, 200)[-1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        day_chg = np.where(prev != 0, (last / prev - 1.0) * 100, 0.0)
+
+    has_rsi = ~np.isnan(rsi)
+    has_200 = ~np.isnan(ma200)
+    active = np.abs(day_chg) > 1.5
+    oversold = has_rsi & (rsi_r <= 30)
+    overbought = has_rsi & ~oversold & (rsi_r >= 70)
+    uptrend = has_200 & (last > ma50) & (ma50 > ma200)
+    rules = np.vstack(
+        [
+            oversold,
+            overbought,
+            has_rsi & ~oversold & ~overbought & (rsi_r <= 40),
+            uptrend,
+            has_200 & ~uptrend & (last < ma50) & (ma50 < ma200),
+            has_200 & (prev <= ma50) & (ma50 < last),
+            has_200 & (prev >= ma50) & (ma50 > last),
+            (hist > 0) & (line > signal) & active,
+            (hist < 0) & (line < signal) & active,
+        ]
+    )
+    rules &= panel.lengths >= 50
+    severity = np.array([w for _, w in _RULES]) @ rules
+
+    hits = np.flatnonzero(rules.any(axis=0))
+    chg_r = np.round(day_chg, 2)
+    # Stable: ties keep input order, like the list sort in scan_watchlist
+    order = hits[np.lexsort((-np.abs(chg_r[hits]), -severity[hits]))]
+    rows: list[dict[str, Any]] = []
+    for j in order[: max(0, top)]:
+        r = round(float(rsi[j]), 2) if has_rsi[j] else None
+        signals = [label.format(rsi=r) for (label, _), on in zip(_RULES, rules[:, j]) if on]
+        rows.append(
+            {
+                "symbol": panel.symbols[j],
+                "price": round(float(last[j]), 4),
+                "change_pct_day": round(float(day_chg[j]), 2),
+                "rsi": r,
+                "ma50": round(float(ma50[j]), 4),
+                "ma200": round(float(ma200[j]), 4) if has_200[j] else None,
+                "signals": signals,
+                "severity": int(severity[j]),
+                "tip": _tip(signals),
+            }
+        )
+    return {
+        "as_of": datetime.utcnow().isoformat() + "Z",
+        "scanned": len(syms),
+        "hits": int(hits.size),
+        "items": rows,
+        "engine": "vectorized",
+    }
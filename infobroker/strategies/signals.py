@@ -0,0 +1,190 @@
+"""Loop-free building blocks for position signals.
+
+Stateful rules ("enter when X, stay in until Y") are resolved with cumulative
+index tricks instead of per-bar Python loops, so a strategy costs a handful of
+NumPy passes whatever the bar count. Everything takes/returns 1-D arrays (or
+Series, converted with `np.asarray`); `position()` turns a state back into the
+int Series a `SignalFn` returns.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Union
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from infobroker.data.indicators import atr_series, ema, macd_series, rsi_series, sma
+
+ArrayLike = Union[np.ndarray, pd.Series]
+
+
+class Bars:
+    """One OHLCV frame with memoized indicators, so kernels evaluated for many
+    parameter sets compute each (indicator, period) once."""
+
+    __slots__ = ("df", "index", "close", "high", "low", "_memo")
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.index = df.index
+        self.close = df["Close"].astype(float)
+        self.high = df["High"].astype(float) if "High" in df.columns else self.close
+        self.low = df["Low"].astype(float) if "Low" in df.columns else self.close
+        self._memo: dict[tuple[Any, ...], Any] = {}
+
+    def _get(self, key: tuple[Any, ...], fn: Callable[[], Any]) -> Any:
+        out = self._memo.get(key)
+        if out is None:
+            out = self._memo[key] = fn()
+        return out
+
+    def sma(self, n: int) -> np.ndarray:
+        return self._get(("sma", n), lambda: sma(self.close, n).to_numpy())
+
+    def ema(self, n: int) -> np.ndarray:
+        return self._get(("ema", n), lambda: ema(self.close, n).to_numpy())
+
+    def rsi(self, n: int = 14) -> np.ndarray:
+        return self._get(("rsi", n), lambda: rsi_series(self.close, n).to_numpy())
+
+    def macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> pd.DataFrame:
+        return self._get(("macd", fast, slow, signal), lambda: macd_series(self.close, fast, slow, signal))
+
+    def atr(self, n: int = 14) -> np.ndarray:
+        return self._get(("atr", n), lambda: atr_series(self.df, n).to_numpy())
+
+    def breakout_level(self, n: int = 20) -> np.ndarray:
+        return self._get(("breakout", n), lambda: breakout_level(self.high, n))
+
+
+def _bool(x: ArrayLike) -> np.ndarray:
+    return np.asarray(x, dtype=bool)
+
+
+def _float(x: ArrayLike) -> np.ndarray:
+    return np.asarray(x, dtype=np.float64)
+
+
+def last_index(mask: np.ndarray) -> np.ndarray:
+    """Index of the most recent True at or before each bar (-1 before the first)."""
+    idx = np.where(mask, np.arange(mask.size), -1)
+    return np.maximum.accumulate(idx) if idx.size else idx
+
+
+def enter_exit(enter: ArrayLike, exit: ArrayLike, initial: bool = False) -> np.ndarray:
+    """State machine: `enter` is only checked while flat, `exit` only while long.
+
+    Equivalent to the loop `if not on and enter[i]: on = True / elif on and exit[i]: on = False`.
+    A bar where both fire flips the state, so state = (last one-sided event)
+    XOR (parity of both-fired bars since then).
+    """
+    e, x = _bool(enter), _bool(exit)
+    both = e & x
+    decided = e ^ x
+    last = last_index(decided)
+    base = np.where(last >= 0, e[np.maximum(last, 0)], initial)
+    flips = np.cumsum(both)
+    since = flips - np.where(last >= 0, flips[np.maximum(last, 0)], 0)
+    return base ^ (since % 2 == 1)
+
+
+def latch(set_: ArrayLike, reset: ArrayLike, initial: bool = False) -> np.ndarray:
+    """Set/reset latch for mutually exclusive conditions (ties resolve as `enter_exit`)."""
+    return enter_exit(set_, reset, initial)
+
+
+def hysteresis(values: ArrayLike, enter_at: float, exit_at: float, initial: bool = False) -> np.ndarray:
+    """Long once `values` ≤ `enter_at`, flat again once ≥ `exit_at` (e.g. RSI 30/70).
+
+    Pass `enter_at > exit_at` for the mirrored rule (enter on strength, exit on weakness).
+    NaN bars keep the previous state.
+    """
+    v = _float(values)
+    with np.errstate(invalid="ignore"):
+        if enter_at <= exit_at:
+            return enter_exit(v <= enter_at, v >= exit_at, initial)
+        return enter_exit(v >= enter_at, v <= exit_at, initial)
+
+
+def above(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """a > b, False where either side is NaN."""
+    with np.errstate(invalid="ignore"):
+        return _float(a) > _float(b)
+
+
+def below(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        return _float(a) < _float(b)
+
+
+def crossover(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """True on the bar `a` moves above `b` (was ≤ on the prior bar)."""
+    now = above(a, b)
+    prev_le = np.zeros_like(now)
+    with np.errstate(invalid="ignore"):
+        prev_le[1:] = _float(a)[:-1] <= _float(b)[:-1]
+    return now & prev_le
+
+
+def crossunder(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    return crossover(b, a)
+
+
+def rolling_max(values: ArrayLike, window: int) -> np.ndarray:
+    """Trailing `window`-bar max (NaN until the window is full or while it holds a NaN)."""
+    v = _float(values)
+    out = np.full(v.size, np.nan)
+    if v.size >= window:
+        out[window - 1 :] = sliding_window_view(v, window).max(axis=1)
+    return out
+
+
+def rolling_min(values: ArrayLike, window: int) -> np.ndarray:
+    v = _float(values)
+    out = np.full(v.size, np.nan)
+    if v.size >= window:
+        out[window - 1 :] = sliding_window_view(v, window).min(axis=1)
+    return out
+
+
+def shift(values: ArrayLike, n: int = 1) -> np.ndarray:
+    v = _float(values)
+    out = np.full(v.size, np.nan)
+    if n < v.size:
+        out[n:] = v[: v.size - n]
+    return out
+
+
+def breakout_level(high: ArrayLike, window: int = 20) -> np.ndarray:
+    """Prior `window`-bar high (excludes the current bar)."""
+    return shift(rolling_max(high, window), 1)
+
+
+def breakdown_level(low: ArrayLike, window: int = 20) -> np.ndarray:
+    return shift(rolling_min(low, window), 1)
+
+
+def position(state: ArrayLike, index: pd.Index) -> pd.Series:
+    """Boolean long state → 0/1 int Series for `run_backtest`."""
+    return pd.Series(_bool(state).astype(int), index=index, dtype=int)
+
+
+__all__ = [
+    "Bars",
+    "above",
+    "below",
+    "breakdown_level",
+    "breakout_level",
+    "crossover",
+    "crossunder",
+    "enter_exit",
+    "hysteresis",
+    "last_index",
+    "latch",
+    "position",
+    "rolling_max",
+    "rolling_min",
+    "shift",
+]
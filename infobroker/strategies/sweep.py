@@ -0,0 +1,345 @@
+"""Parameter sweeps over catalog strategies.
+
+Bars for every symbol load once (batched history fetch, so the history cache
+serves repeats). Work is split into (symbol, chunk of parameter sets) tasks on a
+process pool; inside a task one memoized `Bars` computes each (indicator,
+period) once and the strategy kernel + vectorized `simulate` run per set.
+Results stream back as tasks complete; `run_sweep` ranks them.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+import pickle
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from multiprocessing import get_context
+from typing import Any, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from infobroker.data.market import fetch_ohlcv_many
+from infobroker.strategies.backtest import simulate
+from infobroker.strategies.catalog import Kernel, get_strategy
+from infobroker.strategies.signals import Bars
+
+MAX_EVALUATIONS = 50_000
+_CHUNK_MIN, _CHUNK_MAX = 32, 512
+_IN_PROCESS_BELOW = 300  # evaluations — not worth the process round-trip
+
+RANK_KEYS = ("total_return_pct", "vs_buy_hold_pct", "max_drawdown_pct", "return_over_drawdown")
+
+_pool_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_pid: Optional[int] = None
+
+
+def _process_pool() -> ProcessPoolExecutor:
+    """Long-lived spawn pool (the desk process runs threads; forking it is unsafe)."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid() or getattr(_pool, "_broken", False):
+            workers = max(1, min(8, (os.cpu_count() or 2) - 1))
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+            _pool_pid = os.getpid()
+        return _pool
+
+
+# ── search spaces ────────────────────────────────────────────────────────
+def _spec_values(spec: dict[str, Any]) -> list[Any]:
+    lo, hi, step = spec["min"], spec["max"], spec.get("step") or 1
+    vals = np.arange(lo, hi + step / 2, step)
+    return [int(v) if isinstance(lo, int) and isinstance(step, int) else round(float(v), 6) for v in vals]
+
+
+def _sample(spec: dict[str, Any], rng: random.Random, lo: Any = None, hi: Any = None) -> Any:
+    lo = spec["min"] if lo is None else lo
+    hi = spec["max"] if hi is None else hi
+    if isinstance(spec["min"], int) and isinstance(spec.get("step") or 1, int):
+        return rng.randint(int(lo), int(hi))
+    return round(rng.uniform(float(lo), float(hi)), 4)
+
+
+def _grid_axes(meta: dict[str, Any], grid: Optional[dict[str, list[Any]]]) -> tuple[list[str], list[list[Any]]]:
+    specs: dict[str, dict[str, Any]] = meta.get("params") or {}
+    grid = grid or {}
+    unknown = set(grid) - set(specs)
+    if unknown:
+        raise ValueError(f"Unknown params for {meta['id']}: {sorted(unknown)}")
+    names = list(specs)
+    return names, [list(grid[n]) if n in grid else _spec_values(specs[n]) for n in names]
+
+
+def grid_size(meta: dict[str, Any], grid: Optional[dict[str, list[Any]]] = None) -> int:
+    """Parameter sets `grid_params` would produce (before `valid` filtering), without building them."""
+    return math.prod(len(axis) for axis in _grid_axes(meta, grid)[1])
+
+
+def grid_params(
+    meta: dict[str, Any], grid: Optional[dict[str, list[Any]]] = None, limit: Optional[int] = MAX_EVALUATIONS
+) -> list[dict[str, Any]]:
+    """Cartesian product of `grid` (values per param); unlisted params sweep their catalog range.
+
+    Raises ValueError when the product exceeds `limit` sets — checked before any set is built.
+    """
+    names, axes = _grid_axes(meta, grid)
+    size = math.prod(len(axis) for axis in axes)
+    if limit is not None and size > limit:
+        raise ValueError(f"Grid has {size} parameter sets, over the {limit} limit — narrow the grid")
+    out = [dict(zip(names, combo)) for combo in itertools.product(*axes)]
+    return _valid(meta, out)
+
+
+def random_params(meta: dict[str, Any], samples: int, seed: Optional[int] = None) -> list[dict[str, Any]]:
+    specs: dict[str, dict[str, Any]] = meta.get("params") or {}
+    rng = random.Random(seed)
+    seen: set[tuple[Any, ...]] = set()
+    out: list[dict[str, Any]] = []
+    for _ in range(samples * 4):
+        p = {n: _sample(s, rng) for n, s in specs.items()}
+        key = tuple(p.values())
+        if key not in seen:
+            seen.add(key)
+            out.append(p)
+        if len(out) >= samples:
+            break
+    return _valid(meta, out)
+
+
+def _refine_params(
+    meta: dict[str, Any], best: list[dict[str, Any]], samples: int, shrink: float, rng: random.Random
+) -> list[dict[str, Any]]:
+    """Sample around the current leaders in a window `shrink` × each param's range."""
+    specs: dict[str, dict[str, Any]] = meta.get("params") or {}
+    out: list[dict[str, Any]] = []
+    if not best:
+        return out
+    for i in range(samples):
+        centre = best[i % len(best)]
+        p = {}
+        for n, s in specs.items():
+            half = (s["max"] - s["min"]) * shrink / 2
+            p[n] = _sample(s, rng, max(s["min"], centre[n] - half), min(s["max"], centre[n] + half))
+        out.append(p)
+    return _valid(meta, out)
+
+
+def _valid(meta: dict[str, Any], params: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    check = meta.get("valid")
+    return [p for p in params if check is None or check(p)]
+
+
+# ── evaluation ───────────────────────────────────────────────────────────
+def _evaluate(
+    symbol: str,
+    df: pd.DataFrame,
+    kernel: Kernel,
+    params_list: list[dict[str, Any]],
+    starting_cash: float,
+) -> list[dict[str, Any]]:
+    """One task: many parameter sets on one symbol's bars (runs in a worker)."""
+    bars = Bars(df)
+    close = bars.close.to_numpy()
+    bh = (close[-1] / close[0] - 1.0) * 100
+    out: list[dict[str, Any]] = []
+    for params in params_list:
+        try:
+            equity, trades = simulate(close, kernel(bars, **params), starting_cash)
+        except Exception as exc:  # noqa: BLE001
+            out.append({"symbol": symbol, "params": params, "error": str(exc)[:200]})
+            continue
+        ret = (equity[-1] / starting_cash - 1.0) * 100
+        dd = ((equity / np.maximum.accumulate(equity)) - 1.0).min() * 100
+        out.append(
+            {
+                "symbol": symbol,
+                "params": params,
+                "trades": trades,
+                "total_return_pct": round(float(ret), 2),
+                "max_drawdown_pct": round(float(dd), 2),
+                "buy_hold_return_pct": round(float(bh), 2),
+                "vs_buy_hold_pct": round(float(ret - bh), 2),
+                "return_over_drawdown": round(float(ret / abs(dd)), 3) if dd < 0 else None,
+            }
+        )
+    return out
+
+
+def _rank_value(row: dict[str, Any], rank_by: str) -> float:
+    v = row.get(rank_by)
+    return float("-inf") if v is None else float(v)
+
+
+def _executor(evaluations: int, kernel: Kernel) -> Executor:
+    if evaluations < _IN_PROCESS_BELOW:
+        return ThreadPoolExecutor(max_workers=1)
+    try:
+        pickle.dumps(kernel)  # closures / lambdas can't reach a spawned worker
+    except Exception:  # noqa: BLE001
+        return ThreadPoolExecutor(max_workers=max(1, min(4, os.cpu_count() or 1)))
+    return _process_pool()
+
+
+def _run_batch(
+    executor: Executor,
+    frames: dict[str, pd.DataFrame],
+    kernel: Kernel,
+    params_list: list[dict[str, Any]],
+    starting_cash: float,
+) -> Iterator[list[dict[str, Any]]]:
+    # Big chunks share one Bars memo (fewer indicator recomputes); enough of them to keep workers busy
+    workers = getattr(executor, "_max_workers", 1)
+    total = len(params_list) * len(frames)
+    chunk = min(_CHUNK_MAX, max(_CHUNK_MIN, -(-total // (workers * 4))))
+    pending: set[Future] = set()
+    for sym, df in frames.items():
+        for i in range(0, len(params_list), chunk):
+            pending.add(executor.submit(_evaluate, sym, df, kernel, params_list[i : i + chunk], starting_cash))
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+    finally:
+        for fut in pending:
+            fut.cancel()
+
+
+def iter_sweep(
+    strategy_id: str,
+    symbols: list[str],
+    start: str,
+    end: str,
+    *,
+    grid: Optional[dict[str, list[Any]]] = None,
+    search: str = "grid",
+    samples: int = 200,
+    seed: Optional[int] = None,
+    starting_cash: float = 10_000.0,
+    rank_by: str = "total_return_pct",
+    top: int = 20,
+) -> Iterator[dict[str, Any]]:
+    """Stream sweep events: 'start', then 'results' batches as tasks finish, then 'done' with the ranking.
+
+    `search`: 'grid' (all of `grid` × catalog ranges), 'random' (`samples`
+    draws), or 'refine' — random draws, then two rounds sampling in shrinking
+    windows around the leaders (a light stand-in for Bayesian search).
+    """
+    meta = get_strategy(strategy_id)
+    if rank_by not in RANK_KEYS:
+        raise ValueError(f"rank_by must be one of {list(RANK_KEYS)}")
+    search = (search or "grid").strip().lower()
+    syms = list(dict.fromkeys(s.upper().strip() for s in symbols if s and s.strip()))
+    if not syms:
+        raise ValueError("Provide at least one symbol")
+    kernel: Kernel = meta["kernel"]
+    rng = random.Random(seed)
+    samples = max(1, int(samples))
+
+    if search == "grid":
+        planned = grid_size(meta, grid) * len(syms)
+        if planned > MAX_EVALUATIONS:
+            raise ValueError(f"{planned} evaluations exceeds the {MAX_EVALUATIONS} limit — narrow the grid or symbols")
+        rounds = [grid_params(meta, grid)]
+    elif search == "random":
+        rounds = [random_params(meta, samples, seed)]
+    elif search == "refine":
+        first = max(1, samples // 2)
+        rounds = [random_params(meta, first, seed)]
+    else:
+        raise ValueError("search must be grid | random | refine")
+    if not meta.get("params"):
+        rounds = [[{}]]
+    planned = len(rounds[0]) * len(syms)
+    if planned > MAX_EVALUATIONS:
+        raise ValueError(f"{planned} evaluations exceeds the {MAX_EVALUATIONS} limit — narrow the grid or symbols")
+
+    t0 = time.perf_counter()
+    frames = fetch_ohlcv_many(syms, start, end)
+    frames = {s: frames[s] for s in syms if s in frames and len(frames[s]) > 1}
+    if not frames:
+        raise ValueError(f"No price history for {', '.join(syms)} between {start} and {end}")
+    yield {
+        "type": "start",
+        "strategy": meta["id"],
+        "search": search,
+        "symbols": list(frames),
+        "missing": [s for s in syms if s not in frames],
+        "planned": len(rounds[0]) * len(frames),
+        "load_ms": round((time.perf_counter() - t0) * 1000, 1),
+    }
+
+    rows: list[dict[str, Any]] = []
+    evaluated = 0
+    executor = _executor(planned, kernel)
+    try:
+        round_no = 0
+        while rounds:
+            params_list = rounds.pop(0)
+            for batch in _run_batch(executor, frames, kernel, params_list, starting_cash):
+                rows.extend(batch)
+                evaluated += len(batch)
+                yield {"type": "results", "round": round_no, "evaluated": evaluated, "items": batch}
+            round_no += 1
+            if search == "refine" and round_no <= 2 and meta.get("params"):
+                best = _leaders(rows, rank_by, max(3, samples // 20))
+                if best:  # every evaluation errored: nothing to refine around
+                    more = (samples - samples // 2) // 2
+                    rounds.append(_refine_params(meta, best, more, 0.4 if round_no == 1 else 0.15, rng))
+    finally:
+        if isinstance(executor, ThreadPoolExecutor):
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    ok = [r for r in rows if "error" not in r]
+    ok.sort(key=lambda r: _rank_value(r, rank_by), reverse=True)
+    yield {
+        "type": "done",
+        "strategy": meta["id"],
+        "rank_by": rank_by,
+        "evaluated": evaluated,
+        "errors": len(rows) - len(ok),
+        "elapsed_ms": round((time.perf_counter() - t0) * 1000, 1),
+        "top": ok[: max(1, top)],
+        "by_params": _aggregate(ok, rank_by, top) if len(frames) > 1 else None,
+    }
+
+
+def _leaders(rows: list[dict[str, Any]], rank_by: str, n: int) -> list[dict[str, Any]]:
+    """Best parameter sets by mean score across symbols."""
+    return [a["params"] for a in _aggregate([r for r in rows if "error" not in r], rank_by, n)]
+
+
+def _aggregate(rows: list[dict[str, Any]], rank_by: str, top: int) -> list[dict[str, Any]]:
+    """Per parameter set: mean metrics across symbols, ranked."""
+    groups: dict[tuple[Any, ...], list[dict[str, Any]]] = {}
+    for r in rows:
+        groups.setdefault(tuple(sorted(r["params"].items())), []).append(r)
+    out = []
+    for key, rs in groups.items():
+        agg: dict[str, Any] = {"params": dict(key), "symbols": len(rs)}
+        for k in ("total_return_pct", "max_drawdown_pct", "vs_buy_hold_pct", "trades"):
+            agg[k] = round(float(np.mean([r[k] for r in rs])), 2)
+        rod = [r["return_over_drawdown"] for r in rs if r.get("return_over_drawdown") is not None]
+        agg["return_over_drawdown"] = round(float(np.mean(rod)), 3) if rod else None
+        out.append(agg)
+    out.sort(key=lambda r: _rank_value(r, rank_by), reverse=True)
+    return out[: max(1, top)]
+
+
+def run_sweep(strategy_id: str, symbols: list[str], start: str, end: str, **kwargs: Any) -> dict[str, Any]:
+    """Blocking sweep: the 'done' summary plus the start metadata."""
+    head: dict[str, Any] = {}
+    for event in iter_sweep(strategy_id, symbols, start, end, **kwargs):
+        if event["type"] == "start":
+            head = event
+        elif event["type"] == "done":
+            return {**{k: v for k, v in head.items() if k != "type"}, **{k: v for k, v in event.items() if k != "type"}}
+    raise RuntimeError("sweep ended without a result")
+
+
+__all__ = ["MAX_EVALUATIONS", "RANK_KEYS", "grid_params", "grid_size", "iter_sweep", "random_params", "run_sweep"]
@@ -7,7 +7,8 @@ from typing import Any
 
 from infobroker.brokers import create_broker
 from infobroker.data.highlights import fetch_yahoo_quotes_bulk
-from infobroker.universe.engine import quoted_rows
+from infobroker.data.swr import swr_cache
+from infobroker.universe.snapshot import current_snapshot
 from infobroker.watchlist import list_symbols
 
 
@@ -21,15 +22,20 @@ def _estimate_book(price: float | None, bid: float | None, ask: float | None) ->
     return bid, ask
 
 
-def build_trading_board(
-    scope: str = "both",
-    limit: int = 120,
-    user: str = "default",
-) -> dict[str, Any]:
-    """Rows ready for one-click buy/sell with last/bid/ask and position qty."""
-    scope_n = (scope or "both").strip().lower()
-    limit_n = max(10, min(int(limit), 400))
-
+@swr_cache(
+    "trading_board_quotes",
+    soft_ttl=5,
+    hard_ttl=10 * 60,
+    key=lambda scope_n, limit_n: (scope_n, limit_n, tuple(list_symbols())),
+    accept=lambda out: bool(out["bulk"]) or not out["symbols"],
+    max_entries=32,
+)
+def _board_quotes(scope_n: str, limit_n: int) -> dict[str, Any]:
+    """Board symbols, their list tags / cached rows and one bulk Yahoo quote pass.
+
+    This is the upstream-bound half of the board; positions and account are
+    overlaid fresh on every call.
+    """
     watched = set(list_symbols())
     rows_src: list[dict[str, Any]] = []
 
@@ -38,9 +44,8 @@ def build_trading_board(
             rows_src.append({"symbol": sym, "lists": ["watchlist"]})
 
     if scope_n in {"live", "universe", "both"}:
-        live = quoted_rows()
-        live.sort(key=lambda r: abs(r.get("change_pct_day") or 0), reverse=True)
-        for r in live[: max(limit_n, 80)]:
+        cols = current_snapshot().columns
+        for r in cols.take(cols.order("abs_change", max(limit_n, 80))):
             rows_src.append({"symbol": r["symbol"], "lists": ["live"], "cached": r})
 
     # Dedupe — prefer merging list tags
@@ -68,7 +73,20 @@ def build_trading_board(
             if sym not in merged:
                 merged[sym] = {"symbol": sym, "lists": ["watchlist"], "cached": None}
 
-    bulk = fetch_yahoo_quotes_bulk(symbols)
+    return {"watched": watched, "symbols": symbols, "merged": merged, "bulk": fetch_yahoo_quotes_bulk(symbols)}
+
+
+def build_trading_board(
+    scope: str = "both",
+    limit: int = 120,
+    user: str = "default",
+) -> dict[str, Any]:
+    """Rows ready for one-click buy/sell with last/bid/ask and position qty."""
+    scope_n = (scope or "both").strip().lower()
+    limit_n = max(10, min(int(limit), 400))
+    quotes = _board_quotes.fetch(scope_n, limit_n)
+    watched, symbols = quotes.value["watched"], quotes.value["symbols"]
+    merged, bulk = quotes.value["merged"], quotes.value["bulk"]
 
     broker = create_broker(user=user)
     acct = broker.get_account()
@@ -140,5 +158,6 @@ def build_trading_board(
         "broker_name": broker.profile.name,
         "watchlist_count": len(watched),
         "position_count": len(positions),
+        **quotes.meta(),
         "items": items,
     }
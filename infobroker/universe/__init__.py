@@ -13,8 +13,11 @@ from infobroker.universe.engine import (
     stop_background_engine,
     universe_status,
 )
+from infobroker.universe.snapshot import UniverseSnapshot, current_snapshot
 
 __all__ = [
+    "UniverseSnapshot",
+    "current_snapshot",
     "ensure_universe",
     "get_symbol",
     "liquid_scan_symbols",
@@ -0,0 +1,160 @@
+"""Columnar view of the quoted universe for movers / live-board ranking.
+
+Built once per snapshot version (`UniverseSnapshot.columns`). Filters are
+boolean masks, rankings are `argpartition` top-k, and row dicts are only
+picked out for the indices actually returned.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+import numpy as np
+
+# Sort names accepted by the live board / exchange boards → (column, descending, NaN fill)
+_SORTS: dict[str, tuple[str, bool, float]] = {
+    "change_desc": ("change_pct_day", True, -9999.0),
+    "change_pct": ("change_pct_day", True, -9999.0),
+    "gainers": ("change_pct_day", True, -9999.0),
+    "change_asc": ("change_pct_day", False, 9999.0),
+    "losers": ("change_pct_day", False, 9999.0),
+    "volume": ("volume", True, 0.0),
+    "vol": ("volume", True, 0.0),
+    "rel_volume": ("rel_volume", True, 0.0),
+    "rvol": ("rel_volume", True, 0.0),
+    "price": ("price", True, 0.0),
+    "week": ("change_pct_week", True, -9999.0),
+    "change_week": ("change_pct_week", True, -9999.0),
+    "abs_change": ("abs_change", True, 0.0),
+}
+
+_NUMERIC = ("price", "change_pct_day", "change_pct_week", "volume", "rel_volume")
+
+
+def _float(v: Any) -> float:
+    try:
+        return float(v) if v is not None else np.nan
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _encode(values: Iterable[Optional[str]]) -> tuple[np.ndarray, tuple[str, ...]]:
+    """Dictionary-encode short categorical strings (None → "")."""
+    cats: dict[str, int] = {}
+    codes = [cats.setdefault(v or "", len(cats)) for v in values]
+    return np.asarray(codes, dtype=np.int16), tuple(cats)
+
+
+class QuoteColumns:
+    """NumPy columns aligned with `rows` (the snapshot's quoted board rows)."""
+
+    def __init__(self, rows: Sequence[dict[str, Any]]):
+        self.rows = tuple(rows)
+        n = len(self.rows)
+        self.symbol = np.asarray([r["symbol"] for r in self.rows], dtype=object)
+        for name in _NUMERIC:
+            setattr(self, name, np.fromiter((_float(r.get(name)) for r in self.rows), dtype=np.float64, count=n))
+        self.abs_change = np.abs(np.nan_to_num(self.change_pct_day, nan=0.0))
+        self.etf = np.fromiter((bool(r.get("etf")) for r in self.rows), dtype=bool, count=n)
+        self.exchange, self.exchanges = _encode(r.get("exchange") for r in self.rows)
+        self.asset_class, self.asset_classes = _encode(r.get("asset_class") for r in self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    # ── masks ────────────────────────────────────────────────────────────
+    def all(self) -> np.ndarray:
+        return np.ones(len(self.rows), dtype=bool)
+
+    def _code_mask(self, codes: np.ndarray, cats: tuple[str, ...], pred: Callable[[str], bool]) -> np.ndarray:
+        hit = [i for i, c in enumerate(cats) if pred(c)]
+        return np.isin(codes, np.asarray(hit, dtype=np.int16)) if hit else np.zeros(len(codes), dtype=bool)
+
+    def exchange_mask(self, needle: str) -> np.ndarray:
+        """Case-insensitive substring match on exchange (same rule as the boards)."""
+        n = (needle or "").strip().lower()
+        if not n:
+            return self.all()
+        return self._code_mask(self.exchange, self.exchanges, lambda c: n in c.lower())
+
+    def asset_class_mask(self, classes: Iterable[str], default: str = "") -> np.ndarray:
+        """Rows whose asset_class is in `classes` (missing class counts as `default`)."""
+        wanted = set(classes)
+        return self._code_mask(self.asset_class, self.asset_classes, lambda c: (c or default) in wanted)
+
+    def symbol_mask(self, symbols: Iterable[str]) -> np.ndarray:
+        return np.isin(self.symbol, np.asarray(list(symbols), dtype=object))
+
+    # ── ranking ──────────────────────────────────────────────────────────
+    def top(
+        self,
+        values: np.ndarray,
+        k: int = 0,
+        mask: Optional[np.ndarray] = None,
+        descending: bool = True,
+    ) -> np.ndarray:
+        """Indices of the best `k` rows (all when k <= 0), ties kept in row order."""
+        idx = np.flatnonzero(mask) if mask is not None else np.arange(len(values))
+        v = values[idx]
+        if descending:
+            v = -v
+        if 0 < k < len(idx):
+            # Keep everything tied with the k-th value so the cut matches a stable sort
+            kth = np.partition(v, k - 1)[k - 1]
+            keep = v <= kth
+            idx, v = idx[keep], v[keep]
+        order = np.lexsort((idx, v))
+        return idx[order[:k]] if k > 0 else idx[order]
+
+    def order(
+        self,
+        sort: str,
+        k: int = 0,
+        mask: Optional[np.ndarray] = None,
+        default: str = "abs_change",
+    ) -> np.ndarray:
+        """Indices ranked by a board sort name (unknown names fall back to `default`)."""
+        key = (sort or default).strip().lower()
+        if key == "symbol":
+            idx = np.flatnonzero(mask) if mask is not None else np.arange(len(self.rows))
+            idx = idx[np.argsort(self.symbol[idx], kind="stable")]
+            return idx[:k] if k > 0 else idx
+        col, descending, fill = _SORTS.get(key) or _SORTS[default]
+        values = np.nan_to_num(getattr(self, col), nan=fill)
+        return self.top(values, k, mask, descending)
+
+    def take(self, idx: Iterable[int]) -> list[dict[str, Any]]:
+        rows = self.rows
+        return [rows[i] for i in idx]
+
+    # ── rollups ──────────────────────────────────────────────────────────
+    def exchange_rollup(self, idx: np.ndarray) -> list[dict[str, Any]]:
+        """Per-exchange count / volume / mean day move over rows `idx` (volume-descending)."""
+        names = tuple(dict.fromkeys(e or "Unknown" for e in self.exchanges))
+        remap = np.asarray([names.index(e or "Unknown") for e in self.exchanges], dtype=np.int16)
+        codes = remap[self.exchange[idx]] if len(remap) else self.exchange[idx]
+        k = len(names)
+        count = np.bincount(codes, minlength=k)
+        volume = np.bincount(codes, weights=np.nan_to_num(self.volume[idx], nan=0.0), minlength=k)
+        chg = np.bincount(codes, weights=np.nan_to_num(self.change_pct_day[idx], nan=0.0), minlength=k)
+        _, first = np.unique(codes, return_index=True)
+        seen = codes[np.sort(first)]  # exchanges in order of first appearance (stable ties)
+        out = [
+            {
+                "exchange": names[c],
+                "count": int(count[c]),
+                "volume": float(volume[c]),
+                "avg_change_pct": round(float(chg[c]) / max(1, int(count[c])), 2),
+            }
+            for c in seen.tolist()
+        ]
+        out.sort(key=lambda m: m["volume"], reverse=True)
+        return out
+
+    def breadth(self, idx: np.ndarray, flat_band: float = 0.15) -> dict[str, int]:
+        chg = np.nan_to_num(self.change_pct_day[idx], nan=0.0)
+        up, down = int((chg > flat_band).sum()), int((chg < -flat_band).sum())
+        return {"up": up, "down": down, "flat": max(0, len(idx) - up - down)}
+
+
+__all__ = ["QuoteColumns"]
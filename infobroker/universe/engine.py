@@ -7,14 +7,24 @@ import time
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from infobroker.data.multisource import fetch_snapshot_multisource, provider_status
+import numpy as np
+
+from infobroker.data.http_pool import http_stats
+from infobroker.data.multisource import fetch_snapshots_multisource, provider_status
+from infobroker.markets.sessions import market_clocks
+from infobroker.universe.leaderboards import ALL as ALL_PARTITION, CAPACITY as LEADERBOARD_CAPACITY
 from infobroker.universe.listings import fetch_us_listings
+from infobroker.universe.scheduler import MAX_BATCH, QuoteScheduler
+from infobroker.universe.snapshot import (
+    UniverseSnapshot,
+    current_snapshot,
+    publish_quotes,
+    reload_snapshot,
+)
 from infobroker.universe.store import (
-    load_universe,
     path as universe_path,
-    quote_count,
-    save_universe,
-    symbol_count,
+    replace_listings,
+    upsert_quotes,
 )
 
 # Prefer liquid / index names when the quote cache is still filling
@@ -47,18 +57,17 @@ _SEED_PRIORITY = [
 ]
 
 _LISTINGS_MAX_AGE_SEC = 24 * 3600
-_WORKER_INTERVAL_SEC = 35
-_DEFAULT_BATCH = 160
-_MAX_BATCH = 400
 
 _worker_thread: Optional[threading.Thread] = None
 _worker_stop = threading.Event()
+_worker_lock = threading.Lock()
 _worker_status: dict[str, Any] = {
     "running": False,
     "last_cycle_at": None,
     "last_error": None,
     "last_batch_ok": 0,
     "last_batch_size": 0,
+    "last_fetch": None,
 }
 _status_lock = threading.Lock()
 _refresh_lock = threading.Lock()
@@ -82,34 +91,34 @@ def _age_seconds(raw: Optional[str]) -> Optional[float]:
     return (datetime.now(timezone.utc) - dt).total_seconds()
 
 
-def listings_stale(data: Optional[dict[str, Any]] = None) -> bool:
-    d = data if data is not None else load_universe()
-    if symbol_count(d) < 100:
+def listings_stale(snap: Optional[UniverseSnapshot] = None) -> bool:
+    snap = snap if snap is not None else current_snapshot()
+    if snap.total < 100:
         return True
-    age = _age_seconds(d.get("listings_as_of"))
+    age = _age_seconds(snap.listings_as_of)
     if age is None:
         return True
     return age > _LISTINGS_MAX_AGE_SEC
 
 
 def refresh_listings(force: bool = False) -> dict[str, Any]:
-    """Pull official NASDAQ/NYSE directories into data/universe.json."""
+    """Pull official NASDAQ/NYSE directories into data/universe.db."""
     with _refresh_lock:
-        data = load_universe()
-        if not force and not listings_stale(data):
+        snap = current_snapshot()
+        if not force and not listings_stale(snap):
             return {
                 "ok": True,
                 "skipped": True,
                 "reason": "listings still fresh",
-                "count": symbol_count(data),
-                "listings_as_of": data.get("listings_as_of"),
+                "count": snap.total,
+                "listings_as_of": snap.listings_as_of,
             }
 
         rows = fetch_us_listings()
         if not rows:
             raise RuntimeError("NASDAQ symbol directory returned zero rows")
 
-        old = data.get("symbols") or {}
+        old = snap.symbols
         merged: dict[str, Any] = {}
         for row in rows:
             sym = row["symbol"]
@@ -125,16 +134,16 @@ def refresh_listings(force: bool = False) -> dict[str, Any]:
             }
 
         # Drop symbols no longer listed (keep if they still have a quote? no — trust directory)
-        data["symbols"] = merged
-        data["listings_as_of"] = datetime.now(timezone.utc).isoformat()
+        listings_as_of = datetime.now(timezone.utc).isoformat()
         # Keep cursor in range
-        data["refresh_cursor"] = int(data.get("refresh_cursor") or 0) % max(len(merged), 1)
-        save_universe(data)
+        cursor = snap.refresh_cursor % max(len(merged), 1)
+        replace_listings(merged, listings_as_of=listings_as_of, refresh_cursor=cursor)
+        reload_snapshot()
         return {
             "ok": True,
             "skipped": False,
             "count": len(merged),
-            "listings_as_of": data["listings_as_of"],
+            "listings_as_of": listings_as_of,
             "exchanges": _exchange_counts(merged),
         }
 
@@ -147,35 +156,37 @@ def _exchange_counts(symbols: dict[str, Any]) -> dict[str, int]:
     return dict(sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])))
 
 
-def _ordered_symbols(data: dict[str, Any]) -> list[str]:
-    """Priority seeds → never-quoted → stale quotes → fresh (cursor rotates through)."""
-    symbols = data.get("symbols") or {}
-    if not symbols:
-        return []
-    priority = [s for s in _SEED_PRIORITY if s in symbols]
-    pri_set = set(priority)
-    unquoted: list[str] = []
-    stale: list[str] = []
-    fresh: list[str] = []
-    for sym, meta in symbols.items():
-        if sym in pri_set:
-            continue
-        q = meta.get("quote") or {}
-        if q.get("price") is None:
-            unquoted.append(sym)
-            continue
-        age = _age_seconds(q.get("as_of"))
-        if age is None or age > 45 * 60:
-            stale.append(sym)
-        else:
-            fresh.append(sym)
-    unquoted.sort()
-    stale.sort()
-    fresh.sort()
-    return priority + unquoted + stale + fresh
-
-
-def _apply_quote(meta: dict[str, Any], snap: dict[str, Any]) -> None:
+def _pinned_symbols() -> set[str]:
+    """Watchlist + open paper positions — refreshed on the fastest cadence."""
+    from infobroker.brokers.paper import ledger_symbols
+    from infobroker.config import get_settings
+    from infobroker.watchlist import list_symbols
+
+    return set(list_symbols()) | ledger_symbols(get_settings().ledger_path)
+
+
+def _us_open() -> bool:
+    try:
+        return bool(market_clocks().get("us_open"))
+    except Exception:  # noqa: BLE001
+        return True
+
+
+def _fetch_delta(before: dict[str, dict[str, int]], after: dict[str, dict[str, int]], elapsed: float) -> dict[str, Any]:
+    """Per-cycle HTTP cost: latency plus requests / sockets opened across providers."""
+    out: dict[str, Any] = {"latency_ms": round(elapsed * 1000, 1)}
+    for key in ("requests", "sockets_opened", "sockets_reused", "errors"):
+        out[key] = sum(after[p][key] - before.get(p, {}).get(key, 0) for p in after)
+    return out
+
+
+_scheduler = QuoteScheduler(pinned=_SEED_PRIORITY)
+_scheduler.set_pin_source(_pinned_symbols)
+
+
+def _apply_quote(meta: dict[str, Any], snap: dict[str, Any]) -> dict[str, Any]:
+    """Return a new meta with the quote applied — published snapshots stay untouched."""
+    meta = dict(meta)
     prev_q = meta.get("quote") or {}
     spark = (snap.get("sparkline") or [])[-12:]
     if not spark:
@@ -198,13 +209,18 @@ def _apply_quote(meta: dict[str, Any], snap: dict[str, Any]) -> None:
     }
     if snap.get("name") and (not meta.get("name") or meta.get("name") == meta.get("symbol")):
         meta["name"] = snap["name"]
+    return meta
+
 
+def refresh_quotes(batch_size: Optional[int] = None) -> dict[str, Any]:
+    """Refresh the symbols the scheduler says are due — bulk Yahoo first, then per-symbol fallback.
 
-def refresh_quotes(batch_size: int = _DEFAULT_BATCH) -> dict[str, Any]:
-    """Refresh the next rotating batch — bulk Yahoo first, then per-symbol fallback."""
-    from infobroker.data.highlights import fetch_yahoo_quotes_bulk
+    batch_size=None lets the scheduler size the batch and skip the cycle when
+    nothing is due; an explicit size (manual refresh) fills up with the soonest-due.
+    """
+    from infobroker.data.highlights import bulk_quote_stats, fetch_yahoo_quotes_bulk
 
-    batch_size = max(10, min(int(batch_size), _MAX_BATCH))
+    limit = None if batch_size is None else max(10, min(int(batch_size), MAX_BATCH))
     if listings_stale():
         try:
             refresh_listings(force=False)
@@ -214,82 +230,85 @@ def refresh_quotes(batch_size: int = _DEFAULT_BATCH) -> dict[str, Any]:
 
     sources_used: dict[str, int] = {}
     with _refresh_lock:
-        data = load_universe()
-        ordered = _ordered_symbols(data)
-        if not ordered:
+        base = current_snapshot()
+        if not base.symbols:
             return {"ok": False, "error": "universe empty — refresh listings first", "updated": 0}
 
-        cursor = int(data.get("refresh_cursor") or 0) % len(ordered)
-        batch = []
-        for i in range(batch_size):
-            batch.append(ordered[(cursor + i) % len(ordered)])
-        data["refresh_cursor"] = (cursor + batch_size) % len(ordered)
+        batch = _scheduler.next_batch(base, limit, us_open=_us_open())
+        if not batch:
+            return {"ok": True, "skipped": True, "reason": "nothing due", "updated": 0}
+        next_cursor = (base.refresh_cursor + len(batch)) % base.total
 
+        limited_before = bulk_quote_stats()["rate_limited"]
+        http_before = http_stats()
+        started = time.perf_counter()
         bulk = fetch_yahoo_quotes_bulk(batch)
+        rate_limited = bulk_quote_stats()["rate_limited"] - limited_before
         updated = 0
         errors = 0
         missing: list[str] = []
+        touched: list[dict[str, Any]] = []
         for sym in batch:
-            meta = data["symbols"].get(sym)
+            meta = base.symbols.get(sym)
             if not meta:
                 continue
             snap = bulk.get(sym)
             if snap:
                 src = snap.get("source") or "yahoo_bulk"
                 sources_used[src] = sources_used.get(src, 0) + 1
-                _apply_quote(meta, snap)
+                touched.append(_apply_quote(meta, snap))
                 updated += 1
             else:
                 missing.append(sym)
 
-        # Parallel chart / Finnhub fallback for bulk misses (fills sparklines too)
+        # Concurrent chart / Finnhub fallback for bulk misses (fills sparklines too)
         if missing:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-
-            def _one(sym: str) -> tuple[str, Optional[dict[str, Any]]]:
-                return sym, fetch_snapshot_multisource(
-                    sym, allow_finnhub=True, allow_alphavantage=False
-                )
-
-            workers = min(18, max(4, len(missing)))
-            with ThreadPoolExecutor(max_workers=workers) as pool:
-                futs = [pool.submit(_one, s) for s in missing]
-                for fut in as_completed(futs):
-                    try:
-                        sym, snap = fut.result()
-                    except Exception:
-                        errors += 1
-                        continue
-                    meta = data["symbols"].get(sym)
-                    if not meta:
-                        continue
-                    if snap:
-                        src = snap.get("source") or "yahoo"
-                        sources_used[src] = sources_used.get(src, 0) + 1
-                        _apply_quote(meta, snap)
-                        updated += 1
-                    else:
-                        errors += 1
-
-        data["quotes_as_of"] = datetime.now(timezone.utc).isoformat()
-        save_universe(data)
+            fallback = fetch_snapshots_multisource(missing, allow_finnhub=True, allow_alphavantage=False)
+            for sym in missing:
+                meta = base.symbols.get(sym)
+                if not meta:
+                    continue
+                snap = fallback.get(sym)
+                if snap:
+                    src = snap.get("source") or "yahoo"
+                    sources_used[src] = sources_used.get(src, 0) + 1
+                    touched.append(_apply_quote(meta, snap))
+                    updated += 1
+                else:
+                    errors += 1
+        fetch = _fetch_delta(http_before, http_stats(), time.perf_counter() - started)
+
+        quotes_as_of = datetime.now(timezone.utc).isoformat()
+        version = upsert_quotes(touched, refresh_cursor=next_cursor, quotes_as_of=quotes_as_of)
+        published = publish_quotes(
+            base,
+            touched,
+            version=version,
+            quotes_as_of=quotes_as_of,
+            refresh_cursor=next_cursor,
+        )
+        _scheduler.record(published, batch, [m["symbol"] for m in touched], rate_limited)
         result = {
             "ok": True,
             "updated": updated,
             "errors": errors,
             "batch_size": len(batch),
             "bulk_hits": len(bulk),
-            "cursor": data["refresh_cursor"],
-            "quoted": quote_count(data),
-            "total": symbol_count(data),
-            "quotes_as_of": data["quotes_as_of"],
+            "rate_limited": rate_limited,
+            "fetch": fetch,
+            "cursor": next_cursor,
+            "quoted": published.quoted_count,
+            "total": published.total,
+            "quotes_as_of": quotes_as_of,
+            "version": published.version,
             "sources_used": sources_used,
             "providers": provider_status(),
         }
         with _status_lock:
-            _worker_status["last_cycle_at"] = data["quotes_as_of"]
+            _worker_status["last_cycle_at"] = quotes_as_of
             _worker_status["last_batch_ok"] = updated
             _worker_status["last_batch_size"] = len(batch)
+            _worker_status["last_fetch"] = fetch
             if errors and not updated:
                 _worker_status["last_error"] = f"{errors} quote failures in batch"
             elif updated:
@@ -300,32 +319,28 @@ def refresh_quotes(batch_size: int = _DEFAULT_BATCH) -> dict[str, Any]:
 def ensure_universe(force_listings: bool = False) -> dict[str, Any]:
     """Make sure listings exist; kick a small quote batch if cache is empty."""
     info = refresh_listings(force=force_listings)
-    data = load_universe()
-    if quote_count(data) < 20:
+    if current_snapshot().quoted_count < 20:
         q = refresh_quotes(batch_size=60)
         info["quotes"] = q
     return info
 
 
 def universe_status() -> dict[str, Any]:
-    data = load_universe()
-    symbols = data.get("symbols") or {}
+    snap = current_snapshot()
     with _status_lock:
         worker = dict(_worker_status)
-    classes: dict[str, int] = {}
-    for meta in symbols.values():
-        ac = meta.get("asset_class") or "other"
-        classes[ac] = classes.get(ac, 0) + 1
     return {
-        "total": len(symbols),
-        "quoted": quote_count(data),
-        "listings_as_of": data.get("listings_as_of"),
-        "quotes_as_of": data.get("quotes_as_of"),
-        "listings_stale": listings_stale(data),
-        "refresh_cursor": data.get("refresh_cursor") or 0,
-        "exchanges": _exchange_counts(symbols),
-        "asset_classes": dict(sorted(classes.items(), key=lambda kv: (-kv[1], kv[0]))),
+        "total": snap.total,
+        "quoted": snap.quoted_count,
+        "version": snap.version,
+        "listings_as_of": snap.listings_as_of,
+        "quotes_as_of": snap.quotes_as_of,
+        "listings_stale": listings_stale(snap),
+        "refresh_cursor": snap.refresh_cursor,
+        "exchanges": dict(snap.exchanges),
+        "asset_classes": dict(snap.asset_classes),
         "worker": worker,
+        "scheduler": _scheduler.status(),
         "path": str(universe_path()),
     }
 
@@ -339,7 +354,7 @@ def list_universe(
     limit: int = 100,
     offset: int = 0,
 ) -> dict[str, Any]:
-    data = load_universe()
+    snap = current_snapshot()
     qn = (q or "").strip().upper()
     exch = (exchange or "").strip().lower()
     ac = (asset_class or "").strip().lower()
@@ -347,7 +362,7 @@ def list_universe(
     offset = max(0, int(offset))
 
     rows: list[dict[str, Any]] = []
-    for sym, meta in (data.get("symbols") or {}).items():
+    for sym, meta in snap.symbols.items():
         if qn and qn not in sym and qn not in (meta.get("name") or "").upper():
             continue
         if exch and exch not in (meta.get("exchange") or "").lower():
@@ -393,15 +408,14 @@ def list_universe(
         "offset": offset,
         "limit": limit,
         "items": page,
-        "listings_as_of": data.get("listings_as_of"),
-        "quotes_as_of": data.get("quotes_as_of"),
+        "listings_as_of": snap.listings_as_of,
+        "quotes_as_of": snap.quotes_as_of,
     }
 
 
 def get_symbol(symbol: str) -> Optional[dict[str, Any]]:
     sym = (symbol or "").strip().upper().replace(".", "-")
-    data = load_universe()
-    meta = (data.get("symbols") or {}).get(sym)
+    meta = current_snapshot().symbols.get(sym)
     if not meta:
         return None
     return {
@@ -416,80 +430,75 @@ def get_symbol(symbol: str) -> Optional[dict[str, Any]]:
 
 
 def quoted_rows() -> list[dict[str, Any]]:
-    """All symbols that currently have a quote snapshot (for movers / highlights)."""
-    data = load_universe()
-    out: list[dict[str, Any]] = []
-    for sym, meta in (data.get("symbols") or {}).items():
-        q = meta.get("quote")
-        if not q or q.get("price") is None:
-            continue
-        out.append(
-            {
-                "symbol": sym,
-                "name": meta.get("name") or sym,
-                "price": q.get("price"),
-                "change_abs_day": q.get("change_abs_day"),
-                "change_pct_day": q.get("change_pct_day"),
-                "change_pct_week": q.get("change_pct_week"),
-                "volume": q.get("volume"),
-                "rel_volume": q.get("rel_volume"),
-                "high": q.get("high"),
-                "low": q.get("low"),
-                "sparkline": q.get("sparkline") or [],
-                "as_of": q.get("as_of"),
-                "source": q.get("source") or "yahoo",
-                "etf": bool(meta.get("etf")),
-                "asset_class": meta.get("asset_class"),
-                "exchange": meta.get("exchange"),
-            }
-        )
-    return out
+    """All symbols that currently have a quote snapshot (for movers / highlights).
+
+    Rows are shared with the published snapshot — copy before mutating.
+    """
+    return list(current_snapshot().quoted)
+
+
+_INDEX_ETFS = ("SPY", "QQQ", "IWM", "DIA")
+
+
+def movers(limit: int = 15, asset_class: str = "", exchange: str = "") -> dict[str, Any]:
+    """Day/week gainers + losers and volume leaders, read off the incremental leaderboards.
+
+    `asset_class` is a comma list of classes; `exchange` is a case-insensitive
+    substring (same rule as the exchange boards).
+    """
+    snap = current_snapshot()
+    leaders = snap.leaders
+    limit = max(3, min(int(limit), LEADERBOARD_CAPACITY))
+    classes = {c.strip().lower() for c in (asset_class or "").split(",") if c.strip()}
+    exch = (exchange or "").strip().lower()
 
+    def in_classes(sym: str) -> bool:
+        return (snap.symbols[sym].get("asset_class") or "other") in classes
+
+    accept = None
+    if exch:
+        parts = [("exchange", e) for e in leaders.keys("exchange") if exch in e.lower()]
+        vol_parts = parts
+        if classes:
+            accept = in_classes
+    elif classes:
+        parts = [("asset_class", c) for c in leaders.keys("asset_class") if c in classes]
+        vol_parts = parts
+    else:
+        # Prefer equities/ADRs for "stocks of day"; keep ETFs in volume
+        parts = [("asset_class", c) for c in ("stock", "adr", "other")]
+        vol_parts = [ALL_PARTITION]
+
+    def pool(sym: str) -> bool:
+        return sym not in _INDEX_ETFS and (accept is None or accept(sym))
+
+    if not exch and not classes and not leaders.top("day_gainers", 1, parts, pool):
+        parts = [ALL_PARTITION]
+
+    def board(metric: str, board_parts: list[tuple[str, str]], keep: Any = pool) -> list[dict[str, Any]]:
+        return [snap.rows[s] for s in leaders.top(metric, limit, board_parts, keep)]
 
-def movers(limit: int = 15) -> dict[str, Any]:
-    rows = quoted_rows()
-    # Prefer equities/ADRs for "stocks of day"; keep ETFs in volume
-    equities = [
-        r
-        for r in rows
-        if r.get("asset_class") in {"stock", "adr", "other"} and r["symbol"] not in {"SPY", "QQQ", "IWM", "DIA"}
-    ]
-    pool = equities or [r for r in rows if r["symbol"] not in {"SPY", "QQQ", "IWM", "DIA"}]
-    limit = max(3, min(int(limit), 50))
-    gainers = sorted(pool, key=lambda r: r.get("change_pct_day") or -999, reverse=True)[:limit]
-    losers = sorted(pool, key=lambda r: r.get("change_pct_day") or 999)[:limit]
-    week_gainers = sorted(pool, key=lambda r: r.get("change_pct_week") or -999, reverse=True)[:limit]
-    week_losers = sorted(pool, key=lambda r: r.get("change_pct_week") or 999)[:limit]
-    volume_leaders = sorted(
-        [r for r in rows if r.get("volume")],
-        key=lambda r: r.get("volume") or 0,
-        reverse=True,
-    )[:limit]
     return {
         "as_of": datetime.now(timezone.utc).isoformat(),
-        "quoted": len(rows),
-        "stocks_of_day": {"gainers": gainers, "losers": losers},
-        "stocks_of_week": {"gainers": week_gainers, "losers": week_losers},
-        "volume_leaders": volume_leaders,
+        "quoted": snap.quoted_count,
+        "stocks_of_day": {"gainers": board("day_gainers", parts), "losers": board("day_losers", parts)},
+        "stocks_of_week": {"gainers": board("week_gainers", parts), "losers": board("week_losers", parts)},
+        "volume_leaders": board("volume", vol_parts, accept),
     }
 
 
 def liquid_scan_symbols(n: int = 120) -> list[str]:
     """Symbols to feed the strategy scanner — liquid quoted names, not just watchlist."""
-    n = max(10, min(int(n), 300))
-    rows = quoted_rows()
+    n = max(10, min(int(n), 2000))
+    cols = current_snapshot().columns
     # Prefer non-ETF with volume; fall back to any quoted
-    equities = [
-        r
-        for r in rows
-        if not r.get("etf") and r.get("asset_class") in {"stock", "adr", "other"}
-    ]
-    pool = equities if len(equities) >= 20 else rows
-    pool = sorted(pool, key=lambda r: (r.get("volume") or 0), reverse=True)
-    syms = [r["symbol"] for r in pool[:n]]
+    equities = ~cols.etf & cols.asset_class_mask({"stock", "adr", "other"})
+    pool = equities if int(equities.sum()) >= 20 else None
+    ranked = cols.top(np.nan_to_num(cols.volume, nan=0.0), n, pool)
+    syms = [str(s) for s in cols.symbol[ranked]]
     if len(syms) < n:
-        data = load_universe()
-        for s in _SEED_PRIORITY + sorted((data.get("symbols") or {}).keys()):
+        listed = list(current_snapshot().symbols)
+        for s in _SEED_PRIORITY + listed:
             if s not in syms:
                 syms.append(s)
             if len(syms) >= n:
@@ -497,6 +506,23 @@ def liquid_scan_symbols(n: int = 120) -> list[str]:
     return syms[:n]
 
 
+def _worker_stopped(wait: float) -> bool:
+    """Sleep up to `wait`; True once this thread should exit.
+
+    A stop followed by a restart before the thread noticed clears the event,
+    so the running thread carries on instead of exiting under a new leader.
+    """
+    global _worker_thread
+    if not _worker_stop.wait(wait):
+        return False
+    with _worker_lock:
+        if not _worker_stop.is_set():
+            return False
+        if _worker_thread is threading.current_thread():
+            _worker_thread = None
+        return True
+
+
 def _worker_loop() -> None:
     with _status_lock:
         _worker_status["running"] = True
@@ -507,11 +533,11 @@ def _worker_loop() -> None:
             with _status_lock:
                 _worker_status["last_error"] = str(exc)
 
-        while not _worker_stop.wait(_WORKER_INTERVAL_SEC):
+        while not _worker_stopped(_scheduler.interval_sec):
             try:
                 if listings_stale():
                     refresh_listings(force=False)
-                refresh_quotes(batch_size=_DEFAULT_BATCH)
+                refresh_quotes()
             except Exception as exc:  # noqa: BLE001
                 with _status_lock:
                     _worker_status["last_error"] = str(exc)
@@ -522,16 +548,18 @@ def _worker_loop() -> None:
 
 
 def start_background_engine() -> None:
+    """Start the worker (idempotent); a thread still finishing a stopped pass is kept."""
     global _worker_thread
-    if _worker_thread and _worker_thread.is_alive():
-        return
-    _worker_stop.clear()
-    _worker_thread = threading.Thread(
-        target=_worker_loop,
-        name="universe-engine",
-        daemon=True,
-    )
-    _worker_thread.start()
+    with _worker_lock:
+        _worker_stop.clear()
+        if _worker_thread and _worker_thread.is_alive():
+            return
+        _worker_thread = threading.Thread(
+            target=_worker_loop,
+            name="universe-engine",
+            daemon=True,
+        )
+        _worker_thread.start()
 
 
 def stop_background_engine() -> None:
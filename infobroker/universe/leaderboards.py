@@ -0,0 +1,178 @@
+"""Bounded mover leaderboards, maintained incrementally per quote batch.
+
+One sorted board per (metric, partition) where partitions are the whole
+universe, each asset class and each exchange. `publish_quotes` applies the
+touched symbols copy-on-write, so a movers read is a merge of at most a few
+200-entry lists instead of sorting every quoted row.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from bisect import bisect_left, insort
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
+
+CAPACITY = 200
+# A board that lost members to values outside it is rebuilt below this size
+_LOW_WATER = 60
+
+# metric → (row field, descending)
+METRICS: dict[str, tuple[str, bool]] = {
+    "day_gainers": ("change_pct_day", True),
+    "day_losers": ("change_pct_day", False),
+    "week_gainers": ("change_pct_week", True),
+    "week_losers": ("change_pct_week", False),
+    "volume": ("volume", True),
+}
+
+Partition = tuple[str, str]  # ("all", "") | ("asset_class", x) | ("exchange", x)
+ALL: Partition = ("all", "")
+
+
+def partitions(meta: Mapping[str, Any]) -> tuple[Partition, ...]:
+    return (
+        ALL,
+        ("asset_class", meta.get("asset_class") or "other"),
+        ("exchange", meta.get("exchange") or "Unknown"),
+    )
+
+
+def _value(row: Optional[Mapping[str, Any]], metric: str) -> Optional[float]:
+    if not row:
+        return None
+    field, _ = METRICS[metric]
+    try:
+        v = float(row.get(field))
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(v) or (metric == "volume" and v <= 0):
+        return None
+    return v
+
+
+class _Board:
+    """Exact top-n of one partition; `complete` when nothing eligible lies outside."""
+
+    __slots__ = ("desc", "entries", "members", "complete")
+
+    def __init__(self, desc: bool):
+        self.desc = desc
+        self.entries: list[tuple[float, str]] = []  # ascending (sort key, symbol)
+        self.members: dict[str, float] = {}
+        self.complete = True
+
+    def copy(self) -> "_Board":
+        b = _Board(self.desc)
+        b.entries = list(self.entries)
+        b.members = dict(self.members)
+        b.complete = self.complete
+        return b
+
+    def fill(self, values: Iterable[tuple[str, float]]) -> None:
+        keyed = [((-v if self.desc else v), sym) for sym, v in values]
+        self.entries = heapq.nsmallest(CAPACITY, keyed)
+        self.members = {sym: k for k, sym in self.entries}
+        self.complete = len(keyed) <= CAPACITY
+
+    def update(self, sym: str, value: Optional[float]) -> None:
+        old = self.members.pop(sym, None)
+        if old is not None:
+            del self.entries[bisect_left(self.entries, (old, sym))]
+        if value is None:
+            return
+        item = ((-value if self.desc else value), sym)
+        if self.complete or (self.entries and item < self.entries[-1]):
+            insort(self.entries, item)
+            self.members[sym] = item[0]
+            if len(self.entries) > CAPACITY:
+                _, out = self.entries.pop()
+                del self.members[out]
+                self.complete = False
+
+    @property
+    def short(self) -> bool:
+        return not self.complete and len(self.entries) < _LOW_WATER
+
+
+class Leaderboards:
+    """Immutable-by-convention set of boards; `apply` returns an updated copy."""
+
+    def __init__(self, boards: dict[tuple[str, Partition], _Board]):
+        self._boards = boards
+
+    @classmethod
+    def build(cls, metas: Mapping[str, Mapping[str, Any]], rows: Mapping[str, Mapping[str, Any]]) -> "Leaderboards":
+        groups: dict[Partition, list[str]] = {}
+        for sym, meta in metas.items():
+            for part in partitions(meta):
+                groups.setdefault(part, []).append(sym)
+        boards: dict[tuple[str, Partition], _Board] = {}
+        for part, syms in groups.items():
+            for metric, (_, desc) in METRICS.items():
+                board = _Board(desc)
+                board.fill(_eligible(syms, rows, metric))
+                boards[(metric, part)] = board
+        return cls(boards)
+
+    def apply(
+        self,
+        metas: Iterable[Mapping[str, Any]],
+        all_metas: Mapping[str, Mapping[str, Any]],
+        rows: Mapping[str, Mapping[str, Any]],
+    ) -> "Leaderboards":
+        boards = dict(self._boards)
+        copied: set[tuple[str, Partition]] = set()
+        for meta in metas:
+            sym = meta["symbol"]
+            row = rows.get(sym)
+            for part in partitions(meta):
+                for metric, (_, desc) in METRICS.items():
+                    key = (metric, part)
+                    if key not in copied:
+                        boards[key] = boards[key].copy() if key in boards else _Board(desc)
+                        copied.add(key)
+                    boards[key].update(sym, _value(row, metric))
+        for key in copied:
+            if boards[key].short:
+                metric, part = key
+                syms = [s for s, m in all_metas.items() if part in partitions(m)]
+                boards[key].fill(_eligible(syms, rows, metric))
+        return Leaderboards(boards)
+
+    def keys(self, dim: str) -> list[str]:
+        return sorted({part[1] for _, part in self._boards if part[0] == dim})
+
+    def top(
+        self,
+        metric: str,
+        limit: int,
+        parts: Iterable[Partition] = (ALL,),
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> list[str]:
+        """Best `limit` symbols across `parts` (merged), optionally filtered."""
+        out: list[str] = []
+        for sym in _merge(self._boards.get((metric, p)) for p in parts):
+            if accept is None or accept(sym):
+                out.append(sym)
+                if len(out) >= limit:
+                    break
+        return out
+
+
+def _eligible(syms: Iterable[str], rows: Mapping[str, Mapping[str, Any]], metric: str) -> Iterator[tuple[str, float]]:
+    for sym in syms:
+        v = _value(rows.get(sym), metric)
+        if v is not None:
+            yield sym, v
+
+
+def _merge(boards: Iterable[Optional[_Board]]) -> Iterator[str]:
+    seen: set[str] = set()
+    for _, sym in heapq.merge(*[b.entries for b in boards if b is not None]):
+        if sym not in seen:
+            seen.add(sym)
+            yield sym
+
+
+__all__ = ["ALL", "CAPACITY", "METRICS", "Leaderboards", "partitions"]
@@ -0,0 +1,263 @@
+"""Adaptive quote refresh scheduler for the universe engine.
+
+Every listed symbol has a next-due time in a heap. Liquid, volatile and pinned
+names (watchlist, open positions, seed index names) come due more often; the
+whole universe slows down while the US session is closed. Batch size and
+worker cadence back off on Yahoo 429s / poor hit rates and speed up again
+while a backlog of due symbols builds.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from infobroker.universe.snapshot import UniverseSnapshot
+
+DEFAULT_BATCH = 160
+MIN_BATCH = 40
+MAX_BATCH = 400
+DEFAULT_INTERVAL_SEC = 35.0
+MIN_INTERVAL_SEC = 15.0
+MAX_INTERVAL_SEC = 180.0
+
+_PIN_TTL_SEC = 60.0
+_CLOSED_FACTOR = 12.0
+_CLOSED_MAX_SEC = 4 * 3600.0
+_RETRY_SEC = (120.0, 600.0, 1800.0)
+
+# (min volume, refresh interval seconds) — first match wins
+_LIQUIDITY_TIERS: tuple[tuple[float, float], ...] = (
+    (5_000_000, 60.0),
+    (1_000_000, 120.0),
+    (200_000, 300.0),
+    (20_000, 900.0),
+    (0, 1800.0),
+)
+_PINNED_SEC = 30.0
+
+
+def _epoch(iso: Optional[str]) -> Optional[float]:
+    if not iso:
+        return None
+    try:
+        return datetime.fromisoformat(str(iso).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def refresh_interval(quote: Optional[dict[str, Any]], pinned: bool = False, us_open: bool = True) -> float:
+    """Seconds until a symbol with this quote should be refreshed again."""
+    if pinned:
+        sec = _PINNED_SEC
+    else:
+        vol = float((quote or {}).get("volume") or 0)
+        sec = next(s for floor, s in _LIQUIDITY_TIERS if vol >= floor)
+        move = abs(float((quote or {}).get("change_pct_day") or 0))
+        if move >= 5:
+            sec /= 3
+        elif move >= 2:
+            sec /= 2
+    if not us_open:
+        sec = min(sec * _CLOSED_FACTOR, _CLOSED_MAX_SEC)
+    return sec
+
+
+class QuoteScheduler:
+    """Heap of (due_at, symbol) with lazy invalidation via `_due`."""
+
+    def __init__(self, pinned: Iterable[str] = ()):
+        self._lock = threading.Lock()
+        self._heap: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}
+        self._refreshed: dict[str, float] = {}
+        self._failures: dict[str, int] = {}
+        self._listing_key: Optional[tuple[Any, ...]] = None
+        self._seed = frozenset(pinned)
+        self._pins: frozenset[str] = self._seed
+        self._pins_at = 0.0
+        self._pin_source: Any = None
+        self.batch_size = DEFAULT_BATCH
+        self.interval_sec = DEFAULT_INTERVAL_SEC
+        self.us_open = True
+        self.last_rate_limited = 0
+
+    # ── pins / listings ──────────────────────────────────────────────────
+    def set_pin_source(self, fn: Any) -> None:
+        """`fn() -> Iterable[str]` returning watchlist + position symbols."""
+        self._pin_source = fn
+        self._pins_at = 0.0
+
+    def _refresh_pins(self, now: float) -> None:
+        if self._pin_source is None or now - self._pins_at < _PIN_TTL_SEC:
+            return
+        self._pins_at = now
+        try:
+            extra = {str(s).upper() for s in self._pin_source()}
+        except Exception:  # noqa: BLE001
+            return
+        added = extra - self._pins
+        self._pins = self._seed | extra
+        for sym in added:
+            self._push(sym, now)
+
+    def _sync(self, snap: UniverseSnapshot, now: float) -> None:
+        key = (snap.listings_as_of, snap.total)
+        if key == self._listing_key:
+            return
+        self._listing_key = key
+        self._heap = []
+        self._due = {}
+        self._refreshed = {}
+        self._failures = {k: v for k, v in self._failures.items() if k in snap.symbols}
+        for sym, meta in snap.symbols.items():
+            q = meta.get("quote") or {}
+            at = _epoch(q.get("as_of")) if q.get("price") is not None else None
+            if at is None:
+                due = now
+            else:
+                self._refreshed[sym] = at
+                due = at + refresh_interval(q, sym in self._pins, self.us_open)
+            self._due[sym] = due
+            self._heap.append((due, sym))
+        heapq.heapify(self._heap)
+
+    def _reopen(self, snap: UniverseSnapshot) -> None:
+        """US cash just opened: pull closed-session due times (up to 12× longer) in to open cadence."""
+        for sym, at in self._refreshed.items():
+            if sym not in self._due:
+                continue
+            q = (snap.symbols.get(sym) or {}).get("quote")
+            self._due[sym] = min(self._due[sym], at + refresh_interval(q, sym in self._pins, True))
+        self._heap = [(d, s) for s, d in self._due.items()]
+        heapq.heapify(self._heap)
+
+    def _push(self, sym: str, due: float) -> None:
+        if sym not in self._due:
+            return
+        if due < self._due[sym]:
+            self._due[sym] = due
+            heapq.heappush(self._heap, (due, sym))
+
+    # ── scheduling ───────────────────────────────────────────────────────
+    def next_batch(
+        self,
+        snap: UniverseSnapshot,
+        limit: Optional[int] = None,
+        us_open: bool = True,
+        now: Optional[float] = None,
+    ) -> list[str]:
+        """Due symbols, most overdue first. An explicit `limit` fills up with the soonest-due."""
+        now = time.time() if now is None else now
+        with self._lock:
+            reopened = us_open and not self.us_open
+            self.us_open = us_open
+            self._sync(snap, now)
+            if reopened:
+                self._reopen(snap)
+            self._refresh_pins(now)
+            n = self.batch_size if limit is None else limit
+            out: list[str] = []
+            while self._heap and len(out) < n:
+                due, sym = self._heap[0]
+                if limit is None and due > now:
+                    break
+                heapq.heappop(self._heap)
+                if self._due.get(sym) != due:
+                    continue  # superseded entry
+                out.append(sym)
+            # Re-arm immediately so a crash mid-cycle can't drop symbols from the heap
+            for sym in out:
+                self._due[sym] = now + _RETRY_SEC[0]
+                heapq.heappush(self._heap, (self._due[sym], sym))
+            return out
+
+    def record(
+        self,
+        snap: UniverseSnapshot,
+        batch: list[str],
+        updated: Iterable[str],
+        rate_limited: int = 0,
+        now: Optional[float] = None,
+    ) -> None:
+        """Reschedule a finished batch and adapt batch size / cadence."""
+        now = time.time() if now is None else now
+        ok = set(updated)
+        with self._lock:
+            for sym in batch:
+                if sym not in self._due:
+                    continue
+                if sym in ok:
+                    self._failures.pop(sym, None)
+                    self._refreshed[sym] = now
+                    q = (snap.symbols.get(sym) or {}).get("quote")
+                    due = now + refresh_interval(q, sym in self._pins, self.us_open)
+                else:
+                    n = self._failures.get(sym, 0)
+                    self._failures[sym] = n + 1
+                    due = now + _RETRY_SEC[min(n, len(_RETRY_SEC) - 1)]
+                self._due[sym] = due
+                heapq.heappush(self._heap, (due, sym))
+            if len(self._heap) > 4 * max(len(self._due), 1):
+                self._heap = [(d, s) for s, d in self._due.items()]
+                heapq.heapify(self._heap)
+            self._adapt(len(batch), len(ok & set(batch)), rate_limited, now)
+
+    def _adapt(self, asked: int, ok: int, rate_limited: int, now: float) -> None:
+        self.last_rate_limited = rate_limited
+        if rate_limited:
+            self.batch_size = max(MIN_BATCH, self.batch_size // 2)
+            self.interval_sec = min(MAX_INTERVAL_SEC, self.interval_sec * 2)
+            return
+        if asked and ok / asked < 0.5:
+            self.batch_size = max(MIN_BATCH, int(self.batch_size * 0.75))
+            self.interval_sec = min(MAX_INTERVAL_SEC, self.interval_sec * 1.25)
+            return
+        backlog = sum(1 for d in self._due.values() if d <= now)
+        if backlog > self.batch_size:
+            self.batch_size = min(MAX_BATCH, self.batch_size + 40)
+            self.interval_sec = max(MIN_INTERVAL_SEC, self.interval_sec * 0.8)
+        else:
+            # Drift back toward the defaults once caught up
+            self.batch_size += (DEFAULT_BATCH - self.batch_size) // 4
+            self.interval_sec += (DEFAULT_INTERVAL_SEC - self.interval_sec) / 4
+
+    # ── introspection ────────────────────────────────────────────────────
+    def status(self, now: Optional[float] = None) -> dict[str, Any]:
+        now = time.time() if now is None else now
+        with self._lock:
+            due = np.fromiter(self._due.values(), dtype=np.float64, count=len(self._due))
+            ages = np.fromiter(self._refreshed.values(), dtype=np.float64, count=len(self._refreshed))
+            pins = len(self._pins)
+            failing = len(self._failures)
+        ages = now - ages
+        staleness = {"p50": None, "p90": None, "p99": None, "max": None}
+        if ages.size:
+            p50, p90, p99 = np.percentile(ages, [50, 90, 99])
+            staleness = {
+                "p50": round(float(p50), 1),
+                "p90": round(float(p90), 1),
+                "p99": round(float(p99), 1),
+                "max": round(float(ages.max()), 1),
+            }
+        return {
+            "tracked": int(due.size),
+            "queue_depth": int((due <= now).sum()),
+            "due_next_5m": int((due <= now + 300).sum()),
+            "never_quoted": int(due.size - ages.size),
+            "pinned": pins,
+            "failing": failing,
+            "batch_size": self.batch_size,
+            "interval_sec": round(self.interval_sec, 1),
+            "us_open": self.us_open,
+            "last_rate_limited": self.last_rate_limited,
+            "staleness_sec": staleness,
+        }
+
+
+__all__ = ["QuoteScheduler", "refresh_interval"]
@@ -0,0 +1,242 @@
+"""Process-wide immutable universe snapshot (copy-on-write, versioned).
+
+Readers call `current_snapshot()` and get the latest published object with no
+disk I/O and no copying. `refresh_quotes` publishes a new snapshot after every
+batch by sharing every untouched row with the previous one; mover leaderboards
+are carried forward and updated for the touched symbols only. The version is the
+store's write generation, so it is monotonic and comparable across processes; a
+process notices foreign writes (another worker, the MCP server) by re-checking
+the generation at most every `_RECHECK_SEC`.
+
+Each copy-on-write publish also records which board rows it changed, so
+`changes_since(version)` can answer "what moved since the client's copy"
+without diffing. A rebuild after foreign writes (the usual path in processes
+that don't run the refresh worker) diffs its rows against the previous
+snapshot and logs that as one step spanning the skipped versions.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional
+
+from infobroker.universe import store
+from infobroker.universe.columns import QuoteColumns
+from infobroker.universe.leaderboards import Leaderboards
+
+_RECHECK_SEC = 2.0
+_CHANGELOG_MAX = 1024  # published versions kept for `changes_since`
+
+_lock = threading.Lock()
+_current: Optional["UniverseSnapshot"] = None
+_checked_at = 0.0
+# (version, previous logged version, symbols whose board row changed in between);
+# chained back to _changelog_floor — steps can span versions this process never installed
+_changelog: deque[tuple[int, int, frozenset[str]]] = deque(maxlen=_CHANGELOG_MAX)
+_changelog_floor: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class UniverseSnapshot:
+    """One consistent view of listings + quotes. Rows are shared — never mutate them."""
+
+    version: int
+    symbols: Mapping[str, dict[str, Any]]
+    rows: Mapping[str, dict[str, Any]]  # quoted symbols only, flattened for boards
+    listings_as_of: Optional[str]
+    quotes_as_of: Optional[str]
+    refresh_cursor: int
+    exchanges: Mapping[str, int]
+    asset_classes: Mapping[str, int]
+    leaders: Leaderboards
+    built_at: float = field(default_factory=time.time)
+
+    @cached_property
+    def quoted(self) -> tuple[dict[str, Any], ...]:
+        return tuple(self.rows.values())
+
+    @cached_property
+    def columns(self) -> QuoteColumns:
+        """Columnar view of `quoted` (built lazily, once per version)."""
+        return QuoteColumns(self.quoted)
+
+    @property
+    def total(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def quoted_count(self) -> int:
+        return len(self.rows)
+
+
+def quoted_row(sym: str, meta: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Flatten listing meta + quote into the board row shape (None when unquoted)."""
+    q = meta.get("quote")
+    if not q or q.get("price") is None:
+        return None
+    return {
+        "symbol": sym,
+        "name": meta.get("name") or sym,
+        "price": q.get("price"),
+        "change_abs_day": q.get("change_abs_day"),
+        "change_pct_day": q.get("change_pct_day"),
+        "change_pct_week": q.get("change_pct_week"),
+        "volume": q.get("volume"),
+        "rel_volume": q.get("rel_volume"),
+        "high": q.get("high"),
+        "low": q.get("low"),
+        "sparkline": q.get("sparkline") or [],
+        "as_of": q.get("as_of"),
+        "source": q.get("source") or "yahoo",
+        "etf": bool(meta.get("etf")),
+        "asset_class": meta.get("asset_class"),
+        "exchange": meta.get("exchange"),
+    }
+
+
+def _counts(symbols: Mapping[str, dict[str, Any]], key: str, fallback: str) -> Mapping[str, int]:
+    counts: dict[str, int] = {}
+    for meta in symbols.values():
+        k = meta.get(key) or fallback
+        counts[k] = counts.get(k, 0) + 1
+    return MappingProxyType(dict(sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))))
+
+
+def _from_store() -> UniverseSnapshot:
+    gen, meta, metas = store.read_consistent()
+    symbols = {m["symbol"]: m for m in metas}
+    rows: dict[str, dict[str, Any]] = {}
+    for sym, m in symbols.items():
+        row = quoted_row(sym, m)
+        if row is not None:
+            rows[sym] = row
+    return UniverseSnapshot(
+        version=gen,
+        symbols=MappingProxyType(symbols),
+        rows=MappingProxyType(rows),
+        listings_as_of=meta.get("listings_as_of"),
+        quotes_as_of=meta.get("quotes_as_of"),
+        refresh_cursor=int(meta.get("refresh_cursor") or 0),
+        exchanges=_counts(symbols, "exchange", "Unknown"),
+        asset_classes=_counts(symbols, "asset_class", "other"),
+        leaders=Leaderboards.build(symbols, rows),
+    )
+
+
+def _row_diff(old: UniverseSnapshot, new: UniverseSnapshot) -> frozenset[str]:
+    """Symbols whose board row differs between two snapshots (incl. rows that vanished)."""
+    changed = {sym for sym, row in new.rows.items() if old.rows.get(sym) != row}
+    changed.update(sym for sym in old.rows if sym not in new.rows)
+    return frozenset(changed)
+
+
+def _install(snap: UniverseSnapshot, changed: Optional[frozenset[str]] = None) -> UniverseSnapshot:
+    global _current, _checked_at, _changelog_floor
+    if _current is None or snap.version >= _current.version:
+        if changed is not None and _current is not None and snap.version > _current.version:
+            _changelog.append((snap.version, _current.version, changed))
+            if len(_changelog) == _changelog.maxlen:
+                _changelog_floor = _changelog[0][1]
+        elif _current is None or snap.version != _current.version:
+            _changelog.clear()
+            _changelog_floor = snap.version
+        _current = snap
+    _checked_at = time.monotonic()
+    return _current
+
+
+def changes_since(version: int) -> Optional[frozenset[str]]:
+    """Symbols whose board row changed (or disappeared) after `version`.
+
+    None when the log can't answer — `version` predates it, is from another
+    store generation line, or is ahead of the current snapshot.
+    """
+    current_snapshot()
+    with _lock:
+        latest = _current.version if _current is not None else None
+        if latest is None or _changelog_floor is None or not (_changelog_floor <= version <= latest):
+            return None
+        out: set[str] = set()
+        for v, prev, symbols in reversed(_changelog):
+            if v <= version:
+                break
+            if prev < version:
+                return None  # a step diffed across `version`: can't split it
+            out |= symbols
+        return frozenset(out)
+
+
+def current_snapshot() -> UniverseSnapshot:
+    """Latest published snapshot — zero I/O except a throttled generation check."""
+    snap = _current
+    if snap is not None and time.monotonic() - _checked_at < _RECHECK_SEC:
+        return snap
+    with _lock:
+        snap = _current
+        if snap is not None and time.monotonic() - _checked_at < _RECHECK_SEC:
+            return snap
+        if snap is None or store.generation() != snap.version:
+            return _rebuild()
+        return _install(snap)
+
+
+def _rebuild() -> UniverseSnapshot:
+    """Install a store rebuild, logging its row diff against the current snapshot (hold `_lock`)."""
+    fresh = _from_store()
+    return _install(fresh, _row_diff(_current, fresh) if _current is not None else None)
+
+
+def reload_snapshot() -> UniverseSnapshot:
+    """Rebuild from the store (after listings swaps or foreign writes)."""
+    with _lock:
+        return _rebuild()
+
+
+def publish_quotes(
+    base: UniverseSnapshot,
+    metas: Iterable[dict[str, Any]],
+    *,
+    version: int,
+    quotes_as_of: Optional[str],
+    refresh_cursor: int,
+) -> UniverseSnapshot:
+    """Copy-on-write publish: replace touched metas, share everything else with `base`.
+
+    Falls back to a store rebuild when another writer committed in between
+    (`version` is not exactly one past `base`).
+    """
+    if version != base.version + 1:
+        return reload_snapshot()
+    symbols = dict(base.symbols)
+    rows = dict(base.rows)
+    metas = list(metas)
+    changed: set[str] = set()
+    for meta in metas:
+        sym = meta["symbol"]
+        symbols[sym] = meta
+        row = quoted_row(sym, meta)
+        if row is None:
+            if rows.pop(sym, None) is not None:
+                changed.add(sym)
+        else:
+            if rows.get(sym) != row:
+                changed.add(sym)
+            rows[sym] = row
+    snap = UniverseSnapshot(
+        version=version,
+        symbols=MappingProxyType(symbols),
+        rows=MappingProxyType(rows),
+        listings_as_of=base.listings_as_of,
+        quotes_as_of=quotes_as_of,
+        refresh_cursor=refresh_cursor,
+        exchanges=base.exchanges,
+        asset_classes=base.asset_classes,
+        leaders=base.leaders.apply(metas, symbols, rows),
+    )
+    with _lock:
+        return _install(snap, frozenset(changed))
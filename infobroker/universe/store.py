@@ -1,18 +1,28 @@
-"""Persist the market universe (listings + quote cache)."""
+"""Persist the market universe (listings + quote cache) in SQLite.
+
+`data/universe.db` runs in WAL mode so the web app, MCP server and CLI can read
+while the refresh worker writes. Quote batches upsert only the rows they touched;
+`load_universe` / `save_universe` remain as whole-document compatibility shims.
+A legacy `data/universe.json` is imported once on first open.
+"""
 
 from __future__ import annotations
 
 import json
+import sqlite3
 import threading
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from infobroker.config import DATA_DIR
 
-UNIVERSE_PATH = DATA_DIR / "universe.json"
+UNIVERSE_DB = DATA_DIR / "universe.db"
+UNIVERSE_PATH = DATA_DIR / "universe.json"  # legacy — migrated into UNIVERSE_DB
 _LOCK = threading.RLock()
+_local = threading.local()
+_ready: set[str] = set()
 
 _EMPTY: dict[str, Any] = {
     "version": 1,
@@ -22,6 +32,55 @@ _EMPTY: dict[str, Any] = {
     "symbols": {},  # symbol -> meta + optional quote
 }
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS listings (
+    symbol TEXT PRIMARY KEY,
+    name TEXT,
+    exchange TEXT,
+    etf INTEGER NOT NULL DEFAULT 0,
+    asset_class TEXT,
+    source TEXT
+);
+CREATE TABLE IF NOT EXISTS quotes (
+    symbol TEXT PRIMARY KEY,
+    price REAL,
+    change_abs_day REAL,
+    change_pct_day REAL,
+    change_pct_week REAL,
+    volume REAL,
+    rel_volume REAL,
+    high REAL,
+    low REAL,
+    sparkline TEXT,
+    as_of TEXT,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_listings_exchange ON listings(exchange);
+CREATE INDEX IF NOT EXISTS ix_listings_asset_class ON listings(asset_class);
+CREATE INDEX IF NOT EXISTS ix_quotes_change_day ON quotes(change_pct_day);
+CREATE INDEX IF NOT EXISTS ix_quotes_volume ON quotes(volume);
+"""
+
+_LISTING_COLS = ("symbol", "name", "exchange", "etf", "asset_class", "source")
+_QUOTE_COLS = (
+    "price",
+    "change_abs_day",
+    "change_pct_day",
+    "change_pct_week",
+    "volume",
+    "rel_volume",
+    "high",
+    "low",
+    "sparkline",
+    "as_of",
+    "source",
+)
+_META_KEYS = ("version", "listings_as_of", "quotes_as_of", "refresh_cursor")
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -31,46 +90,331 @@ def _default() -> dict[str, Any]:
     return deepcopy(_EMPTY)
 
 
-def load_universe() -> dict[str, Any]:
-    with _LOCK:
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
-        if not UNIVERSE_PATH.exists():
-            data = _default()
-            save_universe(data)
-            return data
+def _connect() -> sqlite3.Connection:
+    """Per-thread connection (sqlite3 objects must not cross threads)."""
+    db = str(UNIVERSE_DB)
+    conn: Optional[sqlite3.Connection] = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "path", None) == db:
+        return conn
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    _local.conn = conn
+    _local.path = db
+    if db not in _ready:
+        with _LOCK:
+            if db not in _ready:
+                conn.executescript(_SCHEMA)
+                _migrate_json(conn)
+                _ready.add(db)
+    return conn
+
+
+def _migrate_json(conn: sqlite3.Connection) -> None:
+    """One-time import of the legacy universe.json (renamed *.migrated afterwards)."""
+    if not UNIVERSE_PATH.exists():
+        return
+    has_rows = conn.execute("SELECT 1 FROM listings LIMIT 1").fetchone()
+    if has_rows is None:
         try:
-            data = json.loads(UNIVERSE_PATH.read_text(encoding="utf-8"))
+            legacy = json.loads(UNIVERSE_PATH.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
-            data = _default()
-            save_universe(data)
-            return data
-        if not isinstance(data.get("symbols"), dict):
-            data["symbols"] = {}
-        data.setdefault("version", 1)
-        data.setdefault("listings_as_of", None)
-        data.setdefault("quotes_as_of", None)
-        data.setdefault("refresh_cursor", 0)
+            legacy = None
+        if isinstance(legacy, dict):
+            _write_document(conn, legacy)
+    try:
+        UNIVERSE_PATH.replace(UNIVERSE_PATH.with_suffix(".json.migrated"))
+    except OSError:
+        pass
+
+
+def _meta_value(key: str, raw: Optional[str]) -> Any:
+    if key in {"version", "refresh_cursor"}:
+        try:
+            return int(raw or 0)
+        except ValueError:
+            return 0
+    return raw
+
+
+def _quote_params(symbol: str, quote: dict[str, Any]) -> tuple[Any, ...]:
+    spark = quote.get("sparkline") or []
+    return (
+        symbol,
+        quote.get("price"),
+        quote.get("change_abs_day"),
+        quote.get("change_pct_day"),
+        quote.get("change_pct_week"),
+        quote.get("volume"),
+        quote.get("rel_volume"),
+        quote.get("high"),
+        quote.get("low"),
+        json.dumps(spark) if spark else None,
+        quote.get("as_of"),
+        quote.get("source"),
+    )
+
+
+def _listing_params(symbol: str, meta: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        symbol,
+        meta.get("name"),
+        meta.get("exchange"),
+        1 if meta.get("etf") else 0,
+        meta.get("asset_class"),
+        meta.get("source"),
+    )
+
+
+_UPSERT_QUOTE = (
+    f"INSERT OR REPLACE INTO quotes (symbol, {', '.join(_QUOTE_COLS)}) "
+    f"VALUES ({', '.join('?' * (len(_QUOTE_COLS) + 1))})"
+)
+_UPSERT_LISTING = (
+    f"INSERT OR REPLACE INTO listings ({', '.join(_LISTING_COLS)}) "
+    f"VALUES ({', '.join('?' * len(_LISTING_COLS))})"
+)
+
+
+def _quote_from_row(row: sqlite3.Row) -> Optional[dict[str, Any]]:
+    if row["q_symbol"] is None:
+        return None
+    spark = row["sparkline"]
+    return {
+        "price": row["price"],
+        "change_abs_day": row["change_abs_day"],
+        "change_pct_day": row["change_pct_day"],
+        "change_pct_week": row["change_pct_week"],
+        "volume": row["volume"],
+        "rel_volume": row["rel_volume"],
+        "high": row["high"],
+        "low": row["low"],
+        "sparkline": json.loads(spark) if spark else [],
+        "as_of": row["as_of"],
+        "source": row["q_source"],
+    }
+
+
+def _meta_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "symbol": row["symbol"],
+        "name": row["name"],
+        "exchange": row["exchange"],
+        "etf": bool(row["etf"]),
+        "asset_class": row["asset_class"],
+        "source": row["source"],
+        "quote": _quote_from_row(row),
+    }
+
+
+_JOINED = (
+    "SELECT l.symbol, l.name, l.exchange, l.etf, l.asset_class, l.source, "
+    "q.symbol AS q_symbol, q.price, q.change_abs_day, q.change_pct_day, q.change_pct_week, "
+    "q.volume, q.rel_volume, q.high, q.low, q.sparkline, q.as_of, q.source AS q_source "
+    "FROM listings l LEFT JOIN quotes q ON q.symbol = l.symbol"
+)
+
+
+def _write_document(conn: sqlite3.Connection, data: dict[str, Any]) -> None:
+    symbols = data.get("symbols") if isinstance(data.get("symbols"), dict) else {}
+    with _LOCK:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM listings")
+            conn.execute("DELETE FROM quotes")
+            conn.executemany(
+                _UPSERT_LISTING,
+                (_listing_params(sym, meta or {}) for sym, meta in symbols.items()),
+            )
+            conn.executemany(
+                _UPSERT_QUOTE,
+                (
+                    _quote_params(sym, meta["quote"])
+                    for sym, meta in symbols.items()
+                    if isinstance((meta or {}).get("quote"), dict)
+                ),
+            )
+            _write_meta(conn, {k: data.get(k, _EMPTY[k]) for k in _META_KEYS})
+            _bump_generation(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def _bump_generation(conn: sqlite3.Connection) -> int:
+    """Advance the write generation inside the caller's transaction."""
+    conn.execute(
+        "INSERT INTO meta (key, value) VALUES ('generation', '1') "
+        "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+    )
+    return int(conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()[0])
+
+
+def generation() -> int:
+    """Monotonic counter bumped by every listings/quote write (shared across processes)."""
+    row = _connect().execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+    return int(row[0]) if row else 0
+
+
+def _write_meta(conn: sqlite3.Connection, values: dict[str, Any]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+        [(k, None if v is None else str(v)) for k, v in values.items()],
+    )
+
+
+def load_meta() -> dict[str, Any]:
+    """Document-level fields only (as_of stamps, cursor) — no symbol rows."""
+    conn = _connect()
+    out = {k: _EMPTY[k] for k in _META_KEYS}
+    for row in conn.execute("SELECT key, value FROM meta"):
+        if row["key"] in out:
+            out[row["key"]] = _meta_value(row["key"], row["value"])
+    return out
+
+
+def save_meta(**values: Any) -> int:
+    """Update document-level fields; returns the new generation."""
+    conn = _connect()
+    with _LOCK:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            _write_meta(conn, values)
+            gen = _bump_generation(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    return gen
+
+
+def get_row(symbol: str) -> Optional[dict[str, Any]]:
+    """Single symbol meta + quote via primary-key lookup."""
+    row = _connect().execute(f"{_JOINED} WHERE l.symbol = ?", (symbol,)).fetchone()
+    return _meta_from_row(row) if row else None
+
+
+def iter_rows(quoted_only: bool = False) -> Iterator[dict[str, Any]]:
+    sql = _JOINED
+    if quoted_only:
+        sql += " WHERE q.price IS NOT NULL"
+    for row in _connect().execute(sql + " ORDER BY l.symbol"):
+        yield _meta_from_row(row)
+
+
+def upsert_quotes(metas: Iterable[dict[str, Any]], **meta: Any) -> int:
+    """Write back only the symbols a batch touched (quote row + refreshed name).
+
+    Optional document fields (quotes_as_of, refresh_cursor) commit in the same
+    transaction. Returns the store generation after the write.
+    """
+    conn = _connect()
+    quotes: list[tuple[Any, ...]] = []
+    names: list[tuple[Any, ...]] = []
+    for meta in metas:
+        sym = meta.get("symbol")
+        if not sym:
+            continue
+        if isinstance(meta.get("quote"), dict):
+            quotes.append(_quote_params(sym, meta["quote"]))
+        if meta.get("name"):
+            names.append((meta["name"], sym))
+    with _LOCK:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(_UPSERT_QUOTE, quotes)
+            conn.executemany("UPDATE listings SET name = ? WHERE symbol = ?", names)
+            if meta:
+                _write_meta(conn, meta)
+            gen = _bump_generation(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    return gen
+
+
+def replace_listings(rows: dict[str, dict[str, Any]], **meta: Any) -> int:
+    """Swap the listing directory; quotes for delisted symbols are dropped.
+
+    Returns the store generation after the write.
+    """
+    conn = _connect()
+    with _LOCK:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM listings")
+            conn.executemany(
+                _UPSERT_LISTING,
+                (_listing_params(sym, m) for sym, m in rows.items()),
+            )
+            conn.execute("DELETE FROM quotes WHERE symbol NOT IN (SELECT symbol FROM listings)")
+            if meta:
+                _write_meta(conn, meta)
+            gen = _bump_generation(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    return gen
+
+
+def read_consistent() -> tuple[int, dict[str, Any], list[dict[str, Any]]]:
+    """(generation, document fields, symbol metas) from a single read transaction."""
+    conn = _connect()
+    conn.execute("BEGIN")
+    try:
+        gen = generation()
+        meta = load_meta()
+        rows = list(iter_rows())
+    finally:
+        conn.execute("COMMIT")
+    return gen, meta, rows
+
+
+def load_universe() -> dict[str, Any]:
+    """Compatibility shim: materialize the whole store as the legacy document."""
+    with _LOCK:
+        data = load_meta()
+        data["symbols"] = {meta["symbol"]: meta for meta in iter_rows()}
         return data
 
 
 def save_universe(data: dict[str, Any]) -> None:
-    with _LOCK:
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
-        tmp = UNIVERSE_PATH.with_suffix(".tmp")
-        payload = json.dumps(data, indent=2, ensure_ascii=False)
-        tmp.write_text(payload, encoding="utf-8")
-        tmp.replace(UNIVERSE_PATH)
+    """Compatibility shim: replace the whole store from a legacy document."""
+    _write_document(_connect(), data)
 
 
 def symbol_count(data: Optional[dict[str, Any]] = None) -> int:
-    d = data if data is not None else load_universe()
-    return len(d.get("symbols") or {})
+    if data is not None:
+        return len(data.get("symbols") or {})
+    return int(_connect().execute("SELECT COUNT(*) FROM listings").fetchone()[0])
 
 
 def quote_count(data: Optional[dict[str, Any]] = None) -> int:
-    d = data if data is not None else load_universe()
-    return sum(1 for v in (d.get("symbols") or {}).values() if v.get("quote"))
+    if data is not None:
+        return sum(1 for v in (data.get("symbols") or {}).values() if v.get("quote"))
+    row = _connect().execute(
+        "SELECT COUNT(*) FROM quotes q JOIN listings l ON l.symbol = q.symbol"
+    ).fetchone()
+    return int(row[0])
+
+
+def group_counts(column: str) -> dict[str, int]:
+    """Listing counts per exchange / asset_class, served from the column indexes."""
+    if column not in {"exchange", "asset_class"}:
+        raise ValueError(f"Unsupported group column: {column}")
+    fallback = "Unknown" if column == "exchange" else "other"
+    rows = _connect().execute(
+        f"SELECT COALESCE(NULLIF({column}, ''), ?) AS k, COUNT(*) AS n FROM listings GROUP BY k",
+        (fallback,),
+    )
+    counts = {r["k"]: int(r["n"]) for r in rows}
+    return dict(sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])))
 
 
 def path() -> Path:
-    return UNIVERSE_PATH
+    return UNIVERSE_DB
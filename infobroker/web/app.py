@@ -6,10 +6,10 @@ import asyncio
 import json
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
@@ -26,7 +26,12 @@ from infobroker.config import get_settings
 from infobroker.data import fetch_ohlcv, get_fundamentals, get_stock_quote
 from infobroker.data.chartpack import build_chart_pack
 from infobroker.data.highlights import get_market_highlights, get_tracked_quotes, sparkline_closes
+from infobroker.data.http_pool import http_stats
 from infobroker.data.multisource import build_live_board, provider_status
+from infobroker.data.result_cache import result_cache_stats
+from infobroker.data.serialize import check_shape, dumps, ohlcv_columns, shape_items, shaped
+from infobroker.data.singleflight import singleflight_stats
+from infobroker.data.swr import swr_stats
 from infobroker.data.yf_pipeline import analyze_symbol
 from infobroker.education import get_lesson, list_lessons
 from infobroker.education.trade_stories import build_trade_stories, sample_demo_stories
@@ -36,6 +41,7 @@ from infobroker.settings_store import get_public_settings, update_settings
 from infobroker.assistant.agent import hunt_once, run_assistant
 from infobroker.assistant.ollama_client import ollama_healthy
 from infobroker.assistant.tools import KEY_LINKS, execute_tool, list_actions
+from infobroker.services.leader import LeaderElection
 from infobroker.services.process_control import (
     mcp_restart,
     mcp_start,
@@ -43,7 +49,16 @@ from infobroker.services.process_control import (
     mcp_stop,
     ollama_control,
 )
-from infobroker.strategies import list_strategies, run_backtest, run_strategy_backtest, scan_watchlist
+from infobroker.strategies import (
+    iter_sweep,
+    list_strategies,
+    run_backtest,
+    run_portfolio_backtest,
+    run_strategy_backtest,
+    scan_universe,
+    scan_watchlist,
+)
+from infobroker.strategies.sweep import MAX_EVALUATIONS
 from infobroker.auto_track import (
     get_auto_track_settings,
     scan_and_track,
@@ -57,10 +72,14 @@ from infobroker.markets import (
     build_market_board,
     fetch_intraday_bars,
     fetch_live_tick,
+    MAX_SYMBOLS_PER_SUBSCRIPTION,
     list_market_focuses,
     market_clocks,
+    tick_hub,
+    tick_hub_stats,
 )
 from infobroker.universe import (
+    current_snapshot,
     ensure_universe,
     get_symbol as universe_get_symbol,
     liquid_scan_symbols,
@@ -73,9 +92,15 @@ from infobroker.universe import (
     universe_status,
 )
 from infobroker.watchlist import add_symbol, get_watchlist, list_symbols, remove_symbol, validate_symbol
+from infobroker.web.compression import CompressionMiddleware, compression_stats
+from infobroker.web.http_cache import HTTPCacheMiddleware, http_cache, http_cache_stats
 
 STATIC_DIR = Path(__file__).resolve().parent / "static"
 DOCS_IMAGES_DIR = Path(__file__).resolve().parents[2] / "docs" / "images"
+OHLC_MAX_DAYS = 36_500  # multi-decade views are bucketed down to `max_points`
+OHLC_MAX_POINTS = 2000
+_ITEMS_SHAPE_HELP = "items as rows (objects) | columns | table (fields + row arrays)"
+LIVE_STREAM_POLL_SEC = 2.0  # snapshot version check cadence for /api/stream/live
 
 _LOCAL_HOSTS = {"127.0.0.1", "::1", "localhost", "testclient"}
 
@@ -90,21 +115,47 @@ def _require_localhost(request: Request) -> None:
         )
 
 
-@asynccontextmanager
-async def lifespan(_app: FastAPI):
-    # Market-wide listings + rotating quote refresh (not watchlist-only)
-    try:
-        await asyncio.to_thread(ensure_universe, False)
-    except Exception:
-        pass
+def _start_workers() -> None:
     start_background_engine()
     start_auto_track_worker()
-    yield
+
+
+def _stop_workers() -> None:
     stop_auto_track_worker()
     stop_background_engine()
 
 
+# One process (per data dir) runs the universe engine + auto-track; the rest
+# serve from the shared SQLite store and take over if the leader dies.
+_workers_election = LeaderElection("background-workers", on_elected=_start_workers, on_demoted=_stop_workers)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Market-wide listings + rotating quote refresh (not watchlist-only)
+    if await asyncio.to_thread(_workers_election.try_acquire):
+        try:
+            await asyncio.to_thread(ensure_universe, False)
+        except Exception:
+            pass
+    _workers_election.start()
+    yield
+    await asyncio.to_thread(_workers_election.stop)
+
+
+class FastJSONResponse(Response):
+    """JSON via orjson (stdlib fallback). Return it directly from bar-heavy routes so
+    payloads skip FastAPI's per-value `jsonable_encoder` walk."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
 app = FastAPI(title="Infobroker", version="0.8.0", lifespan=lifespan)
+app.add_middleware(HTTPCacheMiddleware)
+app.add_middleware(CompressionMiddleware, minimum_size=1024)  # outermost: added last
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 if DOCS_IMAGES_DIR.is_dir():
     app.mount("/docs-images", StaticFiles(directory=str(DOCS_IMAGES_DIR)), name="docs_images")
@@ -178,12 +229,43 @@ class StrategyBacktestBody(BaseModel):
     start: str
     end: str
     starting_cash: float = 10_000.0
+    max_points: int = Field(80, ge=10, le=5000)
+
+
+class StrategySweepBody(BaseModel):
+    strategy: str = "sma_crossover"
+    symbols: list[str] = Field(default_factory=list)
+    start: str
+    end: str
+    grid: Optional[dict[str, Annotated[list[float], Field(max_length=MAX_EVALUATIONS)]]] = None
+    search: str = "grid"
+    samples: int = Field(200, ge=1, le=20_000)
+    seed: Optional[int] = None
+    starting_cash: float = 10_000.0
+    rank_by: str = "total_return_pct"
+    top: int = Field(20, ge=1, le=500)
+    stream: bool = False
+
+
+class PortfolioBacktestBody(BaseModel):
+    strategy: str = "sma_crossover"
+    start: str
+    end: str
+    symbols: list[str] = Field(default_factory=list)
+    basket: str = "watchlist"
+    limit: int = Field(30, ge=1, le=300)
+    weighting: str = "equal"
+    params: Optional[dict[str, float]] = None
+    starting_cash: float = 10_000.0
+    max_points: int = Field(80, ge=10, le=5000)
 
 
 class ChartPackBody(BaseModel):
     symbol: str
     start: str
     end: str
+    shape: str = "rows"  # rows | columns | table
+    max_points: Optional[int] = Field(None, ge=10, le=20_000)  # e.g. chart width in px; None = every bar
 
 
 def _is_live() -> bool:
@@ -265,6 +347,7 @@ def services_ollama(body: OllamaControlBody):
 
 
 @app.get("/api/strategies")
+@http_cache("strategies", store=True)
 def strategies_list():
     return {"strategies": list_strategies(), "engine": "yfinance (free, no signup)"}
 
@@ -280,6 +363,7 @@ async def strategies_backtest(body: StrategyBacktestBody):
             body.start,
             body.end,
             body.starting_cash,
+            max_points=body.max_points,
         )
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
@@ -287,11 +371,76 @@ async def strategies_backtest(body: StrategyBacktestBody):
         raise HTTPException(400, str(exc)) from exc
 
 
+@app.post("/api/strategies/sweep")
+async def strategies_sweep(body: StrategySweepBody):
+    """Parameter sweep; `stream: true` returns NDJSON events as results complete."""
+    try:
+        syms = [validate_symbol(s) for s in body.symbols] or list_symbols()
+        grid = {k: [int(v) if float(v).is_integer() else v for v in vals] for k, vals in (body.grid or {}).items()}
+        events = iter_sweep(
+            body.strategy,
+            syms,
+            body.start,
+            body.end,
+            grid=grid or None,
+            search=body.search,
+            samples=body.samples,
+            seed=body.seed,
+            starting_cash=body.starting_cash,
+            rank_by=body.rank_by,
+            top=body.top,
+        )
+        # First event validates inputs and loads bars — errors still map to HTTP codes
+        first = await asyncio.to_thread(next, events)
+        if not body.stream:
+            rest = await asyncio.to_thread(list, events)
+            done = rest[-1] if rest else {}
+            return {**{k: v for k, v in first.items() if k != "type"}, **{k: v for k, v in done.items() if k != "type"}}
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(500, str(exc)) from exc
+
+    def lines():
+        yield json.dumps(first) + "\n"
+        for event in events:
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson", headers={"Cache-Control": "no-cache"})
+
+
+@app.post("/api/strategies/portfolio")
+async def strategies_portfolio(body: PortfolioBacktestBody):
+    """One strategy across a basket (symbols, watchlist, liquid or board:<focus>)."""
+    try:
+        syms = [validate_symbol(s) for s in body.symbols]
+        params = {k: int(v) if float(v).is_integer() else v for k, v in (body.params or {}).items()}
+        return await asyncio.to_thread(
+            run_portfolio_backtest,
+            body.strategy,
+            body.start,
+            body.end,
+            symbols=syms or None,
+            basket=body.basket,
+            limit=body.limit,
+            weighting=body.weighting,
+            params=params,
+            starting_cash=body.starting_cash,
+            max_points=body.max_points,
+        )
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(500, str(exc)) from exc
+
+
 @app.post("/api/charts/pack")
 async def charts_pack(body: ChartPackBody):
     try:
         sym = validate_symbol(body.symbol)
-        return await asyncio.to_thread(build_chart_pack, sym, body.start, body.end)
+        pack = await asyncio.to_thread(build_chart_pack, sym, body.start, body.end, shape=body.shape, max_points=body.max_points
+        )
+        return FastJSONResponse(pack)
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
@@ -303,6 +452,7 @@ class AnalyzeBody(BaseModel):
     start: Optional[str] = None
     end: Optional[str] = None
     period: str = "1y"
+    shape: str = "rows"  # rows | columns | table
 
 
 @app.post("/api/analyze")
@@ -311,10 +461,12 @@ async def analyze(body: AnalyzeBody):
     try:
         sym = validate_symbol(body.symbol)
         if body.start and body.end:
-            return await asyncio.to_thread(
-                analyze_symbol, sym, start=body.start, end=body.end
+            result = await asyncio.to_thread(
+                analyze_symbol, sym, start=body.start, end=body.end, shape=body.shape
             )
-        return await asyncio.to_thread(analyze_symbol, sym, period=body.period)
+        else:
+            result = await asyncio.to_thread(analyze_symbol, sym, period=body.period, shape=body.shape)
+        return FastJSONResponse(result)
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
@@ -361,6 +513,7 @@ def assistant_tool(body: ToolCallBody):
 
 
 @app.get("/api/brokers")
+@http_cache("static", store=True)
 def brokers():
     return [
         {
@@ -394,6 +547,7 @@ def settings_put(request: Request, body: SettingsBody):
 
 
 @app.get("/api/docs")
+@http_cache("docs", store=True)
 def api_docs_list():
     """Project documentation catalog for Settings → Docs."""
     from infobroker.docs_catalog import list_docs
@@ -402,6 +556,7 @@ def api_docs_list():
 
 
 @app.get("/api/docs/{doc_id}")
+@http_cache("docs", store=True)
 def api_docs_get(doc_id: str):
     from infobroker.docs_catalog import get_doc
 
@@ -412,6 +567,7 @@ def api_docs_get(doc_id: str):
 
 
 @app.get("/api/watchlist")
+@http_cache("watchlist")
 def watchlist_get():
     return get_watchlist()
 
@@ -433,8 +589,8 @@ def watchlist_remove(symbol: str):
 @app.get("/api/tracked")
 async def tracked():
     try:
-        items = await asyncio.to_thread(get_tracked_quotes)
-        return {"items": items}
+        res = await asyncio.to_thread(get_tracked_quotes.fetch)
+        return {"items": res.value, **res.meta()}
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(502, f"Failed to load tracked quotes: {exc}") from exc
 
@@ -442,12 +598,14 @@ async def tracked():
 @app.get("/api/highlights")
 async def highlights():
     try:
-        return await asyncio.to_thread(get_market_highlights)
+        res = await asyncio.to_thread(get_market_highlights.fetch)
+        return {**res.value, **res.meta()}
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(502, f"Failed to load highlights: {exc}") from exc
 
 
 @app.get("/api/markets/clocks")
+@http_cache("clock:1", max_age=1)
 def api_market_clocks():
     """World market clocks + open/closed (local session rules, no API key)."""
     data = market_clocks()
@@ -460,10 +618,14 @@ def api_markets_board(
     focus: str = Query("us", description="us|nasdaq|nyse|arca|amex|london|frankfurt|tokyo|hongkong|sydney"),
     limit: int = Query(180, ge=10, le=2000),
     sort: str = Query("volume"),
+    shape: str = Query("rows", description=_ITEMS_SHAPE_HELP),
 ):
     """Switchable Live board: US venue filter or foreign session proxy list."""
     try:
-        return build_market_board(focus=focus, limit=limit, sort=sort)
+        shape = check_shape(shape)
+        return FastJSONResponse(shape_items(build_market_board(focus=focus, limit=limit, sort=sort), shape))
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(502, f"Market board failed: {exc}") from exc
 
@@ -485,46 +647,110 @@ def api_ohlc_intraday(
     symbol: str,
     interval: str = Query("1m", description="1m|5m|15m|30m|60m"),
     range: str = Query("1d", description="1d|5d|1mo", alias="range"),
+    max_points: Optional[int] = Query(None, ge=10, le=20_000, description="OHLC-bucket to this many candles"),
 ):
     """Intraday bars for near-realtime Live charting."""
     try:
         sym = validate_symbol(symbol)
-        return fetch_intraday_bars(sym, interval=interval, range_=range)
+        return fetch_intraday_bars(sym, interval=interval, range_=range, max_points=max_points)
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(502, f"Intraday failed: {exc}") from exc
 
 
+_SSE_HEADERS = {"Cache-Control": "no-cache", "Connection": "keep-alive", "X-Accel-Buffering": "no"}
+_STREAM_MAX_SEC = 30 * 60  # abandoned tabs don't hold a subscription forever
+
+
+def _hub_events(symbols: list[str], indicators: bool, tagged: bool):
+    async def events():
+        sub = tick_hub().open(symbols, indicators=indicators)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _STREAM_MAX_SEC
+        try:
+            while loop.time() < deadline:
+                tick = await sub.get(timeout=15.0)
+                if tick is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {json.dumps({'type': 'tick', **tick} if tagged else tick)}\n\n"
+        finally:
+            sub.close()
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
 @app.get("/api/stream/tick/{symbol}")
-async def api_stream_tick(symbol: str):
-    """SSE tick stream for one focused symbol — server caches so clients share load."""
+async def api_stream_tick(symbol: str, indicators: bool = Query(True, description="Attach live 1m RSI/MACD/ATR/BB")):
+    """SSE tick stream for one focused symbol, fed by the shared tick hub.
+
+    Each tick carries `indicators`: 1m-bar values including the forming bar,
+    updated incrementally per tick (seeded once from intraday history).
+    """
     try:
         sym = validate_symbol(symbol)
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
+    return _hub_events([sym], indicators, tagged=False)
 
-    async def events():
-        # Cap stream lifetime so abandoned tabs don't run forever
-        for _ in range(900):  # ~15–30 min depending on poll
+
+@app.get("/api/stream/ticks")
+async def api_stream_ticks(
+    symbols: str = Query(..., description="Comma-separated symbols"),
+    indicators: bool = Query(False, description="Attach live 1m RSI/MACD/ATR/BB"),
+):
+    """One SSE connection for many symbols (`{"type": "tick", "symbol": ...}` events)."""
+    try:
+        syms = [validate_symbol(s) for s in symbols.split(",") if s.strip()]
+        if not syms:
+            raise ValueError("No symbols")
+        if len(set(syms)) > MAX_SYMBOLS_PER_SUBSCRIPTION:
+            raise ValueError(f"At most {MAX_SYMBOLS_PER_SUBSCRIPTION} symbols per tick subscription")
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
+    return _hub_events(syms, indicators, tagged=True)
+
+
+@app.websocket("/api/ws/ticks")
+async def ws_ticks(websocket: WebSocket, indicators: bool = False):
+    """Multiplexed ticks over one WebSocket.
+
+    Client → server: `{"op": "subscribe" | "unsubscribe", "symbols": [...]}`.
+    Server → client: `{"type": "tick", ...}` per tick and
+    `{"type": "subscribed", "symbols": [...]}` / `{"type": "error", "error": ...}` replies.
+    """
+    await websocket.accept()
+    sub = tick_hub().open(indicators=indicators)
+
+    async def pump() -> None:
+        while True:
+            tick = await sub.get()
+            if tick is not None:
+                await websocket.send_text(json.dumps({"type": "tick", **tick}))
+
+    sender = asyncio.create_task(pump())
+    try:
+        while True:
+            raw = await websocket.receive_text()
             try:
-                tick = await asyncio.to_thread(fetch_live_tick, sym, False)
-            except Exception as exc:  # noqa: BLE001
-                tick = {"ok": False, "symbol": sym, "error": str(exc)[:160]}
-            yield f"data: {json.dumps(tick)}\n\n"
-            wait = float(tick.get("poll_sec") or 1.0) if isinstance(tick, dict) else 1.0
-            wait = max(0.75, min(wait, 20.0))
-            await asyncio.sleep(wait)
-
-    return StreamingResponse(
-        events(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+                msg = json.loads(raw)
+                op = str(msg.get("op") or "").lower()
+                syms = [validate_symbol(x) for x in (msg.get("symbols") or [])]
+                if op == "subscribe":
+                    current = sub.subscribe(syms)
+                elif op == "unsubscribe":
+                    current = sub.unsubscribe(syms)
+                else:
+                    raise ValueError(f"Unknown op: {op or '(none)'}")
+                await websocket.send_text(json.dumps({"type": "subscribed", "symbols": current}))
+            except (ValueError, AttributeError) as exc:
+                await websocket.send_text(json.dumps({"type": "error", "error": str(exc)}))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        sub.close()
 
 
 @app.get("/api/quote/{symbol}")
@@ -548,7 +774,8 @@ def quote(symbol: str):
 def fundamentals(symbol: str):
     try:
         sym = validate_symbol(symbol)
-        return get_fundamentals(sym)
+        res = get_fundamentals.fetch(sym)
+        return {**res.value, **res.meta()}
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
@@ -601,11 +828,13 @@ def api_trading_board(
     scope: str = Query("both", description="watchlist|live|both"),
     limit: int = Query(120, ge=10, le=400),
     user: str = "default",
+    shape: str = Query("rows", description=_ITEMS_SHAPE_HELP),
 ):
     """Trading desk: bid/ask/last for watchlist + live universe with position qty."""
     try:
-        return build_trading_board(scope=scope, limit=limit, user=user)
-    except BrokerError as exc:
+        shape = check_shape(shape)
+        return FastJSONResponse(shape_items(build_trading_board(scope=scope, limit=limit, user=user), shape))
+    except (BrokerError, ValueError) as exc:
         raise HTTPException(400, str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(502, f"Trading board failed: {exc}") from exc
@@ -712,14 +941,14 @@ def process_stops(user: str = "default"):
 @app.get("/api/scan")
 def scan(
     scope: str = Query("universe", description="universe | watchlist"),
-    limit: int = Query(120, ge=10, le=300),
+    limit: int = Query(120, ge=10, le=2000),
 ):
     try:
         scope_n = (scope or "universe").strip().lower()
         if scope_n == "watchlist":
             return scan_watchlist()
         syms = liquid_scan_symbols(limit)
-        result = scan_watchlist(symbols=syms)
+        result = scan_universe(syms)
         result["scope"] = "universe"
         result["universe_pool"] = len(syms)
         return result
@@ -728,6 +957,7 @@ def scan(
 
 
 @app.get("/api/universe/status")
+@http_cache("universe", "clock:5", store=True)
 def api_universe_status():
     try:
         return universe_status()
@@ -744,9 +974,11 @@ def api_universe(
     has_quote: Optional[bool] = None,
     limit: int = Query(80, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    shape: str = Query("rows", description=_ITEMS_SHAPE_HELP),
 ):
     try:
-        return list_universe(
+        shape = check_shape(shape)
+        page = list_universe(
             q=q,
             exchange=exchange,
             asset_class=asset_class,
@@ -755,14 +987,22 @@ def api_universe(
             limit=limit,
             offset=offset,
         )
+        return FastJSONResponse(shape_items(page, shape))
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(500, str(exc)) from exc
 
 
 @app.get("/api/universe/movers")
-def api_universe_movers(limit: int = Query(15, ge=3, le=50)):
+@http_cache("universe", store=True)
+def api_universe_movers(
+    limit: int = Query(15, ge=3, le=50),
+    asset_class: str = Query("", description="Comma list, e.g. stock,adr or etf"),
+    exchange: str = Query("", description="Exchange substring, e.g. NASDAQ"),
+):
     try:
-        return universe_movers(limit=limit)
+        return universe_movers(limit=limit, asset_class=asset_class, exchange=exchange)
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(502, str(exc)) from exc
 
@@ -804,57 +1044,102 @@ async def api_live(
     enrich: bool = Query(True),
     sort: str = Query("abs_change", description="abs_change|change_desc|change_asc|volume|rel_volume|price|symbol|week"),
     exchange: str = Query("", description="Filter by exchange substring, e.g. NASDAQ"),
+    since: Optional[int] = Query(None, ge=0, description="Previous response `version` → only changed rows"),
+    shape: str = Query("rows", description=_ITEMS_SHAPE_HELP),
 ):
-    """Finviz-style live board with multi-source enrich + Finnhub news when keyed."""
+    """Finviz-style live board with multi-source enrich + Finnhub news when keyed.
+
+    Pass `since=<version>` from the last response to get a delta (`delta: true`,
+    changed `items` + `removed`); a full board comes back when too far behind.
+    """
     try:
-        return await asyncio.to_thread(
-            build_live_board, mode, asset_class, limit, enrich, sort, exchange
+        shape = check_shape(shape)
+        board = await asyncio.to_thread(
+            build_live_board, mode, asset_class, limit, enrich, sort, exchange, since
         )
+        return FastJSONResponse(shape_items(board, shape))
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(502, f"Live board failed: {exc}") from exc
 
 
+@app.get("/api/stream/live")
+async def api_stream_live(
+    mode: str = Query("universe"),
+    asset_class: str = "",
+    limit: int = Query(0, ge=0, le=20000),
+    sort: str = Query("abs_change"),
+    exchange: str = Query(""),
+    since: Optional[int] = Query(None, ge=0),
+):
+    """SSE live board: the full board (or a delta from `since`) first, then a delta per new snapshot version."""
+
+    async def events():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _STREAM_MAX_SEC
+        version = since
+        quiet_since = loop.time()
+        while loop.time() < deadline:
+            current = (await asyncio.to_thread(current_snapshot)).version
+            if current != version:
+                quiet_since = loop.time()
+                try:
+                    board = await asyncio.to_thread(
+                        build_live_board, mode, asset_class, limit, False, sort, exchange, version
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    yield f"data: {json.dumps({'error': str(exc)[:160]})}\n\n"
+                else:
+                    version = board["version"]
+                    yield f"data: {dumps(board).decode()}\n\n"
+            elif loop.time() - quiet_since > 15.0:
+                quiet_since = loop.time()
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(LIVE_STREAM_POLL_SEC)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
 @app.get("/api/providers")
 def api_providers():
-    """Configured data sources (booleans only — no secret values)."""
-    return {"providers": provider_status()}
+    """Configured data sources (booleans only — no secret values) + fetch-layer counters."""
+    return {
+        "providers": provider_status(),
+        "http": http_stats(),
+        "singleflight": singleflight_stats(),
+        "results": result_cache_stats(),
+        "swr": swr_stats(),
+        "tick_hub": tick_hub_stats(),
+        "compression": compression_stats(),
+        "leader": _workers_election.status(),
+        "http_cache": http_cache_stats(),
+    }
 
 
 @app.get("/api/ohlc/{symbol}")
-def ohlc(symbol: str, days: int = 90):
+def ohlc(
+    symbol: str,
+    days: int = 90,
+    shape: str = Query("rows", description="rows | columns | table"),
+    max_points: int = Query(OHLC_MAX_POINTS, ge=0, le=20_000, description="OHLC-bucket longer ranges; 0 = every bar"),
+):
     try:
         from datetime import datetime, timedelta
 
         sym = validate_symbol(symbol)
-        days = max(10, min(int(days), 400))
+        shape = check_shape(shape)
+        days = max(10, min(int(days), OHLC_MAX_DAYS))
         end = datetime.utcnow().date()
         start = end - timedelta(days=days + 20)
         df = fetch_ohlcv(sym, start.isoformat(), end.isoformat())
         if df is None or df.empty:
             raise HTTPException(404, f"No OHLC data for {sym}")
-
-        rename = {c: str(c).lower() for c in df.columns}
-        frame = df.rename(columns=rename)
-        for needed in ("open", "high", "low", "close"):
-            if needed not in frame.columns:
-                raise HTTPException(502, f"OHLC missing column: {needed}")
-
-        out: list[dict[str, Any]] = []
-        for ts, row in frame.tail(days).iterrows():
-            try:
-                out.append(
-                    {
-                        "t": ts.isoformat() if hasattr(ts, "isoformat") else str(ts),
-                        "o": float(row["open"]),
-                        "h": float(row["high"]),
-                        "l": float(row["low"]),
-                        "c": float(row["close"]),
-                        "v": float(row["volume"]) if "volume" in frame.columns else 0.0,
-                    }
-                )
-            except Exception:
-                continue
-        return {"symbol": sym, "bars": out}
+        try:
+            cols = ohlcv_columns(df, tail=days, max_points=max_points or None)
+        except KeyError as exc:
+            raise HTTPException(502, f"OHLC missing column: {exc.args[0]}") from exc
+        return FastJSONResponse({"symbol": sym, "shape": shape, "bars": shaped(cols, shape)})
     except HTTPException:
         raise
     except ValueError as exc:
@@ -864,6 +1149,7 @@ def ohlc(symbol: str, days: int = 90):
 
 
 @app.get("/api/lessons")
+@http_cache("static", store=True)
 def lessons():
     rows = list_lessons()
     tutor = list_tutor_summary()
@@ -871,6 +1157,7 @@ def lessons():
 
 
 @app.get("/api/lessons/{lesson_id}")
+@http_cache("static", store=True)
 def lesson_detail(lesson_id: str):
     lesson = get_lesson(lesson_id)
     if not lesson:
@@ -879,6 +1166,7 @@ def lesson_detail(lesson_id: str):
 
 
 @app.get("/api/learn/tutor")
+@http_cache("static", store=True)
 def learn_tutor():
     return get_tutor()
 
@@ -897,11 +1185,17 @@ def learn_trade_stories(limit: int = 40, include_demo: bool = True):
 
 
 @app.get("/api/backtest/{symbol}")
-async def backtest(symbol: str, start: str, end: str, strategy: str = "sma_crossover"):
+async def backtest(
+    symbol: str,
+    start: str,
+    end: str,
+    strategy: str = "sma_crossover",
+    max_points: int = Query(80, ge=10, le=5000),
+):
     try:
         sym = validate_symbol(symbol)
         return await asyncio.to_thread(
-            run_strategy_backtest, strategy, sym, start, end, 10_000.0
+            run_strategy_backtest, strategy, sym, start, end, 10_000.0, max_points=max_points
         )
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
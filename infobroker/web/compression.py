@@ -0,0 +1,155 @@
+"""Negotiated response compression (zstd / brotli / gzip) for JSON payloads.
+
+Picks the best encoding the client accepts (`Accept-Encoding` q-values;
+ties go to zstd, then brotli, then gzip) among the codecs installed —
+`zstandard` and `Brotli` are optional, gzip is always there. Only complete
+(single-message) bodies above `minimum_size` are compressed; SSE and other
+streamed responses pass through untouched. Large bodies are compressed off
+the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import threading
+from typing import Any, Callable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None  # type: ignore[assignment]
+
+_THREAD_MIN_BYTES = 256 * 1024
+
+# Fast levels: these are per-request, so ratio is traded for latency
+CODECS: dict[str, Callable[[bytes], bytes]] = {}
+if zstandard is not None:
+    _zstd = threading.local()
+
+    def _zstd_compress(data: bytes) -> bytes:
+        c = getattr(_zstd, "c", None)
+        if c is None:
+            c = _zstd.c = zstandard.ZstdCompressor(level=3)
+        return c.compress(data)
+
+    CODECS["zstd"] = _zstd_compress
+if brotli is not None:
+    CODECS["br"] = lambda data: brotli.compress(data, quality=4)
+CODECS["gzip"] = lambda data: gzip.compress(data, compresslevel=5, mtime=0)
+
+_stats_lock = threading.Lock()
+_stats: dict[str, Any] = {"responses": 0, "bytes_in": 0, "bytes_out": 0, "by_encoding": {}}
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Best supported encoding for an `Accept-Encoding` header (None → identity)."""
+    offered: dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for p in params.split(";"):
+            k, _, v = p.strip().partition("=")
+            if k.strip() == "q":
+                try:
+                    q = float(v)
+                except ValueError:
+                    q = 0.0
+        offered[name] = q
+    best, best_q = None, 0.0
+    for name in CODECS:  # server preference order
+        q = offered.get(name, offered.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def compress(encoding: str, data: bytes) -> bytes:
+    return CODECS[encoding](data)
+
+
+def compression_stats() -> dict[str, Any]:
+    with _stats_lock:
+        out = {**_stats, "by_encoding": dict(_stats["by_encoding"])}
+    out["available"] = list(CODECS)
+    out["ratio"] = round(out["bytes_out"] / out["bytes_in"], 3) if out["bytes_in"] else None
+    return out
+
+
+def _count(encoding: str, n_in: int, n_out: int) -> None:
+    with _stats_lock:
+        _stats["responses"] += 1
+        _stats["bytes_in"] += n_in
+        _stats["bytes_out"] += n_out
+        _stats["by_encoding"][encoding] = _stats["by_encoding"].get(encoding, 0) + 1
+
+
+class CompressionMiddleware:
+    """ASGI middleware: compress whole responses with the negotiated codec."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def wrapped(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message  # held until the first body chunk decides
+                return
+            if passthrough or start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or headers.get("content-type", "").startswith("text/event-stream")
+                or len(body) < self.minimum_size
+            ):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+            if len(body) >= _THREAD_MIN_BYTES:
+                data = await asyncio.to_thread(compress, encoding, body)
+            else:
+                data = compress(encoding, body)
+            _count(encoding, len(body), len(data))
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(data))
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = "W/" + etag  # different bytes than the identity body
+            headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            start = None
+            await send({"type": "http.response.body", "body": data, "more_body": False})
+
+        await self.app(scope, receive, wrapped)
+
+
+__all__ = ["CODECS", "CompressionMiddleware", "compress", "compression_stats", "negotiate"]
@@ -0,0 +1,310 @@
+"""Conditional GETs and a small response cache keyed by what a route reads.
+
+A route opts in with `@http_cache(*deps)`; each dependency names a cheap
+version token — `universe` (snapshot version), `watchlist` / `ledger` (file
+stat), `docs` (doc files + `docs_catalog.py`), `strategies` (registry
+contents), `static` (code-only data: a hash of the package source, so every
+worker and restart of the same code agrees) or `clock:N` (N-second time
+bucket). The ETag is a hash of the path, sorted query and those tokens
+(computed off the event loop), so it is known before the handler runs: a matching `If-None-Match` gets a 304 without calling it,
+and `store=True` routes are answered from an in-process LRU of finished
+responses. Nothing is invalidated by hand — a new version is a new ETag.
+
+Compression sits outside this middleware and weakens the ETag of a body it
+re-encodes (`W/"…"`, as nginx does); `If-None-Match` uses weak comparison,
+so both forms revalidate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+MEMORY_ENTRIES = 128
+MAX_ENTRY_BYTES = 512 * 1024
+_ROUTE_CACHE_MAX = 2048
+_DOCS_RECHECK_SEC = 2.0
+
+_ROOT = Path(__file__).resolve().parents[2]
+
+
+class CachePolicy:
+    """Dependencies and headers for one route (set by `http_cache`)."""
+
+    __slots__ = ("deps", "max_age", "store")
+
+    def __init__(self, deps: tuple[str, ...], max_age: int = 0, store: bool = False):
+        self.deps = deps
+        self.max_age = max_age
+        self.store = store
+
+    @property
+    def cache_control(self) -> str:
+        return f"max-age={self.max_age}, must-revalidate" if self.max_age > 0 else "no-cache"
+
+
+def http_cache(*deps: str, max_age: int = 0, store: bool = False) -> Callable[[Callable], Callable]:
+    """Mark a GET endpoint as revalidatable; apply under `@app.get(...)`."""
+    for dep in deps:
+        _dep_name(dep)  # fail at import time on typos
+
+    def mark(fn: Callable) -> Callable:
+        fn.__http_cache__ = CachePolicy(tuple(deps), max_age=max_age, store=store)
+        return fn
+
+    return mark
+
+
+# --- dependency tokens -------------------------------------------------------
+
+
+def _file_token(path: Path) -> str:
+    try:
+        st = path.stat()
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _universe_token() -> str:
+    from infobroker.universe.snapshot import current_snapshot
+
+    return str(current_snapshot().version)
+
+
+def _watchlist_token() -> str:
+    from infobroker.watchlist import WATCHLIST_PATH
+
+    return _file_token(WATCHLIST_PATH)
+
+
+def _ledger_token() -> str:
+    from infobroker.config import get_settings
+
+    return _file_token(get_settings().ledger_path)
+
+
+_docs_state: dict[str, Any] = {"token": "", "at": 0.0}
+
+
+def _docs_token() -> str:
+    # Every doc file plus docs_catalog.py (inline docs ship with the code)
+    now = time.monotonic()
+    if _docs_state["token"] and now - _docs_state["at"] < _DOCS_RECHECK_SEC:
+        return _docs_state["token"]
+    paths = sorted(
+        [*(_ROOT / "docs").glob("*.md"), *_ROOT.glob("*.md"), _ROOT / "LICENSE", _ROOT / "infobroker" / "docs_catalog.py"]
+    )
+    digest = hashlib.blake2b(digest_size=8)
+    for p in paths:
+        digest.update(f"{p.name}={_file_token(p)};".encode())
+    _docs_state["token"] = digest.hexdigest()
+    _docs_state["at"] = now
+    return _docs_state["token"]
+
+
+_code_state: dict[str, str] = {}
+
+
+def _static_token() -> str:
+    # Package version + source contents; read once per process (code doesn't change under it)
+    token = _code_state.get("token")
+    if token is None:
+        from infobroker import __version__
+
+        pkg = _ROOT / "infobroker"
+        digest = hashlib.blake2b(__version__.encode(), digest_size=8)
+        for p in sorted(pkg.rglob("*.py")):
+            digest.update(p.relative_to(pkg).as_posix().encode())
+            digest.update(p.read_bytes())
+        token = _code_state["token"] = digest.hexdigest()
+    return token
+
+
+def _strategies_token() -> str:
+    from infobroker.strategies.catalog import STRATEGIES
+
+    return hashlib.blake2b(repr(sorted(STRATEGIES)).encode(), digest_size=8).hexdigest()
+
+
+DEPENDENCIES: dict[str, Callable[[], str]] = {
+    "universe": _universe_token,
+    "watchlist": _watchlist_token,
+    "ledger": _ledger_token,
+    "docs": _docs_token,
+    "strategies": _strategies_token,
+    "static": _static_token,
+}
+
+
+def _dep_name(dep: str) -> str:
+    name, _, arg = dep.partition(":")
+    if name == "clock":
+        if not arg.isdigit() or int(arg) <= 0:
+            raise ValueError(f"clock dependency needs a bucket in seconds, e.g. clock:5 (got {dep!r})")
+    elif name not in DEPENDENCIES:
+        raise ValueError(f"Unknown http_cache dependency: {dep!r}. Choose from {sorted(DEPENDENCIES)} or clock:N")
+    return name
+
+
+def _token(dep: str) -> str:
+    name, _, arg = dep.partition(":")
+    if name == "clock":
+        return str(int(time.time()) // int(arg))
+    return DEPENDENCIES[name]()
+
+
+def etag_for(scope: Scope, policy: CachePolicy) -> str:
+    """Strong ETag for this request under the current dependency versions."""
+    query = "&".join(sorted(scope.get("query_string", b"").decode("latin-1").split("&")))
+    parts = [scope["path"], query, *(f"{d}={_token(d)}" for d in policy.deps)]
+    return '"' + hashlib.blake2b("\n".join(parts).encode(), digest_size=12).hexdigest() + '"'
+
+
+def _etag_match(if_none_match: str, etag: str) -> Optional[str]:
+    """The client's tag that matches `etag` (weak comparison), else None."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return etag
+        if tag.removeprefix("W/") == etag:
+            return tag  # echo W/ back so a compressed entry keeps its validator
+    return None
+
+
+# --- response store ----------------------------------------------------------
+
+_lock = threading.Lock()
+_store: OrderedDict[str, tuple[list[tuple[bytes, bytes]], bytes]] = OrderedDict()
+_stats: dict[str, int] = {"not_modified": 0, "memory_hits": 0, "misses": 0, "stored": 0, "errors": 0}
+
+
+def _stored(etag: str) -> Optional[tuple[list[tuple[bytes, bytes]], bytes]]:
+    with _lock:
+        hit = _store.get(etag)
+        if hit is not None:
+            _store.move_to_end(etag)
+        return hit
+
+
+def _remember(etag: str, headers: list[tuple[bytes, bytes]], body: bytes) -> None:
+    with _lock:
+        _store[etag] = (headers, body)
+        _store.move_to_end(etag)
+        while len(_store) > MEMORY_ENTRIES:
+            _store.popitem(last=False)
+        _stats["stored"] += 1
+
+
+def _count(key: str) -> None:
+    with _lock:
+        _stats[key] += 1
+
+
+def http_cache_stats() -> dict[str, Any]:
+    with _lock:
+        return {**_stats, "entries": len(_store), "bytes": sum(len(b) for _, b in _store.values())}
+
+
+def clear_http_cache() -> None:
+    with _lock:
+        _store.clear()
+
+
+# --- middleware --------------------------------------------------------------
+
+
+class HTTPCacheMiddleware:
+    """ASGI middleware: ETag / 304 / in-process store for `@http_cache` routes."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._policies: dict[str, Optional[CachePolicy]] = {}
+
+    def _policy(self, scope: Scope) -> Optional[CachePolicy]:
+        path = scope["path"]
+        if path in self._policies:
+            return self._policies[path]
+        policy = None
+        router = getattr(scope.get("app"), "router", None)
+        for route in getattr(router, "routes", ()):
+            match, _ = route.matches(scope)
+            if match is Match.FULL:
+                policy = getattr(getattr(route, "endpoint", None), "__http_cache__", None)
+                break
+        if len(self._policies) >= _ROUTE_CACHE_MAX:
+            self._policies.clear()
+        self._policies[path] = policy
+        return policy
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        policy = self._policy(scope)
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+        try:
+            # Tokens can touch disk (snapshot rebuild after foreign writes, stats): keep them off the loop
+            etag = await asyncio.to_thread(etag_for, scope, policy)
+        except Exception:  # noqa: BLE001 — a broken token source must not break the route
+            _count("errors")
+            await self.app(scope, receive, send)
+            return
+
+        matched = _etag_match(Headers(scope=scope).get("if-none-match", ""), etag)
+        if matched is not None:
+            _count("not_modified")
+            validators = [(b"etag", matched.encode()), (b"cache-control", policy.cache_control.encode())]
+            await send({"type": "http.response.start", "status": 304, "headers": validators})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        if policy.store:
+            hit = _stored(etag)
+            if hit is not None:
+                _count("memory_hits")
+                headers, body = hit
+                await send({"type": "http.response.start", "status": 200, "headers": list(headers)})
+                await send({"type": "http.response.body", "body": body})
+                return
+        _count("misses")
+
+        start: Optional[Message] = None
+
+        async def wrapped(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                if message["status"] == 200:
+                    headers = MutableHeaders(scope=message)
+                    headers["ETag"] = etag
+                    headers["Cache-Control"] = policy.cache_control
+                    start = message
+            elif start is not None and message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                if policy.store and not message.get("more_body", False) and len(body) <= MAX_ENTRY_BYTES:
+                    _remember(etag, list(start["headers"]), body)
+                start = None  # only whole single-message bodies are stored
+            await send(message)
+
+        await self.app(scope, receive, wrapped)
+
+
+__all__ = [
+    "DEPENDENCIES",
+    "CachePolicy",
+    "HTTPCacheMiddleware",
+    "clear_http_cache",
+    "etag_for",
+    "http_cache",
+    "http_cache_stats",
+]
@@ -14,11 +14,15 @@
     liveQuotes: {},
     liveItems: [],
     liveMeta: null,
+    liveParamsKey: "",
     liveFetchId: 0,
     liveSymbol: null,
     liveOhlc: [],
     liveCtrl: null,
     liveEs: null,
+    liveWs: null,
+    liveWsSymbol: null,
+    liveWsFailed: false,
     liveTickTimer: null,
     liveChartTf: "live1m",
     liveMarketFocus: "us",
@@ -48,6 +52,31 @@
     toast._t = setTimeout(() => el.classList.remove("show"), ms);
   }
 
+  // Bars from a payload in either shape: rows [{t,o,…}] or columns {t:[…], o:[…]}
+  function barRows(bars) {
+    if (!bars || Array.isArray(bars)) return bars || [];
+    const keys = Object.keys(bars);
+    const n = (bars.t || []).length;
+    const rows = new Array(n);
+    for (let i = 0; i < n; i++) {
+      const row = {};
+      for (const k of keys) row[k] = bars[k][i];
+      rows[i] = row;
+    }
+    return rows;
+  }
+
+  // `shape=table` payloads ({fields, rows}) back to one object per row
+  function tableRecords(items) {
+    if (!items || Array.isArray(items)) return items || [];
+    const fields = items.fields || [];
+    return (items.rows || []).map((r) => {
+      const row = {};
+      for (let j = 0; j < fields.length; j++) row[fields[j]] = r[j];
+      return row;
+    });
+  }
+
   async function api(path, opts = {}) {
     const attempts = opts.retries ?? (opts.method && opts.method !== "GET" ? 1 : 3);
     let lastErr = null;
@@ -3387,10 +3416,10 @@
     try {
       const pack = await api("/api/charts/pack", {
         method: "POST",
-        body: JSON.stringify({ symbol, start, end }),
+        body: JSON.stringify({ symbol, start, end, shape: "columns" }),
         timeoutMs: 120000,
       });
-      const bars = pack.bars || [];
+      const bars = barRows(pack.bars);
       const s = pack.summary || {};
       state.studioBars = bars;
       $("cs-summary").textContent = `${pack.symbol} · last ${fmtPx(s.last)} · period ${fmtPct(s.change_pct)} · RSI ${s.rsi ?? "—"} · ${s.bars || 0} bars · ${s.data_source || ""}`;
@@ -3478,6 +3507,13 @@
   }
 
   function stopLiveTickStream() {
+    if (state.liveWs && state.liveWsSymbol) {
+      // Keep the socket for the next symbol; just drop this subscription
+      if (state.liveWs.readyState === 1) {
+        state.liveWs.send(JSON.stringify({ op: "unsubscribe", symbols: [state.liveWsSymbol] }));
+      }
+      state.liveWsSymbol = null;
+    }
     if (state.liveEs) {
       try {
         state.liveEs.close();
@@ -3584,6 +3620,11 @@
     stopLiveTickStream();
     if ($("live-stream-status")) $("live-stream-status").textContent = "connecting…";
 
+    if (typeof WebSocket !== "undefined" && !state.liveWsFailed) {
+      subscribeLiveTicks(s);
+      return;
+    }
+
     if (typeof EventSource !== "undefined") {
       const es = new EventSource(`/api/stream/tick/${encodeURIComponent(s)}`);
       state.liveEs = es;
@@ -3621,6 +3662,43 @@
     }, 1000);
   }
 
+  const tickKey = (x) => String(x || "").toUpperCase().replace(/\./g, "-");
+
+  function subscribeLiveTicks(sym) {
+    // One multiplexed tick socket per tab; switching symbols re-subscribes on it
+    let ws = state.liveWs;
+    if (!ws || ws.readyState > 1) {
+      const proto = location.protocol === "https:" ? "wss" : "ws";
+      ws = new WebSocket(`${proto}://${location.host}/api/ws/ticks?indicators=true`);
+      state.liveWs = ws;
+      ws.onmessage = (ev) => {
+        try {
+          const msg = JSON.parse(ev.data);
+          if (msg.type === "tick" && tickKey(msg.symbol) === tickKey(state.liveWsSymbol)) applyLiveTick(msg);
+        } catch {
+          /* ignore bad frame */
+        }
+      };
+      ws.onclose = () => {
+        if (state.liveWs !== ws) return;
+        state.liveWs = null;
+        const pending = state.liveWsSymbol;
+        state.liveWsSymbol = null;
+        if (pending) {
+          // Fall back to SSE / polling for the rest of the session
+          state.liveWsFailed = true;
+          startLiveTickStream(pending);
+        }
+      };
+    }
+    state.liveWsSymbol = sym;
+    const send = () => {
+      if (state.liveWsSymbol === sym) ws.send(JSON.stringify({ op: "subscribe", symbols: [sym] }));
+    };
+    if (ws.readyState === 1) send();
+    else ws.addEventListener("open", send, { once: true });
+  }
+
   async function openLiveChart(sym, row = null) {
     const s = normalizeSymbol(sym);
     if (!s) return;
@@ -3960,6 +4038,7 @@
       const items = sortLiveItemsClient(data.items || [], $("live-sort")?.value || sortKey);
       state.liveItems = items;
       state.liveMeta = { ...data, markets: data.markets };
+      state.liveParamsKey = ""; // next US board load starts from a full copy
       if ($("live-stats")) $("live-stats").textContent = items.length.toLocaleString();
       const breadth = data.breadth || {};
       if ($("live-up")) $("live-up").textContent = String(breadth.up ?? "—");
@@ -4144,13 +4223,27 @@
         sort: sortKey,
         asset_class: $("live-class")?.value || "",
         exchange: $("live-exchange")?.value || "",
+        shape: "table",
       });
+      const paramsKey = params.toString();
+      // Background refreshes of the full board only pull rows changed since our copy
+      if (opts.quiet && fullUniverse && state.liveParamsKey === paramsKey && state.liveMeta?.version != null) {
+        params.set("since", String(state.liveMeta.version));
+      }
       const data = await api(`/api/live?${params}`, { timeoutMs: 120000 });
       if (fetchId !== state.liveFetchId) return; // stale response — a newer load won
 
-      const items = sortLiveItemsClient(data.items || [], $("live-sort")?.value || sortKey);
+      let rows = tableRecords(data.items);
+      if (data.delta) {
+        const bySymbol = new Map((state.liveItems || []).map((r) => [r.symbol, r]));
+        rows.forEach((r) => bySymbol.set(r.symbol, r));
+        (data.removed || []).forEach((sym) => bySymbol.delete(sym));
+        rows = [...bySymbol.values()];
+      }
+      const items = sortLiveItemsClient(rows, $("live-sort")?.value || sortKey);
       state.liveItems = items;
-      state.liveMeta = data;
+      state.liveMeta = { ...data, items };
+      state.liveParamsKey = paramsKey;
 
       const cov = data.coverage || {};
       const quoted = cov.quoted ?? data.quoted_universe ?? items.length;
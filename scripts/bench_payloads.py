@@ -0,0 +1,130 @@
+"""Benchmark indicator payload building (chart pack, analyze, scanner, snapshot).
+
+    python scripts/bench_payloads.py            # enrichment-plan builders
+    python scripts/bench_payloads.py --legacy   # also time the old enrich → iterrows path + check parity
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from infobroker.data.chartpack import _chart_pack  # noqa: E402
+from infobroker.data.indicators import (  # noqa: E402
+    atr_series,
+    bollinger_bands,
+    calculate_macd,
+    ema,
+    latest_snapshot,
+    macd_series,
+    rsi_series,
+    sma,
+)
+from infobroker.strategies.scanner import _scan_one  # noqa: E402
+
+from bench_signals import synthetic  # noqa: E402
+
+
+def legacy_enrich(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.copy().rename(columns={c: str(c).title() for c in df.columns})
+    close = out["Close"].astype(float)
+    out["SMA_20"] = sma(close, 20)
+    out["SMA_50"] = sma(close, 50)
+    if len(close) >= 200:
+        out["SMA_200"] = sma(close, 200)
+    out["EMA_12"] = ema(close, 12)
+    out["EMA_26"] = ema(close, 26)
+    out["RSI_14"] = rsi_series(close, 14)
+    macd = macd_series(close)
+    out["MACD"], out["MACD_signal"], out["MACD_hist"] = macd["macd_line"], macd["signal_line"], macd["histogram"]
+    out["ATR_14"] = atr_series(out, 14)
+    bb = bollinger_bands(close, 20, 2.0)
+    out["BB_upper"], out["BB_mid"], out["BB_lower"] = bb["bb_upper"], bb["bb_mid"], bb["bb_lower"]
+    return out
+
+
+def _f(v: Any) -> float | None:
+    if v is None or (isinstance(v, float) and pd.isna(v)):
+        return None
+    return round(float(v), 4)
+
+
+def legacy_chart_pack(df_in: pd.DataFrame) -> dict[str, Any]:
+    df = legacy_enrich(df_in)
+    bars = []
+    for ts, row in df.iterrows():
+        bars.append(
+            {
+                "t": ts.isoformat(),
+                "o": float(row["Open"]),
+                "h": float(row["High"]),
+                "l": float(row["Low"]),
+                "c": float(row["Close"]),
+                "v": float(row["Volume"]),
+                "sma20": _f(row["SMA_20"]),
+                "sma50": _f(row["SMA_50"]),
+                "sma200": _f(row["SMA_200"] if "SMA_200" in df.columns else None),
+                "rsi": _f(row["RSI_14"]),
+                "macd": _f(row["MACD"]),
+                "macd_signal": _f(row["MACD_signal"]),
+                "macd_hist": _f(row["MACD_hist"]),
+                "atr": _f(row["ATR_14"]),
+                "bb_upper": _f(row["BB_upper"]),
+                "bb_lower": _f(row["BB_lower"]),
+            }
+        )
+    # Old snapshot re-enriched the enriched frame; MACD ran a third time
+    legacy_enrich(df)
+    return {"bars": bars, "macd": calculate_macd(df["Close"])}
+
+
+def legacy_scan_inputs(df: pd.DataFrame) -> tuple[Any, ...]:
+    close = df["Close"].astype(float).dropna()
+    rsi = rsi_series(close, 14).dropna()
+    return rsi.iloc[-1], calculate_macd(close), sma(close, 50).iloc[-1], sma(close, 200).iloc[-1]
+
+
+def timed(fn: Callable[[], Any], reps: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - t0) / reps * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--legacy", action="store_true")
+    ap.add_argument("--reps", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"{'bars':>6} {'payload':<12} {'plan ms':>9}" + (f" {'legacy ms':>10} {'speedup':>8}" if args.legacy else ""))
+    for n in (252, 1260, 5040):
+        df = synthetic(n, "B")
+        cases: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+            ("chart_pack", lambda: _chart_pack("X", "a", "b", df), lambda: legacy_chart_pack(df)),
+            ("snapshot", lambda: latest_snapshot(df), lambda: legacy_enrich(legacy_enrich(df))),
+            ("scan_one", lambda: _scan_one("X", df), lambda: legacy_scan_inputs(df)),
+        ]
+        for name, new, old in cases:
+            line = f"{n:>6} {name:<12} {timed(new, args.reps):>9.2f}"
+            if args.legacy:
+                t_old = timed(old, args.reps)
+                line += f" {t_old:>10.2f} {t_old / timed(new, args.reps):>7.1f}x"
+            print(line)
+        if args.legacy:
+            got, want = _chart_pack("X", "a", "b", df), legacy_chart_pack(df)
+            same = got["bars"] == want["bars"] and got["summary"]["macd"] == want["macd"]
+            print(f"{'':>6} parity {'OK' if same else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Benchmark catalog signal functions (and the backtest core) on synthetic bars.
+
+    python scripts/bench_signals.py            # vectorized only
+    python scripts/bench_signals.py --legacy   # also time the old per-bar loops + check parity
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from infobroker.data.indicators import rsi_series, sma  # noqa: E402
+from infobroker.strategies.backtest import simulate  # noqa: E402
+from infobroker.strategies.catalog import STRATEGIES  # noqa: E402
+
+# Legacy per-bar breakout recomputes SMA20 over the whole series each bar (O(n²))
+LEGACY_QUADRATIC_MAX_BARS = 20_000
+
+
+def synthetic(n: int, freq: str, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0002, 0.012, n)))
+    spread = np.abs(rng.normal(0, 0.004, n))
+    idx = pd.date_range("2015-01-02 09:30", periods=n, freq=freq)
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * (1 + spread),
+            "Low": close * (1 - spread),
+            "Close": close,
+            "Volume": rng.integers(1_000, 100_000, n).astype(float),
+        },
+        index=idx,
+    )
+
+
+def legacy_rsi_mean_reversion(df: pd.DataFrame, period: int = 14, low: float = 30, high: float = 70) -> pd.Series:
+    rsi = rsi_series(df["Close"], period)
+    pos = pd.Series(0, index=df.index, dtype=int)
+    long = False
+    for i in range(len(df)):
+        v = rsi.iloc[i]
+        if pd.isna(v):
+            pos.iloc[i] = int(long)
+            continue
+        if not long and v <= low:
+            long = True
+        elif long and v >= high:
+            long = False
+        pos.iloc[i] = int(long)
+    return pos
+
+
+def legacy_breakout_20d(df: pd.DataFrame) -> pd.Series:
+    high = df["High"].astype(float)
+    close = df["Close"].astype(float)
+    prior_high = high.rolling(20).max().shift(1)
+    pos = pd.Series(0, index=df.index, dtype=int)
+    long = False
+    for i in range(len(df)):
+        ph = prior_high.iloc[i]
+        c = close.iloc[i]
+        if pd.isna(ph):
+            pos.iloc[i] = 0
+            continue
+        if not long and c > ph:
+            long = True
+        elif long and c < sma(close, 20).iloc[i]:
+            long = False
+        pos.iloc[i] = int(long)
+    return pos
+
+
+LEGACY: dict[str, Callable[[pd.DataFrame], pd.Series]] = {
+    "rsi_mean_reversion": legacy_rsi_mean_reversion,
+    "breakout_20d": legacy_breakout_20d,
+}
+
+
+def timed(fn: Callable[[], object], repeat: int = 3) -> tuple[float, object]:
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, out
+
+
+def run(label: str, df: pd.DataFrame, legacy: bool) -> None:
+    print(f"\n{label}: {len(df):,} bars")
+    print(f"  {'strategy':<20} {'signal ms':>10} {'backtest ms':>12} {'legacy ms':>10}  parity")
+    close = df["Close"].to_numpy()
+    for sid, meta in STRATEGIES.items():
+        fn = meta["factory"]()
+        sig_ms, sig = timed(lambda: fn(df))
+        bt_ms, _ = timed(lambda: simulate(close, sig.to_numpy(dtype=float)))
+        old_ms, parity = "-", ""
+        ref = LEGACY.get(sid)
+        if legacy and ref is not None:
+            if sid == "breakout_20d" and len(df) > LEGACY_QUADRATIC_MAX_BARS:
+                old_ms, parity = "skipped", "(O(n²))"
+            else:
+                ms, old = timed(lambda: ref(df), repeat=1)
+                old_ms = f"{ms:.1f}"
+                parity = "ok" if old.equals(sig) else "MISMATCH"
+        print(f"  {sid:<20} {sig_ms:>10.2f} {bt_ms:>12.2f} {old_ms:>10}  {parity}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--legacy", action="store_true", help="time the old per-bar loops too")
+    args = ap.parse_args()
+    run("10y daily", synthetic(252 * 10, "B"), args.legacy)
+    run("1y 1-minute", synthetic(390 * 252, "min"), args.legacy)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""Benchmark board wire formats: encode time and bytes, raw and compressed.
+
+    python scripts/bench_wire.py              # 10k-row live board
+    python scripts/bench_wire.py --rows 20000
+
+Rows follow the universe board shape (`quoted_row`, 12-point sparklines).
+"fastapi" is the default path (`jsonable_encoder` + stdlib `json.dumps`);
+the others go through `infobroker.data.serialize.dumps` in each items shape.
+Compression uses whichever codecs `infobroker.web.compression` has installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from infobroker.data.serialize import dumps, orjson, shape_items  # noqa: E402
+from infobroker.universe.snapshot import quoted_row  # noqa: E402
+from infobroker.web.compression import CODECS  # noqa: E402
+
+_EXCHANGES = ["NASDAQ", "NYSE", "NYSE Arca", "NYSE American", "Cboe BZX"]
+
+
+def synthetic_board(n: int, seed: int = 7) -> dict[str, Any]:
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        price = round(rng.uniform(1, 900), 2)
+        meta = {
+            "name": f"Synthetic Holdings {i} Inc.",
+            "exchange": rng.choice(_EXCHANGES),
+            "etf": i % 9 == 0,
+            "asset_class": "etf" if i % 9 == 0 else "stock",
+            "quote": {
+                "price": price,
+                "change_abs_day": round(rng.uniform(-5, 5), 4),
+                "change_pct_day": round(rng.uniform(-8, 8), 2),
+                "change_pct_week": round(rng.uniform(-15, 15), 2),
+                "volume": float(rng.randint(1_000, 50_000_000)),
+                "rel_volume": round(rng.uniform(0.2, 4), 2),
+                "high": round(price * 1.02, 4),
+                "low": round(price * 0.98, 4),
+                "sparkline": [round(price * (1 + rng.uniform(-0.03, 0.03)), 2) for _ in range(12)],
+                "as_of": "2026-10-16T19:59:58.123456+00:00",
+                "source": "yahoo_bulk",
+            },
+        }
+        items.append(quoted_row(f"S{i:05d}", meta))
+    return {"as_of": "2026-10-16T20:00:00+00:00", "mode": "universe", "items": items, "count": n, "version": 1}
+
+
+def fastapi_default(payload: dict[str, Any]) -> bytes:
+    return json.dumps(jsonable_encoder(payload), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def timed(fn: Callable[[], Any], reps: int) -> tuple[float, Any]:
+    out = fn()
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - t0) / reps * 1000, out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=10_000)
+    ap.add_argument("--reps", type=int, default=5)
+    args = ap.parse_args()
+
+    board = synthetic_board(args.rows)
+    encoders: list[tuple[str, Callable[[], bytes]]] = [
+        ("fastapi rows", lambda: fastapi_default(board)),
+        ("dumps rows", lambda: dumps(shape_items(board, "rows"))),
+        ("dumps columns", lambda: dumps(shape_items(board, "columns"))),
+        ("dumps table", lambda: dumps(shape_items(board, "table"))),
+    ]
+    print(f"{args.rows:,} rows · encoder {'orjson' if orjson is not None else 'stdlib json'} · codecs {', '.join(CODECS)}")
+    head = f"{'format':<15} {'encode ms':>10} {'bytes':>11}"
+    for name in CODECS:
+        head += f" {name + ' bytes':>12} {name + ' ms':>9}"
+    print(head)
+    for label, fn in encoders:
+        ms, body = timed(fn, args.reps)
+        line = f"{label:<15} {ms:>10.1f} {len(body):>11,}"
+        for codec in CODECS.values():
+            cms, packed = timed(lambda: codec(body), args.reps)
+            line += f" {len(packed):>12,} {cms:>9.1f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Parity check: vectorized backtest engine (`simulate`) vs the reference bar loop.
+
+Runs every catalog strategy — defaults plus random valid parameter sets — and
+random raw position signals (including values other than 0/1) through
+`backtest_frame` with `engine="vector"` and `engine="loop"` on random-walk
+bars, and compares trades, total return, max drawdown and the equity curve.
+Exits non-zero on a mismatch.
+
+    python scripts/check_backtest.py [--bars 2500] [--trials 20] [--seed 7]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from infobroker.strategies.backtest import backtest_frame  # noqa: E402
+from infobroker.strategies.catalog import STRATEGIES  # noqa: E402
+
+TOL = 1e-9
+
+
+def _bars(n: int, rng: np.random.Generator) -> pd.DataFrame:
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0002, 0.015, n)))
+    close[n // 3 : n // 3 + 30] = close[n // 3]  # flat stretch
+    spread = np.abs(rng.normal(0, 0.005, n))
+    idx = pd.date_range("2010-01-04", periods=n, freq="B")
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * (1 + spread),
+            "Low": close * (1 - spread),
+            "Close": close,
+            "Volume": rng.integers(1_000, 100_000, n).astype(float),
+        },
+        index=idx,
+    )
+
+
+def _random_params(meta: dict[str, Any], rng: np.random.Generator) -> dict[str, Any]:
+    spec = meta.get("params") or {}
+    valid = meta.get("valid") or (lambda p: True)
+    for _ in range(100):
+        p = {k: int(rng.choice(np.arange(s["min"], s["max"] + 1, s["step"]))) for k, s in spec.items()}
+        if valid(p):
+            return p
+    return {k: s["default"] for k, s in spec.items()}
+
+
+def _mismatch(df: pd.DataFrame, signal_fn, cash: float) -> str:
+    """Empty when both engines agree, else a short description."""
+    vec = backtest_frame(df, "X", "", "", signal_fn=signal_fn, starting_cash=cash, engine="vector")
+    ref = backtest_frame(df, "X", "", "", signal_fn=signal_fn, starting_cash=cash, engine="loop")
+    if vec.trades != ref.trades:
+        return f"trades {vec.trades} vs {ref.trades}"
+    if vec.total_return_pct != ref.total_return_pct:
+        return f"return {vec.total_return_pct} vs {ref.total_return_pct}"
+    if vec.max_drawdown_pct != ref.max_drawdown_pct:
+        return f"drawdown {vec.max_drawdown_pct} vs {ref.max_drawdown_pct}"
+    got, want = vec.equity_curve.to_numpy(), ref.equity_curve.to_numpy()
+    err = float(np.max(np.abs(got - want) / np.maximum(1.0, np.abs(want)))) if want.size else 0.0
+    if got.shape != want.shape or err > TOL:
+        return f"equity max rel err {err:.2e}"
+    return ""
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--bars", type=int, default=2500)
+    ap.add_argument("--trials", type=int, default=20, help="random parameter sets / signals per case")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    rng = np.random.default_rng(args.seed)
+    ok = True
+
+    for sid, meta in STRATEGIES.items():
+        runs = [{k: s["default"] for k, s in (meta.get("params") or {}).items()}]
+        if meta.get("params"):
+            runs += [_random_params(meta, rng) for _ in range(args.trials)]
+        failed = []
+        for params in runs:
+            df = _bars(args.bars, rng)
+            why = _mismatch(df, meta["factory"](**params), 10_000.0)
+            if why:
+                failed.append(f"{params}: {why}")
+        ok &= not failed
+        print(f"{'ok ' if not failed else 'FAIL'} {sid:<20} {len(runs)} run(s)")
+        for line in failed[:5]:
+            print(f"       {line}")
+
+    # Raw signals: sticky 0/1 runs with stray -1 / 2 values, which both engines must ignore
+    failed = []
+    for _ in range(args.trials):
+        df = _bars(args.bars, rng)
+        flips = rng.random(len(df)) < 0.05
+        sig = np.cumsum(flips) % 2
+        odd = rng.random(len(df)) < 0.02
+        sig = np.where(odd, rng.choice([-1, 2], len(df)), sig)
+        for cash in (10_000.0, 1_234.5):
+            why = _mismatch(df, lambda d, s=sig: pd.Series(s, index=d.index), cash)
+            if why:
+                failed.append(f"cash={cash:g}: {why}")
+    ok &= not failed
+    print(f"{'ok ' if not failed else 'FAIL'} {'raw signals':<20} {args.trials * 2} run(s)")
+    for line in failed[:5]:
+        print(f"       {line}")
+
+    print("parity OK" if ok else "parity FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
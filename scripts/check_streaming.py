@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Parity check: streaming indicators (`infobroker.data.streaming`) vs TA-Lib.
+
+Feeds random-walk OHLC bars one at a time through each incremental indicator
+and compares every output (committed bars and per-tick previews) with the
+TA-Lib array call over the same bars. Exits non-zero on a mismatch.
+
+    python scripts/check_streaming.py [--bars 5000] [--seed 7]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import talib
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from infobroker.data.streaming import (  # noqa: E402
+    IndicatorSet,
+    StreamingATR,
+    StreamingBollinger,
+    StreamingEMA,
+    StreamingMACD,
+    StreamingRSI,
+    StreamingSMA,
+)
+
+TOL = 1e-9
+
+
+def _bars(n: int, seed: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    close[n // 3 : n // 3 + 40] = close[n // 3]  # flat stretch: zero RSI moves / zero stddev
+    spread = np.abs(rng.normal(0, 0.006, n)) * close
+    return close + spread, close - spread, close
+
+
+def _compare(name: str, got: list[float], want: np.ndarray) -> bool:
+    got_a = np.asarray(got, dtype=np.float64)
+    same_nan = np.array_equal(np.isnan(got_a), np.isnan(want))
+    both = ~np.isnan(want)
+    err = float(np.max(np.abs(got_a[both] - want[both]) / np.maximum(1.0, np.abs(want[both])))) if both.any() else 0.0
+    ok = same_nan and err <= TOL
+    print(f"{'ok ' if ok else 'FAIL'} {name:<22} max rel err {err:.2e}{'' if same_nan else '  (warm-up mismatch)'}")
+    return ok
+
+
+def _run(ind, step, arrays) -> tuple[list, list]:
+    """Committed outputs, and previews taken before each commit (a tick at the close)."""
+    committed, previewed = [], []
+    for row in zip(*arrays):
+        previewed.append(ind.preview(*row))
+        committed.append(step(*row))
+    return committed, previewed
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--bars", type=int, default=5000)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    high, low, close = _bars(args.bars, args.seed)
+    ok = True
+
+    cases = [
+        ("SMA(20)", StreamingSMA(20), (close,), talib.SMA(close, 20)),
+        ("SMA(1)", StreamingSMA(1), (close,), talib.SMA(close, 1)),
+        ("EMA(12)", StreamingEMA(12), (close,), talib.EMA(close, 12)),
+        ("EMA(26)", StreamingEMA(26), (close,), talib.EMA(close, 26)),
+        ("RSI(14)", StreamingRSI(14), (close,), talib.RSI(close, 14)),
+        ("RSI(2)", StreamingRSI(2), (close,), talib.RSI(close, 2)),
+        ("ATR(14)", StreamingATR(14), (high, low, close), talib.ATR(high, low, close, 14)),
+    ]
+    for name, ind, arrays, want in cases:
+        got, prev = _run(ind, ind.update, arrays)
+        ok &= _compare(name, got, want)
+        ok &= _compare(name + " preview", prev, want)
+
+    line, sig, hist = talib.MACD(close, 12, 26, 9)
+    m = StreamingMACD()
+    got, prev = _run(m, m.update, (close,))
+    for j, (label, want) in enumerate((("MACD line", line), ("MACD signal", sig), ("MACD hist", hist))):
+        ok &= _compare(label, [g[j] for g in got], want)
+        ok &= _compare(label + " preview", [p[j] for p in prev], want)
+
+    for nbdev in (2.0, 1.0):
+        upper, mid, lower = talib.BBANDS(close, 20, nbdev, nbdev, 0)
+        b = StreamingBollinger(20, nbdev)
+        got, prev = _run(b, b.update, (close,))
+        for j, (label, want) in enumerate((("upper", upper), ("mid", mid), ("lower", lower))):
+            ok &= _compare(f"BB({nbdev:g}) {label}", [g[j] for g in got], want)
+            ok &= _compare(f"BB({nbdev:g}) {label} preview", [p[j] for p in prev], want)
+
+    s = IndicatorSet()
+    t0 = time.perf_counter()
+    for h, l, c in zip(high.tolist(), low.tolist(), close.tolist()):
+        s.update(h, l, c)
+    per_bar = (time.perf_counter() - t0) / args.bars * 1e6
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        s.preview(high[-1], low[-1], close[-1] * 1.001)
+    per_tick = (time.perf_counter() - t0) / 1000 * 1e6
+    print(f"IndicatorSet: {per_bar:.1f} µs/bar update, {per_tick:.1f} µs/tick preview")
+    print("parity OK" if ok else "parity FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())